@@ -100,7 +100,8 @@ __classifiers__ = [
     "Topic :: Text Processing :: Linguistic",
 ]
 
-from nltk.internals import config_java
+from importlib import import_module as _import_module
+from importlib.util import find_spec as _find_spec
 
 # support numpy from pypy
 try:
@@ -125,35 +126,203 @@ if not hasattr(subprocess, "Popen"):
     subprocess.Popen = _fake_Popen
 
 ###########################################################
-# TOP-LEVEL MODULES
+# TOP-LEVEL MODULES AND PACKAGES
 ###########################################################
 
-# Import top-level functionality into top-level namespace
-
-from nltk.collocations import *
-from nltk.decorators import decorator, memoize
-from nltk.featstruct import *
-from nltk.grammar import *
-from nltk.probability import *
-from nltk.text import *
-from nltk.util import *
-from nltk.jsontags import *
-
-###########################################################
-# PACKAGES
-###########################################################
-
-from nltk.chunk import *
-from nltk.classify import *
-from nltk.inference import *
-from nltk.metrics import *
-from nltk.parse import *
-from nltk.tag import *
-from nltk.tokenize import *
-from nltk.translate import *
-from nltk.tree import *
-from nltk.sem import *
-from nltk.stem import *
+# The top-level namespace has the public names of these modules and
+# packages, as if they were imported with ``from nltk.<module> import *``
+# (in this order, so that later names override earlier ones).  They are
+# only imported when a name is first used, so that e.g. word_tokenize
+# does not import the parsers and classifiers, and their dependencies.
+# test_lazy_imports.py checks the names against the modules.
+#
+# The table is the namespace that ``import nltk`` had when it imported
+# all of these modules at once, and is not generated from them: a name
+# that a module exports later is only in ``nltk.*`` once it is added
+# here, which should be a deliberate change of the top-level API;
+# test_lazy_imports.py fails until the name is either added here or to
+# its NOT_IN_NLTK set.
+
+_LAZY_IMPORTS = {
+    "nltk.collocations": """
+        BigramCollocationFinder QuadgramCollocationFinder
+        TrigramCollocationFinder
+    """,
+    "nltk.decorators": """
+        decorator memoize
+    """,
+    "nltk.featstruct": """
+        FeatDict FeatList FeatStruct FeatStructReader Feature RangeFeature
+        SLASH SlashFeature TYPE conflicts subsumes unify
+    """,
+    "nltk.grammar": """
+        CFG DependencyGrammar DependencyProduction Nonterminal PCFG
+        ProbabilisticDependencyGrammar ProbabilisticProduction Production
+        induce_pcfg nonterminals read_grammar
+    """,
+    "nltk.probability": """
+        ConditionalFreqDist ConditionalProbDist ConditionalProbDistI
+        CrossValidationProbDist DictionaryConditionalProbDist
+        DictionaryProbDist ELEProbDist FreqDist HeldoutProbDist
+        ImmutableProbabilisticMixIn KneserNeyProbDist LaplaceProbDist
+        LidstoneProbDist MLEProbDist MutableProbDist ProbDistI
+        ProbabilisticMixIn SimpleGoodTuringProbDist UniformProbDist
+        WittenBellProbDist add_logs entropy sum_logs
+    """,
+    "nltk.text": """
+        ConcordanceIndex ContextIndex Text TextCollection TokenSearcher
+    """,
+    "nltk.util": """
+        AbstractLazySequence Counter HTTPPasswordMgrWithDefaultRealm Index
+        LazyConcatenation LazyEnumerate LazyIteratorList LazyMap
+        LazySubsequence LazyZip OrderedDict ProxyBasicAuthHandler
+        ProxyDigestAuthHandler ProxyHandler Trie acyclic_branches_depth_first
+        acyclic_breadth_first acyclic_depth_first acyclic_dic2tree bigrams
+        binary_search_file bisect breadth_first build_opener chain choose
+        clean_html clean_url combinations defaultdict deprecated deque
+        edge_closure edges2dot elementtree_indent everygrams filestring flatten
+        getproxies guess_encoding in_idle inspect install_opener invert_dict
+        invert_graph islice locale ngrams os pad_sequence pairwise
+        parallelize_preprocess pprint pr print_string pydoc
+        raise_unorderable_types re_show set_proxy skipgrams slice_bounds tee
+        textwrap tokenwrap total_ordering transitive_closure trigrams
+        unique_list unweighted_minimum_spanning_dict
+        unweighted_minimum_spanning_digraph unweighted_minimum_spanning_tree
+        usage warnings
+    """,
+    "nltk.jsontags": """
+        JSONTaggedDecoder JSONTaggedEncoder json_tags register_tag
+    """,
+    "nltk.chunk": """
+        ChunkParserI ChunkScore RegexpChunkParser RegexpParser conllstr2tree
+        conlltags2tree ieerstr2tree ne_chunk ne_chunk_sents tagstr2tree
+        tree2conllstr tree2conlltags
+    """,
+    "nltk.classify": """
+        BinaryMaxentFeatureEncoding ClassifierI
+        ConditionalExponentialClassifier DecisionTreeClassifier
+        MaxentClassifier MultiClassifierI NaiveBayesClassifier
+        PositiveNaiveBayesClassifier RTEFeatureExtractor Senna
+        SklearnClassifier TextCat TypedMaxentFeatureEncoding WekaClassifier
+        apply_features call_megam config_megam config_weka decisiontree maxent
+        megam naivebayes positivenaivebayes rte_classifier rte_classify
+        rte_features scikitlearn tadm textcat weka
+    """,
+    "nltk.inference": """
+        CfgReadingCommand DiscourseTester DrtGlueReadingCommand Mace
+        MaceCommand ParallelProverBuilder ParallelProverBuilderCommand Prover9
+        Prover9Command ReadingCommand ResolutionProver ResolutionProverCommand
+        TableauProver TableauProverCommand discourse mace prover9 resolution
+        tableau
+    """,
+    "nltk.metrics": """
+        AnnotationTask BigramAssocMeasures ConfusionMatrix ContingencyMeasures
+        NgramAssocMeasures Paice QuadgramAssocMeasures TrigramAssocMeasures
+        accuracy agreement align aline approxrand association binary_distance
+        confusionmatrix custom_distance distance edit_distance
+        edit_distance_align f_measure fractional_presence ghd interval_distance
+        jaccard_distance log_likelihood masi_distance paice pk precision
+        presence ranks_from_scores ranks_from_sequence recall scores
+        segmentation spearman spearman_correlation windowdiff
+    """,
+    "nltk.parse": """
+        BllipParser BottomUpChartParser BottomUpLeftCornerChartParser
+        BottomUpProbabilisticChartParser ChartParser CoreNLPDependencyParser
+        CoreNLPParser DependencyEvaluator DependencyGraph EarleyChartParser
+        FeatureBottomUpChartParser FeatureBottomUpLeftCornerChartParser
+        FeatureChartParser FeatureEarleyChartParser
+        FeatureIncrementalBottomUpChartParser
+        FeatureIncrementalBottomUpLeftCornerChartParser
+        FeatureIncrementalChartParser FeatureIncrementalTopDownChartParser
+        FeatureTopDownChartParser IncrementalBottomUpChartParser
+        IncrementalBottomUpLeftCornerChartParser IncrementalChartParser
+        IncrementalLeftCornerChartParser IncrementalTopDownChartParser
+        InsideChartParser LeftCornerChartParser LongestChartParser MaltParser
+        NaiveBayesDependencyScorer NonprojectiveDependencyParser ParserI
+        ProbabilisticNonprojectiveParser
+        ProbabilisticProjectiveDependencyParser ProjectiveDependencyParser
+        RandomChartParser RecursiveDescentParser ShiftReduceParser
+        SteppingChartParser SteppingRecursiveDescentParser
+        SteppingShiftReduceParser TestGrammar TopDownChartParser
+        TransitionParser UnsortedChartParser ViterbiParser bllip chart corenlp
+        dependencygraph earleychart extract_test_sentences featurechart
+        load_parser malt nonprojectivedependencyparser pchart
+        projectivedependencyparser recursivedescent shiftreduce
+        transitionparser viterbi
+    """,
+    "nltk.tag": """
+        AffixTagger BigramTagger BrillTagger BrillTaggerTrainer CRFTagger
+        ClassifierBasedPOSTagger ClassifierBasedTagger ContextTagger
+        DefaultTagger HiddenMarkovModelTagger HiddenMarkovModelTrainer
+        HunposTagger NgramTagger PerceptronTagger RUS_PICKLE RegexpTagger
+        SennaChunkTagger SennaNERTagger SennaTagger SequentialBackoffTagger
+        StanfordNERTagger StanfordPOSTagger StanfordTagger TaggerI TnT
+        TrigramTagger UnigramTagger brill brill_trainer crf find hmm hunpos
+        map_tag mapping perceptron pos_tag pos_tag_sents senna sequential
+        stanford str2tuple tagset_mapping tnt tuple2str untag
+    """,
+    "nltk.tokenize": """
+        BlanklineTokenizer LegalitySyllableTokenizer LineTokenizer MWETokenizer
+        NLTKWordTokenizer PunktSentenceTokenizer RegexpTokenizer ReppTokenizer
+        SExprTokenizer SpaceTokenizer StanfordSegmenter SyllableTokenizer
+        TabTokenizer TextTilingTokenizer ToktokTokenizer
+        TreebankWordDetokenizer TreebankWordTokenizer TweetTokenizer
+        WhitespaceTokenizer WordPunctTokenizer blankline_tokenize casual
+        casual_tokenize destructive legality_principle line_tokenize load mwe
+        punkt re regexp_span_tokenize regexp_tokenize repp sent_tokenize sexpr
+        sexpr_tokenize simple sonority_sequencing stanford_segmenter
+        string_span_tokenize texttiling toktok treebank word_tokenize
+        wordpunct_tokenize
+    """,
+    "nltk.translate": """
+        AlignedSent Alignment IBMModel IBMModel1 IBMModel2 IBMModel3 IBMModel4
+        IBMModel5 PhraseTable StackDecoder alignment_error_rate bleu bleu_score
+        chrf chrf_score extract gale_church gdfa gleu gleu_score
+        grow_diag_final_and ibm1 ibm2 ibm3 ibm4 ibm5 ibm_model meteor
+        meteor_score nist nist_score phrase_based ribes ribes_score
+        stack_decoder trace
+    """,
+    "nltk.tree": """
+        ImmutableMultiParentedTree ImmutableParentedTree
+        ImmutableProbabilisticTree ImmutableTree MultiParentedTree ParentedTree
+        ProbabilisticTree Tree TreePrettyPrinter bracket_parse
+        chomsky_normal_form collapse_unary sinica_parse un_chomsky_normal_form
+    """,
+    "nltk.sem": """
+        ApplicationExpression Assignment Boxer DRS DrtExpression Expression
+        FStructure LogicalExpressionException Model Undefined Valuation
+        Variable arity binding_ops boolean_ops boxer clause drt equality_preds
+        evaluate evaluate_sents extract_rels glue interpret_sents is_rel lfg
+        linearlogic logic parse_sents read_logic read_valuation relextract
+        root_semrep rtuple set2rel skolemize
+    """,
+    "nltk.stem": """
+        ARLSTem ARLSTem2 Cistem ISRIStemmer LancasterStemmer PorterStemmer
+        RSLPStemmer RegexpStemmer SnowballStemmer StemmerI WordNetLemmatizer
+        api arlstem arlstem2 cistem isri lancaster porter regexp rslp snowball
+        wordnet
+    """,
+    "nltk.internals": """
+        config_java
+    """,
+    "nltk.downloader": """
+        download download_gui download_shell
+    """,
+}
+
+_lazy_names = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names.split()
+}
+
+# The top-level modules and packages that are imported on first use
+_LAZY_MODULES = set("""
+    ccg chunk classify collections collocations compat data decorators
+    downloader featstruct grammar help inference internals jsontags lm
+    metrics misc parse probability sem stem tag tbl text tokenize translate
+    tree util wsd
+    """.split())
+if _find_spec("numpy") is not None:
+    _LAZY_MODULES.add("cluster")
 
 # Packages which can be lazily imported
 # (a) we don't import *
@@ -168,42 +337,31 @@ corpus = lazyimport.LazyModule("corpus", locals(), globals())
 draw = lazyimport.LazyModule("draw", locals(), globals())
 toolbox = lazyimport.LazyModule("toolbox", locals(), globals())
 
-# Optional loading
 
-try:
-    import numpy
-except ImportError:
-    pass
-else:
-    from nltk import cluster
+def __getattr__(name):
+    # Import the names of the modules above on first use (PEP 562)
+    if name in _lazy_names:
+        module = _import_module(_lazy_names[name])
+        try:
+            value = getattr(module, name)
+        except AttributeError:
+            # A submodule, that some other package may not have imported yet
+            value = _import_module(f"{module.__name__}.{name}")
+    elif name in _LAZY_MODULES:
+        value = _import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-from nltk.downloader import download, download_shell
 
-try:
-    import tkinter
-except ImportError:
-    pass
-else:
-    try:
-        from nltk.downloader import download_gui
-    except RuntimeError as e:
-        import warnings
-
-        warnings.warn(
-            "Corpus downloader GUI not loaded "
-            "(RuntimeError during import: %s)" % str(e)
-        )
-
-# explicitly import all top-level modules (ensuring
-# they override the same names inadvertently imported
-# from a subpackage)
-
-from nltk import ccg, chunk, classify, collocations
-from nltk import data, featstruct, grammar, help, inference, metrics
-from nltk import misc, parse, probability, sem, stem, wsd
-from nltk import tag, tbl, text, tokenize, translate, tree, util
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | _LAZY_MODULES)
 
 
 # FIXME:  override any accidentally imported demo, see https://github.com/nltk/nltk/issues/2116
 def demo():
     print("To run the demo code for a module, type nltk.module.demo()")
+
+
+__all__ = [name for name in __dir__() if not name.startswith("_")]
@@ -152,6 +152,10 @@ zero-length assertions).
      pattern is valid.
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.chunk" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.chunk.api import ChunkParserI
 from nltk.chunk.regexp import RegexpChunkParser, RegexpParser
 from nltk.chunk.util import (
@@ -80,8 +80,14 @@ Training Classifiers
 Most classifiers are built by training them on a list of hand-labeled
 examples, known as the "training set".  Training sets are represented
 as lists of ``(featuredict, label)`` tuples.
+
+isort:skip_file
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.classify" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.classify.api import ClassifierI, MultiClassifierI
 from nltk.classify.decisiontree import DecisionTreeClassifier
 from nltk.classify.maxent import (
@@ -95,6 +101,10 @@ from nltk.classify.naivebayes import NaiveBayesClassifier
 from nltk.classify.positivenaivebayes import PositiveNaiveBayesClassifier
 from nltk.classify.rte_classify import RTEFeatureExtractor, rte_classifier, rte_features
 from nltk.classify.scikitlearn import SklearnClassifier
+
+# nltk.tag uses the classifiers above, and its taggers subclass Senna,
+# which in turn uses nltk.tag.api: import nltk.tag before Senna.
+import nltk.tag as _tag
 from nltk.classify.senna import Senna
 from nltk.classify.textcat import TextCat
 from nltk.classify.util import accuracy, apply_features, log_likelihood
@@ -34,12 +34,6 @@ best 1000 features:
 from nltk.classify.api import ClassifierI
 from nltk.probability import DictionaryProbDist
 
-try:
-    from sklearn.feature_extraction import DictVectorizer
-    from sklearn.preprocessing import LabelEncoder
-except ImportError:
-    pass
-
 __all__ = ["SklearnClassifier"]
 
 
@@ -62,6 +56,11 @@ class SklearnClassifier(ClassifierI):
             great amount of memory.
         :type sparse: boolean.
         """
+        # Imported here rather than with the module, which nltk.classify
+        # (and so nltk.tag) imports whether or not scikit-learn is used
+        from sklearn.feature_extraction import DictVectorizer
+        from sklearn.preprocessing import LabelEncoder
+
         self._clf = estimator
         self._encoder = LabelEncoder()
         self._vectorizer = DictVectorizer(dtype=dtype, sparse=sparse)
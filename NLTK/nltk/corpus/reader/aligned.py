@@ -12,7 +12,6 @@ from nltk.corpus.reader.util import (
     read_alignedsent_block,
 )
 from nltk.tokenize import RegexpTokenizer, WhitespaceTokenizer
-from nltk.translate import AlignedSent, Alignment
 
 
 class AlignedCorpusReader(CorpusReader):
@@ -136,6 +135,9 @@ class AlignedSentCorpusView(StreamBackedCorpusView):
         StreamBackedCorpusView.__init__(self, corpus_file, encoding=encoding)
 
     def read_block(self, stream):
+        # Not imported at the top: nltk.translate imports nltk.corpus
+        from nltk.translate import AlignedSent, Alignment
+
         block = [
             self._word_tokenizer.tokenize(sent_str)
             for alignedsent_str in self._alignedsent_block_reader(stream)
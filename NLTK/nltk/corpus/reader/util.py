@@ -7,11 +7,18 @@
 # For license information, see LICENSE.TXT
 
 import bisect
+import hashlib
+import json
 import os
 import pickle
 import re
 import tempfile
-from functools import reduce
+import threading
+import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial, reduce
 from xml.etree import ElementTree
 
 from nltk.data import (
@@ -29,6 +36,28 @@ from nltk.util import AbstractLazySequence, LazyConcatenation, LazySubsequence
 ######################################################################
 
 
+class _PerThread:
+    """
+    An attribute of a corpus view that has a value per thread if the view
+    is thread-safe, and defaults to None.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        local = view.__dict__.get("_local")
+        values = view.__dict__ if local is None else local.__dict__
+        return values.get(self.name)
+
+    def __set__(self, view, value):
+        local = view.__dict__.get("_local")
+        values = view.__dict__ if local is None else local.__dict__
+        values[self.name] = value
+
+
 class StreamBackedCorpusView(AbstractLazySequence):
     """
     A 'view' of a corpus file, which acts like a sequence of tokens:
@@ -76,8 +105,45 @@ class StreamBackedCorpusView(AbstractLazySequence):
     map has one entry per block.)
 
     In order to increase efficiency for random access patterns that
-    have high degrees of locality, the corpus view may cache one or
-    more blocks.
+    have high degrees of locality, the corpus view caches the most
+    recently read block, and a least recently used set of other blocks
+    up to a total of ``cache_size`` bytes of the file.  For instance,
+    sampling random sentences from a view, or looking up concordance
+    hits, then only reads and decodes each block once::
+
+        view = StreamBackedCorpusView(fileid, reader, cache_size=2**24)
+
+    A view is not thread-safe unless it is created with
+    ``thread_safe=True``.  Each thread then reads the file with its own
+    stream, and shares the token index and the cache of the view, so one
+    view can serve several worker threads.  ``cache_size`` and
+    ``thread_safe`` default to the class attributes of the same name, so
+    they can also be set for the views created by corpus readers.
+
+    Finding the length of a view, or the block of a token late in the
+    file, requires reading the file up to that point.  A view created
+    with ``offset_index`` saves its toknum/filepos mapping once it has
+    read the whole file, and later views of the same file, for instance
+    in other processes, load it instead: they know their length at once,
+    and seek straight to the block of any token.  With
+    ``offset_index=True`` the index is saved next to the corpus file,
+    and with a directory name it is saved in that directory.  The index
+    is only used while the size of the file and its modification time
+    or SHA-256 hash are unchanged, and while the view is read from the
+    same ``startpos``, with the same encoding, and by a view of the same
+    class and state with the same block reader and the same state of
+    the reader's object (e.g. the tokenizers of a corpus reader).  A
+    view whose state cannot be described the same way in every process,
+    e.g. one that depends on an object without a ``__dict__`` or a
+    useful ``repr``, uses no offset index.  It is only available for
+    files on the file system (not in zip files), and a failure to save
+    it is ignored.
+
+    ``partition(n)`` splits a view into ``n`` disjoint views of about
+    the same number of bytes of the file, cut at block boundaries, which
+    can be sent to worker processes: each of them only reads its own
+    byte range of the file.  ``map_shards()`` maps a function over the
+    shards of a view in a process pool.
 
     :note: Each ``CorpusView`` object internally maintains an open file
         object for its underlying corpus file.  This file should be
@@ -109,7 +175,8 @@ class StreamBackedCorpusView(AbstractLazySequence):
         file position of the first character in block ``i``.  Together
         with ``_toknum``, this forms a partial mapping between token
         indices and file positions.
-    :ivar _stream: The stream used to access the underlying corpus file.
+    :ivar _stream: The stream used to access the underlying corpus file
+        (by the current thread, if the view is thread-safe).
     :ivar _len: The total number of tokens in the corpus, if known;
         or None, if the number of tokens is not yet known.
     :ivar _eofpos: The character position of the last character in the
@@ -120,9 +187,38 @@ class StreamBackedCorpusView(AbstractLazySequence):
        start_toknum is the token index of the first token in the block;
        end_toknum is the token index of the first token not in the
        block; and tokens is a list of the tokens in the block.
+    :ivar _blocks: The least recently used cache of non-empty blocks,
+       which maps the start_toknum of a block to a tuple (end_toknum,
+       tokens, end_filepos, size), where end_filepos is the file
+       position after the block, and size is its length in the file.
     """
 
-    def __init__(self, fileid, block_reader=None, startpos=0, encoding="utf8"):
+    cache_size = 0
+    """The default number of bytes of the file whose blocks are cached,
+       besides the most recently read block."""
+
+    thread_safe = False
+    """Whether views are thread-safe by default."""
+
+    offset_index = False
+    """Where views save the index of their block offsets by default:
+       True for next to the corpus file, a directory name, or False."""
+
+    _stream = _PerThread()
+    _current_toknum = _PerThread()
+    _current_blocknum = _PerThread()
+
+    def __init__(
+        self,
+        fileid,
+        block_reader=None,
+        startpos=0,
+        encoding="utf8",
+        *,
+        cache_size=None,
+        thread_safe=None,
+        offset_index=None,
+    ):
         """
         Create a new corpus view, based on the file ``fileid``, and
         read with ``block_reader``.  See the class documentation
@@ -140,9 +236,31 @@ class StreamBackedCorpusView(AbstractLazySequence):
             read the file's contents.  If no encoding is specified,
             then the file's contents will be read as a non-unicode
             string (i.e., a str).
+
+        :param cache_size: The number of bytes of the file whose blocks
+            are kept in memory, besides the most recently read block;
+            ``StreamBackedCorpusView.cache_size`` if None.
+
+        :param thread_safe: Whether several threads may read from the
+            view at the same time; ``StreamBackedCorpusView.thread_safe``
+            if None.
+
+        :param offset_index: Where to save the index of the block offsets
+            in the file: True for next to the file, the name of a
+            directory, or False for no index;
+            ``StreamBackedCorpusView.offset_index`` if None.
         """
         if block_reader:
             self.read_block = block_reader
+        if thread_safe is None:
+            thread_safe = self.thread_safe
+        if thread_safe:
+            self._local = threading.local()
+            self._lock = threading.RLock()
+            # The streams opened by all threads, for close()
+            self._streams = set()
+        else:
+            self._lock = nullcontext()
         # Initialize our toknum/filepos mapping.
         self._toknum = [0]
         self._filepos = [startpos]
@@ -176,9 +294,18 @@ class StreamBackedCorpusView(AbstractLazySequence):
         except Exception as exc:
             raise ValueError(f"Unable to open or access {fileid!r} -- {exc}") from exc
 
-        # Maintain a cache of the most recently read block, to
-        # increase efficiency of random access.
+        # Maintain a cache of the most recently read block, and of
+        # other blocks up to cache_size bytes, to increase efficiency of
+        # random access.
         self._cache = (-1, -1, None)
+        self._blocks = OrderedDict()
+        self._cache_size = self.cache_size if cache_size is None else cache_size
+        self._cached_bytes = 0
+
+        if offset_index is None:
+            offset_index = self.offset_index
+        self._offset_index = self._index_location(offset_index)
+        self._index_pending = self._offset_index is not None
 
     fileid = property(
         lambda self: self._fileid,
@@ -213,6 +340,9 @@ class StreamBackedCorpusView(AbstractLazySequence):
             )
         else:
             self._stream = open(self._fileid, "rb")
+        if "_local" in self.__dict__:
+            with self._lock:
+                self._streams.add(self._stream)
 
     def close(self):
         """
@@ -222,11 +352,142 @@ class StreamBackedCorpusView(AbstractLazySequence):
         upon garbage collection of the corpus view).  If the corpus
         view is accessed after it is closed, it will be automatically
         re-opened.
+
+        The streams of all threads are closed, so a thread-safe view
+        should only be closed once no thread is reading from it.
         """
+        if "_local" in self.__dict__:
+            with self._lock:
+                streams, self._streams = self._streams, set()
+            for stream in streams:
+                stream.close()
+        self._close_stream()
+
+    def _close_stream(self):
+        """Close the stream of the current thread."""
         if self._stream is not None:
             self._stream.close()
+            if "_local" in self.__dict__:
+                with self._lock:
+                    self._streams.discard(self._stream)
         self._stream = None
 
+    def _index_location(self, offset_index):
+        """
+        Return the path of the corpus file and where its offset index is
+        saved, or None if the view has no offset index.
+        """
+        if not offset_index:
+            return None
+        if isinstance(self._fileid, FileSystemPathPointer):
+            path = self._fileid.path
+        elif isinstance(self._fileid, PathPointer):
+            return None
+        else:
+            path = self._fileid
+        return os.path.abspath(path), offset_index
+
+    def _index_key(self):
+        """
+        Return the key of the offset index: a digest of the class of the
+        view, its block reader, the state of both, the start position and
+        the encoding, i.e. of everything that decides where the blocks
+        of the file end.  Return None if the view or its block reader
+        cannot be described the same way in every process.
+
+        The key is computed when the view is first read, rather than
+        when it is created, as subclasses set their state after calling
+        ``StreamBackedCorpusView.__init__``.
+        """
+        state = {
+            name: value
+            for name, value in vars(self).items()
+            if name not in _VIEW_ATTRIBUTES
+        }
+        reader = self.read_block
+        if getattr(reader, "__self__", None) is self:
+            # The state of the view is already part of the key
+            reader = reader.__func__
+        try:
+            key = (
+                f"{type(self).__module__}.{type(self).__qualname__} "
+                f"{_describe(reader)} {_describe(state)} "
+                f"{self._filepos[0]} {self._encoding}"
+            )
+        except ValueError:
+            return None
+        return hashlib.sha256(key.encode("utf8")).hexdigest()
+
+    def _load_index(self):
+        """
+        Load the toknum/filepos mapping from the offset index, if it
+        exists and is valid for the corpus file.
+        """
+        with self._lock:
+            if not self._index_pending:
+                return
+            self._index_pending = False
+            path, offset_index = self._offset_index
+            key = self._index_key()
+            if key is None:
+                self._offset_index = None
+                return
+            digest = hashlib.sha1(f"{path}\0{key}".encode("utf8")).hexdigest()[:16]
+            if offset_index is True:
+                index_file = f"{path}.{digest}.idx"
+            else:
+                index_file = os.path.join(
+                    offset_index, f"{os.path.basename(path)}.{digest}.idx"
+                )
+            self._offset_index = path, key, index_file
+            try:
+                with open(index_file, encoding="utf8") as infile:
+                    index = json.load(infile)
+                stat = os.stat(path)
+                if (
+                    index["key"] != key
+                    or index["size"] != stat.st_size
+                    or index["size"] != self._eofpos
+                    or len(index["toknum"]) != len(index["filepos"])
+                    or index["filepos"][0] != self._filepos[0]
+                ):
+                    return
+                if index["mtime"] != stat.st_mtime_ns:
+                    if index["sha256"] != _file_sha256(path):
+                        return
+                    # The file was copied or touched, but not modified
+                    index["mtime"] = stat.st_mtime_ns
+                    _write_index(index_file, index)
+            except (OSError, ValueError, KeyError, TypeError, IndexError):
+                return
+            if len(self._toknum) == 1:
+                self._toknum = index["toknum"]
+                self._filepos = index["filepos"]
+                self._len = index["len"]
+                self._offset_index = None
+
+    def _save_index(self):
+        """
+        Save the toknum/filepos mapping to the offset index, once the
+        whole file has been read.  Called with the lock held.
+        """
+        path, key, index_file = self._offset_index
+        self._offset_index = None
+        try:
+            stat = os.stat(path)
+            index = {
+                "key": key,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha256": _file_sha256(path),
+                "len": self._len,
+                "toknum": self._toknum,
+                "filepos": self._filepos,
+            }
+            _write_index(index_file, index)
+        except OSError:
+            pass
+
     def __enter__(self):
         return self
 
@@ -234,6 +495,8 @@ class StreamBackedCorpusView(AbstractLazySequence):
         self.close()
 
     def __len__(self):
+        if self._index_pending:
+            self._load_index()
         if self._len is None:
             # iterate_from() sets self._len when it reaches the end
             # of the file:
@@ -245,9 +508,9 @@ class StreamBackedCorpusView(AbstractLazySequence):
         if isinstance(i, slice):
             start, stop = slice_bounds(self, i)
             # Check if it's in the cache.
-            offset = self._cache[0]
-            if offset <= start and stop <= self._cache[1]:
-                return self._cache[2][start - offset : stop - offset]
+            offset, end, tokens = self._cached_block(start)
+            if offset <= start and stop <= end:
+                return tokens[start - offset : stop - offset]
             # Construct & return the result.
             return LazySubsequence(self, start, stop)
         else:
@@ -257,39 +520,69 @@ class StreamBackedCorpusView(AbstractLazySequence):
             if i < 0:
                 raise IndexError("index out of range")
             # Check if it's in the cache.
-            offset = self._cache[0]
-            if offset <= i < self._cache[1]:
-                return self._cache[2][i - offset]
+            offset, end, tokens = self._cached_block(i)
+            if offset <= i < end:
+                return tokens[i - offset]
             # Use iterate_from to extract it.
             try:
                 return next(self.iterate_from(i))
             except StopIteration as e:
                 raise IndexError("index out of range") from e
 
-    # If we wanted to be thread-safe, then this method would need to
-    # do some locking.
+    def _cached_block(self, i):
+        """
+        Return the cached block that contains token ``i``, as a tuple
+        (start_toknum, end_toknum, tokens), or else the most recently read
+        block.
+        """
+        cache = self._cache
+        if cache[0] <= i < cache[1] or not self._blocks:
+            return cache
+        with self._lock:
+            start = self._toknum[bisect.bisect_right(self._toknum, i) - 1]
+            block = self._blocks.get(start)
+            if block is None or i >= block[0]:
+                return cache
+            self._blocks.move_to_end(start)
+        self._cache = cache = (start, block[0], block[1])
+        return cache
+
+    def _remember_block(self, toknum, tokens, end_filepos, size):
+        """
+        Add a block to the least recently used cache, if it is not empty
+        and fits in ``cache_size``.  Called with the lock held.
+        """
+        if not tokens or not 0 < size <= self._cache_size:
+            return
+        if toknum in self._blocks:
+            self._blocks.move_to_end(toknum)
+            return
+        self._blocks[toknum] = (toknum + len(tokens), tokens, end_filepos, size)
+        self._cached_bytes += size
+        while self._cached_bytes > self._cache_size:
+            self._cached_bytes -= self._blocks.popitem(last=False)[1][3]
+
     def iterate_from(self, start_tok):
+        if self._index_pending:
+            self._load_index()
+
         # Start by feeding from the cache, if possible.
-        if self._cache[0] <= start_tok < self._cache[1]:
-            for tok in self._cache[2][start_tok - self._cache[0] :]:
+        offset, end, tokens = self._cache
+        if offset <= start_tok < end:
+            for tok in tokens[start_tok - offset :]:
                 yield tok
                 start_tok += 1
 
         # Decide where in the file we should start.  If `start` is in
         # our mapping, then we can jump straight to the correct block;
         # otherwise, start at the last block we've processed.
-        if start_tok < self._toknum[-1]:
-            block_index = bisect.bisect_right(self._toknum, start_tok) - 1
+        with self._lock:
+            if start_tok < self._toknum[-1]:
+                block_index = bisect.bisect_right(self._toknum, start_tok) - 1
+            else:
+                block_index = len(self._toknum) - 1
             toknum = self._toknum[block_index]
             filepos = self._filepos[block_index]
-        else:
-            block_index = len(self._toknum) - 1
-            toknum = self._toknum[-1]
-            filepos = self._filepos[-1]
-
-        # Open the stream, if it's not open already.
-        if self._stream is None:
-            self._open()
 
         # If the file is empty, the while loop will never run.
         # This *seems* to be all the state we need to set:
@@ -297,49 +590,72 @@ class StreamBackedCorpusView(AbstractLazySequence):
             self._len = 0
 
         # Each iteration through this loop, we read a single block
-        # from the stream.
+        # from the stream, or take it from the cache.
         while filepos < self._eofpos:
-            # Read the next block.
-            self._stream.seek(filepos)
-            self._current_toknum = toknum
-            self._current_blocknum = block_index
-            tokens = self.read_block(self._stream)
-            assert isinstance(tokens, (tuple, list, AbstractLazySequence)), (
-                "block reader %s() should return list or tuple."
-                % self.read_block.__name__
-            )
-            num_toks = len(tokens)
-            new_filepos = self._stream.tell()
-            assert (
-                new_filepos > filepos
-            ), "block reader %s() should consume at least 1 byte (filepos=%d)" % (
-                self.read_block.__name__,
-                filepos,
-            )
-
-            # Update our cache.
-            self._cache = (toknum, toknum + num_toks, list(tokens))
-
-            # Update our mapping.
-            assert toknum <= self._toknum[-1]
-            if num_toks > 0:
+            with self._lock:
+                block = self._blocks.get(toknum)
+                if block is not None:
+                    self._blocks.move_to_end(toknum)
+
+            if block is not None:
+                # The next non-empty block is cached, and in our mapping.
+                end, tokens, new_filepos, size = block
+                num_toks = len(tokens)
                 block_index += 1
-                if toknum == self._toknum[-1]:
-                    assert new_filepos > self._filepos[-1]  # monotonic!
-                    self._filepos.append(new_filepos)
-                    self._toknum.append(toknum + num_toks)
-                else:
-                    # Check for consistency:
-                    assert (
-                        new_filepos == self._filepos[block_index]
-                    ), "inconsistent block reader (num chars read)"
-                    assert (
-                        toknum + num_toks == self._toknum[block_index]
-                    ), "inconsistent block reader (num tokens returned)"
-
-            # If we reached the end of the file, then update self._len
-            if new_filepos == self._eofpos:
-                self._len = toknum + num_toks
+                self._cache = (toknum, end, tokens)
+            else:
+                # Open the stream, if it's not open already.
+                if self._stream is None or getattr(self._stream, "closed", False):
+                    self._open()
+
+                # Read the next block.
+                self._stream.seek(filepos)
+                self._current_toknum = toknum
+                self._current_blocknum = block_index
+                tokens = self.read_block(self._stream)
+                assert isinstance(tokens, (tuple, list, AbstractLazySequence)), (
+                    "block reader %s() should return list or tuple."
+                    % self.read_block.__name__
+                )
+                num_toks = len(tokens)
+                new_filepos = self._stream.tell()
+                assert (
+                    new_filepos > filepos
+                ), "block reader %s() should consume at least 1 byte (filepos=%d)" % (
+                    self.read_block.__name__,
+                    filepos,
+                )
+
+                with self._lock:
+                    # Update our cache.
+                    self._cache = (toknum, toknum + num_toks, list(tokens))
+                    self._remember_block(
+                        toknum, self._cache[2], new_filepos, new_filepos - filepos
+                    )
+
+                    # Update our mapping.
+                    assert toknum <= self._toknum[-1]
+                    if num_toks > 0:
+                        block_index += 1
+                        if toknum == self._toknum[-1]:
+                            assert new_filepos > self._filepos[-1]  # monotonic!
+                            self._filepos.append(new_filepos)
+                            self._toknum.append(toknum + num_toks)
+                        else:
+                            # Check for consistency:
+                            assert (
+                                new_filepos == self._filepos[block_index]
+                            ), "inconsistent block reader (num chars read)"
+                            assert (
+                                toknum + num_toks == self._toknum[block_index]
+                            ), "inconsistent block reader (num tokens returned)"
+
+                    # If we reached the end of the file, then update self._len
+                    if new_filepos == self._eofpos:
+                        self._len = toknum + num_toks
+                        # and save our mapping, which is now complete.
+                        if self._offset_index is not None:
+                            self._save_index()
             # Generate the tokens in this block (but skip any tokens
             # before start_tok).  Note that between yields, our state
             # may be modified.
@@ -357,7 +673,70 @@ class StreamBackedCorpusView(AbstractLazySequence):
         assert self._len is not None
         # Enforce closing of stream once we reached end of file
         # We should have reached EOF once we're out of the while loop.
-        self.close()
+        self._close_stream()
+
+    def partition(self, n):
+        """
+        Split this view into ``n`` disjoint corpus views, of about the
+        same number of bytes of the file, whose concatenation has the
+        same tokens as this view.  The views are cut at block
+        boundaries, so unless the length of this view is already known,
+        or saved in its offset index, the file is read once to find them.
+
+        :param n: The number of views.
+        :type n: int
+        :rtype: list(StreamBackedCorpusView)
+        """
+        return [self._subview(*pieces[0][1:]) for pieces in _partition([self], n)]
+
+    def shard(self, i, n):
+        """
+        Return the ``i``-th of the views returned by ``partition(n)``.
+
+        :rtype: StreamBackedCorpusView
+        """
+        if not 0 <= i < n:
+            raise IndexError("shard index out of range")
+        return self.partition(n)[i]
+
+    def _block_positions(self):
+        """
+        Return the file positions of all the block boundaries in the
+        file, reading it to the end if necessary.
+        """
+        len(self)
+        with self._lock:
+            return list(self._filepos)
+
+    def _subview(self, first, last):
+        """
+        Return a new view of the blocks ``first`` up to ``last`` of this
+        view, whose toknum/filepos mapping is complete.  The new view is
+        not thread-safe, and has its own (empty) cache.
+        """
+        with self._lock:
+            toknum = self._toknum[first : last + 1]
+            filepos = self._filepos[first : last + 1]
+            last_block = last == len(self._toknum) - 1
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view.__dict__.pop("_local", None)
+        view.__dict__.pop("_streams", None)
+        view._lock = nullcontext()
+        view._stream = None
+        view._current_toknum = None
+        view._current_blocknum = None
+        view._toknum = [num - toknum[0] for num in toknum]
+        view._filepos = filepos
+        view._len = view._toknum[-1]
+        # The last view also reads any empty blocks at the end of the file.
+        view._eofpos = self._eofpos if last_block else filepos[-1]
+        view._cache = (-1, -1, None)
+        view._blocks = OrderedDict()
+        view._cached_bytes = 0
+        view._offset_index = None
+        view._index_pending = False
+        return view
 
     # Use concat for these, so we can use a ConcatenatedCorpusView
     # when possible.
@@ -374,6 +753,146 @@ class StreamBackedCorpusView(AbstractLazySequence):
         return concat([self] * count)
 
 
+# Attributes that StreamBackedCorpusView manages itself, and which are
+# not part of the key of an offset index.
+_VIEW_ATTRIBUTES = frozenset(
+    [
+        "read_block",
+        "_fileid",
+        "_encoding",
+        "_toknum",
+        "_filepos",
+        "_eofpos",
+        "_len",
+        "_blocks",
+        "_cache",
+        "_cache_size",
+        "_cached_bytes",
+        "_lock",
+        "_local",
+        "_streams",
+        "_stream",
+        "_current_toknum",
+        "_current_blocknum",
+        "_offset_index",
+        "_index_pending",
+    ]
+)
+
+
+def _describe(value, depth=8):
+    """
+    Describe ``value`` by its type and contents, in the same way in every
+    process, for the key of an offset index.  Objects are described by
+    their attributes, and functions by their name, their code (with the
+    names and constants it uses) and their closure.
+
+    :raise ValueError: If ``value`` cannot be described in that way, or
+        is nested more than ``depth`` objects deep.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    if depth == 0:
+        raise ValueError("Object nested too deep to be described")
+    depth -= 1
+    if isinstance(value, (list, tuple)):
+        items = [_describe(item, depth) for item in value]
+        return f"{type(value).__name__}[{', '.join(items)}]"
+    if isinstance(value, (set, frozenset)):
+        items = sorted(_describe(item, depth) for item in value)
+        return f"{type(value).__name__}{{{', '.join(items)}}}"
+    if isinstance(value, dict):
+        items = sorted(
+            f"{_describe(key, depth)}: {_describe(item, depth)}"
+            for key, item in value.items()
+        )
+        return f"{type(value).__name__}{{{', '.join(items)}}}"
+    if isinstance(value, re.Pattern):
+        return f"re({value.pattern!r}, {value.flags})"
+    if isinstance(value, partial):
+        return (
+            f"partial({_describe(value.func, depth)}, "
+            f"{_describe(value.args, depth)}, {_describe(value.keywords, depth)})"
+        )
+    if isinstance(value, types.MethodType):
+        return (
+            f"{_describe(value.__self__, depth)}." f"{_describe(value.__func__, depth)}"
+        )
+    if isinstance(value, types.FunctionType):
+        code = _describe_code(value.__code__).encode("utf8")
+        code = hashlib.sha1(code).hexdigest()[:16]
+        cells = []
+        for cell in value.__closure__ or ():
+            try:
+                cells.append(cell.cell_contents)
+            except ValueError:
+                cells.append(None)
+        return (
+            f"{value.__module__}.{value.__qualname__}({code}, "
+            f"{_describe(cells, depth)}, {_describe(value.__defaults__, depth)}, "
+            f"{_describe(value.__kwdefaults__, depth)})"
+        )
+    if isinstance(value, (type, types.BuiltinFunctionType)):
+        return f"{value.__module__}.{value.__qualname__}"
+    if hasattr(value, "__dict__"):
+        return (
+            f"{type(value).__module__}.{type(value).__qualname__}"
+            f"({_describe(vars(value), depth)})"
+        )
+    text = repr(value)
+    if " at 0x" in text:
+        raise ValueError(f"Cannot describe {type(value).__qualname__} objects")
+    return text
+
+
+def _describe_code(code):
+    """
+    Describe a code object by its bytecode, the global and attribute names
+    it uses, and its constants, including the code of nested functions.
+    """
+    return f"{code.co_code.hex()} {code.co_names!r} {_describe_const(code.co_consts)}"
+
+
+def _describe_const(const):
+    """Describe a constant of a code object, in the same way in every process."""
+    if isinstance(const, types.CodeType):
+        return _describe_code(const)
+    if isinstance(const, tuple):
+        return f"({', '.join(_describe_const(item) for item in const)})"
+    if isinstance(const, frozenset):
+        # The order of a frozenset of strings changes with the hash seed
+        return f"{{{', '.join(sorted(_describe_const(item) for item in const))}}}"
+    return repr(const)
+
+
+def _file_sha256(path):
+    """Return the hex SHA-256 digest of the contents of a file."""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as infile:
+        for chunk in iter(lambda: infile.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _write_index(index_file, index):
+    """
+    Write an offset index to a temporary file, and move it to
+    ``index_file``, so that readers never see a partial index.
+    """
+    directory = os.path.dirname(index_file)
+    os.makedirs(directory, exist_ok=True)
+    outfile = tempfile.NamedTemporaryFile(
+        "w", encoding="utf8", dir=directory, suffix=".tmp", delete=False
+    )
+    try:
+        with outfile:
+            json.dump(index, outfile, separators=(",", ":"))
+        os.replace(outfile.name, index_file)
+    except BaseException:
+        os.remove(outfile.name)
+        raise
+
+
 class ConcatenatedCorpusView(AbstractLazySequence):
     """
     A 'view' of a corpus file that joins together one or more
@@ -407,6 +926,49 @@ class ConcatenatedCorpusView(AbstractLazySequence):
         for piece in self._pieces:
             piece.close()
 
+    def partition(self, n):
+        """
+        Split this view into ``n`` disjoint concatenated views, of about
+        the same number of bytes of the files, whose concatenation has
+        the same tokens as this view.  See
+        ``StreamBackedCorpusView.partition()``.
+
+        :param n: The number of views.
+        :type n: int
+        :rtype: list(ConcatenatedCorpusView)
+        """
+        return [
+            ConcatenatedCorpusView(
+                [view._subview(first, last) for view, first, last in pieces]
+            )
+            for pieces in _partition(self._stream_views(), n)
+        ]
+
+    def shard(self, i, n):
+        """
+        Return the ``i``-th of the views returned by ``partition(n)``.
+
+        :rtype: ConcatenatedCorpusView
+        """
+        if not 0 <= i < n:
+            raise IndexError("shard index out of range")
+        return self.partition(n)[i]
+
+    def _stream_views(self):
+        """
+        Return the stream backed corpus views that make up this view,
+        in order.
+        """
+        views = []
+        for piece in self._pieces:
+            if isinstance(piece, ConcatenatedCorpusView):
+                views.extend(piece._stream_views())
+            elif isinstance(piece, StreamBackedCorpusView):
+                views.append(piece)
+            else:
+                raise TypeError(f"Cannot partition a view of {type(piece)!r}")
+        return views
+
     def iterate_from(self, start_tok):
         piecenum = bisect.bisect_right(self._offsets, start_tok) - 1
 
@@ -483,6 +1045,86 @@ def concat(docs):
     raise ValueError("Don't know how to concatenate types: %r" % types)
 
 
+def _partition(views, n):
+    """
+    Split the blocks of the stream backed corpus ``views`` into ``n``
+    runs of about the same number of bytes.  Each run is returned as a
+    list of (view, first, last) tuples, for the blocks ``first`` up to
+    ``last`` of each view it covers; a run within one view, or an
+    empty run, has a single tuple.
+    """
+    if n < 1:
+        raise ValueError("Cannot partition a view into less than 1 part")
+
+    # The (view index, block index) of each block boundary, and its byte
+    # position counted from the start of the first view
+    boundaries = []
+    positions = []
+    lasts = []
+    total = 0
+    for i, view in enumerate(views):
+        filepos = view._block_positions()
+        boundaries.extend((i, block) for block in range(len(filepos)))
+        positions.extend(total + pos - filepos[0] for pos in filepos)
+        lasts.append(len(filepos) - 1)
+        total += view._eofpos - filepos[0]
+
+    # Cut at the boundary closest to each multiple of total / n.
+    cuts = [0]
+    for i in range(1, n):
+        target = total * i / n
+        cut = bisect.bisect_left(positions, target)
+        if cut == len(positions) or (
+            cut > 0 and target - positions[cut - 1] < positions[cut] - target
+        ):
+            cut -= 1
+        cuts.append(max(cut, cuts[-1]))
+    cuts.append(len(boundaries) - 1)
+
+    runs = []
+    for start, stop in zip(cuts, cuts[1:]):
+        (start_view, first), (stop_view, last) = boundaries[start], boundaries[stop]
+        if start_view == stop_view:
+            run = [(start_view, first, last)]
+        else:
+            run = [(start_view, first, lasts[start_view])]
+            run += [(i, 0, lasts[i]) for i in range(start_view + 1, stop_view)]
+            run.append((stop_view, 0, last))
+            # Leave out empty pieces.
+            run = [piece for piece in run if piece[1] < piece[2]] or run[:1]
+        runs.append([(views[i], first, last) for i, first, last in run])
+    return runs
+
+
+def map_shards(function, view, workers=None, shards=None):
+    """
+    Apply ``function`` to each of the shards of a corpus view, in a pool
+    of worker processes, and return the results in corpus order::
+
+        counts = map_shards(Counter, gutenberg.words(), workers=4)
+        total = sum(counts, Counter())
+
+    ``function`` must be picklable, e.g. defined at the top level of a
+    module.  Each worker only reads the part of the corpus files of its
+    shard.
+
+    :param function: The function to apply to each shard.
+    :param view: The corpus view to split into shards.
+    :type view: StreamBackedCorpusView or ConcatenatedCorpusView
+    :param workers: Number of worker processes; all CPUs if None.
+    :type workers: int or None
+    :param shards: Number of shards; ``workers`` if None.
+    :type shards: int or None
+    :rtype: list
+    """
+    workers = workers or os.cpu_count() or 1
+    parts = view.partition(shards or workers)
+    if workers == 1:
+        return [function(part) for part in parts]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(function, parts))
+
+
 ######################################################################
 # { Corpus View for Pickled Sequences
 ######################################################################
@@ -543,6 +1185,12 @@ class PickleCorpusView(StreamBackedCorpusView):
                     pass
         self.__dict__.clear()  # make the garbage collector's job easier
 
+    def _subview(self, first, last):
+        # Only this view deletes the file, not its partitions.
+        view = super()._subview(first, last)
+        view._delete_on_gc = False
+        return view
+
     @classmethod
     def write(cls, sequence, output_file):
         if isinstance(output_file, str):
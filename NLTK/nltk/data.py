@@ -38,8 +38,11 @@ import pickle
 import re
 import sys
 import textwrap
+import threading
+import weakref
 import zipfile
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict, namedtuple
 from gzip import WRITE as GZ_WRITE
 from gzip import GzipFile
 from io import BytesIO, TextIOWrapper
@@ -50,7 +53,6 @@ try:
 except ImportError:
     from zlib import Z_FINISH as FLUSH
 
-from nltk import grammar, sem
 from nltk.compat import add_py3_data, py3_data
 from nltk.internals import deprecated
 
@@ -461,11 +463,165 @@ class ZipFilePathPointer(PathPointer):
 # Access Functions
 ######################################################################
 
-# Don't use a weak dictionary, because in the common case this
-# causes a lot more reloading that necessary.
-_resource_cache = {}
-"""A dictionary used to cache resources so that they won't
-   need to be loaded more than once."""
+ResourceCacheInfo = namedtuple(
+    "ResourceCacheInfo",
+    [
+        "hits",
+        "misses",
+        "evictions",
+        "entries",
+        "bytes",
+        "weak_entries",
+        "max_entries",
+        "max_bytes",
+    ],
+)
+
+
+class ResourceCache:
+    """
+    A least recently used cache of the resources loaded by ``load()``.
+
+    The cache keeps at most ``max_entries`` resources, of at most
+    ``max_bytes`` bytes in total, and evicts the least recently used
+    resources beyond that; None means no limit.  The size of a resource
+    is the size of its uncompressed file, which is a rough lower bound
+    of its size in memory.
+
+    Resources of more than ``weak_threshold`` bytes, and evicted
+    resources, are only kept by weak reference, if their type supports
+    it.  They stay cached for as long as they are used elsewhere, so
+    loading them again does not create another copy; but the cache does
+    not keep them alive.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, weak_threshold=None):
+        self._entries = OrderedDict()
+        """Maps each (resource_url, format) to a tuple (resource, size),
+           from the least to the most recently used."""
+        self._weak = {}
+        """Maps (resource_url, format) to weak references to resources."""
+        self._bytes = 0
+        self._hits = self._misses = self._evictions = 0
+        self._lock = threading.RLock()
+        self.configure(max_entries, max_bytes, weak_threshold)
+
+    def configure(self, max_entries=None, max_bytes=None, weak_threshold=None):
+        """
+        Set the limits of the cache, and evict the resources beyond them.
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self.weak_threshold = weak_threshold
+            self._shrink()
+
+    def get(self, key):
+        """
+        Return the cached resource for ``key``, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            ref = self._weak.get(key)
+            resource = None if ref is None else ref()
+            if resource is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return resource
+
+    def put(self, key, resource, size=0):
+        """
+        Add ``resource`` to the cache, as the most recently used one.
+
+        :param size: The size of the resource in bytes.
+        """
+        with self._lock:
+            self._discard(key)
+            if (
+                self.weak_threshold is not None
+                and size > self.weak_threshold
+                and self._keep_weakly(key, resource)
+            ):
+                return
+            self._entries[key] = (resource, size)
+            self._bytes += size
+            self._shrink()
+
+    def clear(self):
+        """
+        Remove all resources from the cache.  The statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._weak.clear()
+            self._bytes = 0
+
+    def info(self):
+        """
+        Return the statistics of the cache, for monitoring: the numbers
+        of hits, misses and evictions so far, the number and total size
+        of the resources in the cache, the number of resources only kept
+        by weak reference, and the limits of the cache.
+
+        :rtype: ResourceCacheInfo
+        """
+        with self._lock:
+            return ResourceCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._bytes,
+                len(self._weak),
+                self.max_entries,
+                self.max_bytes,
+            )
+
+    def _shrink(self):
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key, (resource, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            self._keep_weakly(key, resource)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+        self._weak.pop(key, None)
+
+    def _keep_weakly(self, key, resource):
+        """
+        Keep a weak reference to ``resource``, and return whether its
+        type supports it.
+        """
+        try:
+            self._weak[key] = weakref.ref(
+                resource, functools.partial(self._forget, key)
+            )
+        except TypeError:
+            return False
+        return True
+
+    def _forget(self, key, ref):
+        # Called when a weakly cached resource is garbage collected.
+        with self._lock:
+            if self._weak.get(key) is ref:
+                del self._weak[key]
+
+
+_resource_cache = ResourceCache()
+"""The cache of resources, so that they won't need to be loaded
+   more than once.  It has no limits unless configure_cache() is
+   called."""
 
 
 def find(resource_name, paths=None):
@@ -751,8 +907,10 @@ def load(
 
     if format == "raw":
         resource_val = opened_resource.read()
+        size = len(resource_val)
     elif format == "pickle":
         resource_val = pickle.load(opened_resource)
+        size = _tell(opened_resource)
     elif format == "json":
         import json
 
@@ -764,13 +922,18 @@ def load(
             tag = next(resource_val.keys())
         if tag not in json_tags:
             raise ValueError("Unknown json tag.")
+        size = _tell(opened_resource)
     elif format == "yaml":
         import yaml
 
         resource_val = yaml.safe_load(opened_resource)
+        size = _tell(opened_resource)
     else:
+        from nltk import grammar, sem
+
         # The resource is a text format.
         binary_data = opened_resource.read()
+        size = len(binary_data)
         if encoding is not None:
             string_data = binary_data.decode(encoding)
         else:
@@ -813,18 +976,22 @@ def load(
 
     # If requested, add it to the cache.
     if cache:
-        try:
-            _resource_cache[(resource_url, format)] = resource_val
-            # TODO: add this line
-            # print('<<Caching a copy of %s>>' % (resource_url,))
-        except TypeError:
-            # We can't create weak references to some object types, like
-            # strings and tuples.  For now, just don't cache them.
-            pass
+        _resource_cache.put((resource_url, format), resource_val, size)
 
     return resource_val
 
 
+def _tell(stream):
+    """
+    Return the position of ``stream``, i.e. the number of bytes read
+    from it, or 0 if it is not known.
+    """
+    try:
+        return stream.tell()
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
 def show_cfg(resource_url, escape="##"):
     """
     Write out a grammar file, ignoring escaped and empty lines.
@@ -855,6 +1022,28 @@ def clear_cache():
     _resource_cache.clear()
 
 
+def configure_cache(max_entries=None, max_bytes=None, weak_threshold=None):
+    """
+    Limit the resource cache to the ``max_entries`` most recently used
+    resources, of at most ``max_bytes`` bytes in total; and only keep
+    the resources of more than ``weak_threshold`` bytes while they are
+    used elsewhere.  None means no limit.  See ``ResourceCache``.
+
+    :see: load(), cache_info()
+    """
+    _resource_cache.configure(max_entries, max_bytes, weak_threshold)
+
+
+def cache_info():
+    """
+    Return the statistics of the resource cache.
+
+    :rtype: ResourceCacheInfo
+    :see: ResourceCache.info()
+    """
+    return _resource_cache.info()
+
+
 def _open(resource_url):
     """
     Helper function that returns an open file object for a resource,
@@ -900,6 +1089,10 @@ class LazyLoader:
         self.__class__ = resource.__class__
 
     def __getattr__(self, attr):
+        # Special methods looked up on the instance, e.g. __setstate__ when
+        # unpickling, must not load the resource: we have no _path yet.
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
         self.__load()
         # This looks circular, but its not, since __load() changes our
         # __class__ to something new:
@@ -1411,7 +1604,7 @@ class SeekableUnicodeStreamReader:
             self.stream.seek(0)
 
             # Check for each possible BOM.
-            for (bom, new_encoding) in bom_info:
+            for bom, new_encoding in bom_info:
                 if bytes.startswith(bom):
                     if new_encoding:
                         self.encoding = new_encoding
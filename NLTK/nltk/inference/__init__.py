@@ -11,6 +11,10 @@
 Classes and interfaces for theorem proving and model building.
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.inference" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.inference.api import ParallelProverBuilder, ParallelProverBuilderCommand
 from nltk.inference.discourse import (
     CfgReadingCommand,
@@ -210,6 +210,7 @@ on 2 preceding words. If you pass in a 4-word context, the first two words
 will be ignored.
 """
 
+from nltk.lm.compact import CompactNgramCounter
 from nltk.lm.counter import NgramCounter
 from nltk.lm.models import (
     MLE,
@@ -225,6 +226,7 @@ from nltk.lm.vocabulary import Vocabulary
 __all__ = [
     "Vocabulary",
     "NgramCounter",
+    "CompactNgramCounter",
     "MLE",
     "Lidstone",
     "Laplace",
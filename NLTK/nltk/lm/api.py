@@ -6,16 +6,26 @@
 # For license information, see LICENSE.TXT
 """Language Model Interface."""
 
+import os
 import random
 import warnings
 from abc import ABCMeta, abstractmethod
 from bisect import bisect
-from itertools import accumulate
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import accumulate, chain, islice
 
 from nltk.lm.counter import NgramCounter
+from nltk.lm.preprocessing import padded_everygram_pipeline
 from nltk.lm.util import log_base2
 from nltk.lm.vocabulary import Vocabulary
 
+try:
+    import numpy as np
+except ImportError:
+    pass
+
 
 class Smoothing(metaclass=ABCMeta):
     """Ngram Smoothing Interface
@@ -43,6 +53,14 @@ class Smoothing(metaclass=ABCMeta):
     def alpha_gamma(self, word, context):
         raise NotImplementedError()
 
+    def alpha_gamma_many(self, words, context):
+        """Return `alpha_gamma` for several words sharing the same context.
+
+        Subclasses can override this to compute the statistics of `context`
+        once instead of once per word.
+        """
+        return [self.alpha_gamma(word, context) for word in words]
+
 
 def _mean(items):
     """Return average (aka mean) for sequence of items."""
@@ -70,6 +88,108 @@ def _weighted_choice(population, weights, random_generator=None):
     return population[bisect(cum_weights, total * threshold)]
 
 
+class _ContextSampler:
+    """Draws words from a language model like `_weighted_choice` would.
+
+    The sorted support and cumulative scores of each context are kept in a
+    bounded LRU cache, so revisiting a context costs one binary search.
+    Entries are not invalidated when the model is trained further, so a
+    sampler should only live for one batch of generation.
+    """
+
+    def __init__(self, model, cache_size=4096):
+        self.model = model
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def _distribution(self, context):
+        entry = self._cache.get(context)
+        if entry is not None:
+            self._cache.move_to_end(context)
+            return entry
+
+        model = self.model
+        key = context
+        samples = model.context_counts(context)
+        while context and not samples:
+            context = context[1:]
+            samples = model.context_counts(context)
+        # Sorting samples keeps the random sampling reproducible
+        samples = sorted(samples)
+        if not samples:
+            raise ValueError("Can't choose from empty population")
+        scores = model.score_many([context + (word,) for word in samples])
+        entry = samples, list(accumulate(scores.tolist()))
+
+        self._cache[key] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def generate(self, num_words, text_seed, random_generator):
+        """Generate `num_words` words after `text_seed`, as `LanguageModel.generate`."""
+        order = self.model.order
+        text = [] if text_seed is None else list(text_seed)
+        generated = []
+        for _ in range(num_words):
+            context = text[-order + 1 :] if len(text) >= order else text
+            samples, cum_weights = self._distribution(
+                tuple(self.model.vocab.lookup(context))
+            )
+            threshold = random_generator.random()
+            word = samples[bisect(cum_weights, cum_weights[-1] * threshold)]
+            text.append(word)
+            generated.append(word)
+        return generated[0] if num_words == 1 else generated
+
+
+# Vocabulary used to mask the words of the shards counted by this process
+_shard_vocabulary = None
+
+
+def _set_shard_vocabulary(vocabulary):
+    global _shard_vocabulary
+    _shard_vocabulary = vocabulary
+
+
+def _count_vocabulary_shard(order, sents):
+    _, vocabulary_text = padded_everygram_pipeline(order, sents)
+    return Vocabulary(vocabulary_text)
+
+
+def _count_ngram_shard(order, counter_class, sents):
+    text, _ = padded_everygram_pipeline(order, sents)
+    counter = counter_class()
+    counter.update(_shard_vocabulary.lookup(sent) for sent in text)
+    return counter
+
+
+def _map_shards(function, sents, shard_size, workers, vocabulary=None):
+    """Yield `function(shard)` for consecutive shards of `sents`, in order.
+
+    At most two shards per worker are in flight, so `sents` is read lazily.
+    """
+    shards = iter(lambda: list(islice(sents, shard_size)), [])
+    if workers == 1:
+        _set_shard_vocabulary(vocabulary)
+        try:
+            yield from map(function, shards)
+        finally:
+            _set_shard_vocabulary(None)
+        return
+
+    with ProcessPoolExecutor(
+        workers, initializer=_set_shard_vocabulary, initargs=(vocabulary,)
+    ) as executor:
+        pending = deque()
+        for shard in shards:
+            pending.append(executor.submit(function, shard))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 class LanguageModel(metaclass=ABCMeta):
     """ABC for Language Models.
 
@@ -115,6 +235,57 @@ class LanguageModel(metaclass=ABCMeta):
             self.vocab.update(vocabulary_text)
         self.counts.update(self.vocab.lookup(sent) for sent in text)
 
+    def fit_sharded(self, sents, workers=None, shard_size=1000):
+        """Trains the model on tokenized sentences, counting shards of them in parallel.
+
+        This gives exactly the same vocabulary and counts as::
+
+            text, vocabulary_text = padded_everygram_pipeline(self.order, sents)
+            self.fit(text, vocabulary_text)
+
+        but the padding, ngram extraction and counting of every `shard_size`
+        sentences run in a process pool. Each shard is counted into a fresh
+        `Vocabulary` and a fresh counter of the same class as `counts`, and the
+        partial results are merged in input order.
+
+        If the vocabulary has to be built, the sentences are read twice:
+        once to count words and once, with the merged vocabulary, to count
+        ngrams. An iterator is therefore loaded into memory first; pass a
+        sequence or a corpus view to avoid that.
+
+        >>> from nltk.lm import MLE
+        >>> lm = MLE(2)
+        >>> lm.fit_sharded([["a", "b"], ["b", "c"]], workers=1, shard_size=1)
+        >>> lm.counts[["b"]]["c"]
+        1
+
+        :param Iterable(Iterable(str)) sents: Tokenized training sentences.
+        :param int workers: Number of worker processes; all CPUs by default.
+            With 1, the shards are counted in this process.
+        :param int shard_size: Number of sentences per shard.
+        """
+        workers = workers or os.cpu_count() or 1
+        if not self.vocab:
+            if iter(sents) is sents:
+                sents = list(sents)
+            shards = _map_shards(
+                partial(_count_vocabulary_shard, self.order),
+                iter(sents),
+                shard_size,
+                workers,
+            )
+            for vocabulary in shards:
+                self.vocab.merge(vocabulary)
+        shards = _map_shards(
+            partial(_count_ngram_shard, self.order, type(self.counts)),
+            iter(sents),
+            shard_size,
+            workers,
+            self.vocab,
+        )
+        for counter in shards:
+            self.counts.merge(counter)
+
     def score(self, word, context=None):
         """Masks out of vocab (OOV) words and computes their model score.
 
@@ -141,6 +312,22 @@ class LanguageModel(metaclass=ABCMeta):
         """
         raise NotImplementedError()
 
+    def unmasked_score_many(self, words, context=None, cache=None):
+        """Score several words given the same context, without masking them.
+
+        The default calls `unmasked_score` for every word. Models override it
+        to look up the statistics of `context` only once.
+
+        :param list(str) words: Words for which we want the scores.
+        :param context: Context the words are in, or `None` for unigram scores.
+        :type context: tuple(str) or None
+        :param dict cache: Scores already computed during the same batch, keyed
+            by ``(context, word)``. Models that back off to shorter contexts
+            can use it to score each lower-order ngram only once.
+        :rtype: list(float)
+        """
+        return [self.unmasked_score(word, context) for word in words]
+
     def logscore(self, word, context=None):
         """Evaluate the log score of this word in this context.
 
@@ -149,6 +336,53 @@ class LanguageModel(metaclass=ABCMeta):
         """
         return log_base2(self.score(word, context))
 
+    def score_many(self, text_ngrams):
+        """Score the last word of every ngram given the words before it.
+
+        Gives the same scores as calling `score` for each ngram, but every
+        distinct word is masked once and the ngrams are grouped by context, so
+        that the statistics of each context are looked up only once.
+
+        >>> from nltk.lm import MLE
+        >>> lm = MLE(2)
+        >>> lm.fit([[("a",), ("b",), ("a", "b"), ("b", "a"), ("a", "c")]], vocabulary_text="abc")
+        >>> lm.score_many([("a", "b"), ("b",), ("a", "c"), ("a", "b")])
+        array([0.5, 0.5, 0.5, 0.5])
+
+        :param Iterable(tuple(str)) text_ngrams: A sequence of ngram tuples.
+        :rtype: numpy.ndarray
+        """
+        masked = {}
+        groups = {}  # context -> word -> positions of the ngram in the input
+        size = 0
+        for size, ngram in enumerate(text_ngrams, 1):
+            ngram = tuple(ngram)
+            for word in ngram:
+                if word not in masked:
+                    masked[word] = self.vocab.lookup(word)
+            context = tuple(masked[word] for word in ngram[:-1])
+            positions = groups.setdefault(context, {})
+            positions.setdefault(masked[ngram[-1]], []).append(size - 1)
+
+        scores = np.empty(size)
+        cache = {}
+        for context, positions in groups.items():
+            words = list(positions)
+            for word, score in zip(
+                words, self.unmasked_score_many(words, context or None, cache)
+            ):
+                scores[positions[word]] = score
+        return scores
+
+    def logscore_many(self, text_ngrams):
+        """Base 2 logarithms of `score_many`, with `-inf` for zero scores.
+
+        :param Iterable(tuple(str)) text_ngrams: A sequence of ngram tuples.
+        :rtype: numpy.ndarray
+        """
+        with np.errstate(divide="ignore"):
+            return np.log2(self.score_many(text_ngrams))
+
     def context_counts(self, context):
         """Helper method for retrieving counts for a given context.
 
@@ -179,6 +413,27 @@ class LanguageModel(metaclass=ABCMeta):
         """
         return pow(2.0, self.entropy(text_ngrams))
 
+    def streaming_perplexity(self, text, batch_size=10000):
+        """Calculates the perplexity of a text given as sentences of ngrams.
+
+        The result is the perplexity of all the ngrams of `text` taken together,
+        but they are read and scored `batch_size` at a time with `logscore_many`,
+        so the text does not have to fit in memory.
+
+        :param Iterable(Iterable(tuple(str))) text: Sentences of ngram tuples.
+        :param int batch_size: Number of ngrams scored at once.
+        :rtype: float
+        """
+        ngrams = chain.from_iterable(text)
+        total, count = 0.0, 0
+        while True:
+            logscores = self.logscore_many(islice(ngrams, batch_size))
+            if not len(logscores):
+                break
+            total += logscores.sum()
+            count += len(logscores)
+        return pow(2.0, -1 * total / count)
+
     def generate(self, num_words=1, text_seed=None, random_seed=None):
         """Generate words from the model.
 
@@ -200,36 +455,42 @@ class LanguageModel(metaclass=ABCMeta):
         'b'
 
         """
-        text_seed = [] if text_seed is None else list(text_seed)
+        sampler = _ContextSampler(self)
+        return sampler.generate(num_words, text_seed, _random_generator(random_seed))
+
+    def generate_many(
+        self,
+        num_sequences,
+        num_words=1,
+        text_seed=None,
+        random_seed=None,
+        cache_size=4096,
+    ):
+        """Generate several sequences of words from the model.
+
+        The sequences are the same as those returned by consecutive calls to
+        `generate` that share one `random.Random` instance, but the cumulative
+        score distribution of each visited context is computed once for the
+        whole batch, so each word is drawn by binary search.
+
+        >>> from nltk.lm import MLE
+        >>> lm = MLE(2)
+        >>> lm.fit([[("a", "b"), ("b", "c")]], vocabulary_text=['a', 'b', 'c'])
+        >>> lm.fit([[("a",), ("b",), ("c",)]])
+        >>> lm.generate_many(2, 3, text_seed=['a'], random_seed=3)
+        [['b', 'c', 'b'], ['b', 'c', 'a']]
+
+        :param int num_sequences: How many sequences to generate.
+        :param int num_words: How many words to generate in each sequence.
+        :param text_seed: Context every sequence is conditioned on.
+        :param random_seed: A random seed or an instance of `random.Random`.
+        :param int cache_size: How many context distributions to keep; the
+            least recently used ones are dropped first.
+        :return: A list with one `generate` result per sequence.
+        """
+        sampler = _ContextSampler(self, cache_size)
         random_generator = _random_generator(random_seed)
-        # This is the base recursion case.
-        if num_words == 1:
-            context = (
-                text_seed[-self.order + 1 :]
-                if len(text_seed) >= self.order
-                else text_seed
-            )
-            samples = self.context_counts(self.vocab.lookup(context))
-            while context and not samples:
-                context = context[1:] if len(context) > 1 else []
-                samples = self.context_counts(self.vocab.lookup(context))
-            # Sorting samples achieves two things:
-            # - reproducible randomness when sampling
-            # - turns Mapping into Sequence which `_weighted_choice` expects
-            samples = sorted(samples)
-            return _weighted_choice(
-                samples,
-                tuple(self.score(w, context) for w in samples),
-                random_generator,
-            )
-        # We build up text one word at a time using the preceding context.
-        generated = []
-        for _ in range(num_words):
-            generated.append(
-                self.generate(
-                    num_words=1,
-                    text_seed=text_seed + generated,
-                    random_seed=random_generator,
-                )
-            )
-        return generated
+        return [
+            sampler.generate(num_words, text_seed, random_generator)
+            for _ in range(num_sequences)
+        ]
@@ -0,0 +1,530 @@
+# Natural Language Toolkit
+#
+# Copyright (C) 2001-2023 NLTK Project
+# URL: <https://www.nltk.org/>
+# For license information, see LICENSE.TXT
+"""
+Compact Language Model Counter
+------------------------------
+
+An alternative to `NgramCounter` for large models. Words are interned to
+integer ids and every ngram order is kept as a lexicographically sorted table
+of id columns plus a parallel array of counts, so a stored ngram type costs a
+few machine words instead of a `FreqDist` entry. Lookups are binary searches
+over those columns. The tables can be saved to a single file and reopened as
+read-only memory maps.
+"""
+
+import json
+from array import array
+from collections.abc import Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+_MAGIC = b"NLTKNGC1"
+_ALIGN = 64
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _count_rows(grams, values):
+    """Sort the columns of `grams` and sum the `values` of duplicate columns."""
+    perm = np.lexsort(grams[::-1])
+    grams, values = grams[:, perm], values[perm]
+    changed = (grams[:, 1:] != grams[:, :-1]).any(axis=0)
+    starts = np.flatnonzero(np.concatenate(([True], changed)))
+    return np.ascontiguousarray(grams[:, starts]), np.add.reduceat(values, starts)
+
+
+def _row_keys(grams):
+    """One byte string per column of `grams`, ordered like the columns.
+
+    Ids are non-negative, so comparing their big-endian bytes compares the
+    columns lexicographically.
+    """
+    rows = np.ascontiguousarray(grams.T, dtype=">u4")
+    return rows.view(np.dtype((np.void, rows.itemsize * grams.shape[0]))).ravel()
+
+
+def _merge_rows(grams, values, new_grams, new_values):
+    """Merge the sorted, distinct columns `new_grams` into the table `grams`.
+
+    Counts of the columns already in the table are added up. This costs a
+    binary search per new column and one pass over the table, instead of
+    sorting the table again.
+    """
+    keys, new_keys = _row_keys(grams), _row_keys(new_grams)
+    positions = np.searchsorted(keys, new_keys)
+    found = positions < len(keys)
+    found[found] = keys[positions[found]] == new_keys[found]
+    inserted = positions[~found]
+    grams = np.insert(grams, inserted, new_grams[:, ~found], axis=1)
+    values = np.insert(values, inserted, new_values[~found])
+    # The columns that were found moved right by the columns inserted before them
+    matched = positions[found]
+    values[matched + np.searchsorted(inserted, matched, "right")] += new_values[found]
+    return grams, values
+
+
+def _search(grams, ids, lo=0, hi=None):
+    """Narrow ``[lo, hi)`` to the columns of `grams` starting with `ids`."""
+    hi = grams.shape[1] if hi is None else hi
+    for row, wid in zip(grams, ids):
+        # A Python int key would make numpy cast the whole segment first
+        wid = row.dtype.type(wid)
+        segment = row[lo:hi]
+        lo, hi = (
+            lo + int(segment.searchsorted(wid, "left")),
+            lo + int(segment.searchsorted(wid, "right")),
+        )
+        if lo == hi:
+            break
+    return lo, hi
+
+
+class CompactNgramCounter:
+    """Array-backed ngram counter with the interface of `NgramCounter`.
+
+    It can be passed to any language model through the `counter` argument.
+
+    >>> from nltk.lm import MLE
+    >>> from nltk.lm.compact import CompactNgramCounter
+    >>> from nltk.lm.preprocessing import padded_everygram_pipeline
+    >>> train, vocab = padded_everygram_pipeline(2, [list("abcd"), list("acdc")])
+    >>> lm = MLE(2, counter=CompactNgramCounter())
+    >>> lm.fit(train, vocab)
+    >>> lm.counts["a"]
+    2
+    >>> sorted(lm.counts[["a"]].items())
+    [('b', 1), ('c', 1)]
+    >>> lm.score("b", ["a"])
+    0.5
+
+    Counts are read through lightweight views. Indexing with a context gives a
+    read-only mapping that behaves like the `FreqDist` of `NgramCounter`, and
+    indexing with an order gives a mapping from contexts to those views.
+
+    >>> lm.counts[["a"]].N()
+    2
+    >>> lm.counts[2]
+    <_OrderCounts with 5 conditions>
+
+    Saved counters are reopened as memory maps, so several processes can share
+    one copy of the tables. Updating a reopened counter builds new tables in
+    memory and leaves the file unchanged.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "counts.ngc")
+    >>> lm.counts.save(path)
+    >>> reopened = CompactNgramCounter.load(path)
+    >>> reopened[["a"]]["c"], reopened.N() == lm.counts.N()
+    (1, True)
+    """
+
+    def __init__(self, ngram_text=None, vocabulary=None, buffer_size=1 << 20):
+        """Creates a new CompactNgramCounter.
+
+        :param ngram_text: Optional text containing sentences of ngrams, as for `update` method.
+        :type ngram_text: Iterable(Iterable(tuple(str))) or None
+        :param vocabulary: If given, the words of this vocabulary are interned
+            first, in sorted order. Other words get ids as they are first counted.
+        :type vocabulary: `nltk.lm.Vocabulary` or None
+        :param int buffer_size: Number of ngrams per order that are buffered
+            before they are merged into the sorted tables.
+        """
+        self._ids = {}
+        self._words = []
+        self._grams = {}  # order -> (order, types) int32 array, columns sorted
+        self._values = {}  # order -> (types,) int64 array of counts
+        self._pending = {}  # order -> array of ids counted since the last merge
+        self._buffer_size = buffer_size
+        self._version = 0
+        self._derived = {}  # arrays computed from the tables, reset when they change
+        if vocabulary is not None:
+            for word in sorted(vocabulary):
+                self._intern(word)
+        self.unigrams = _ContextCounts(self, 1, ())
+
+        if ngram_text:
+            self.update(ngram_text)
+
+    def _intern(self, word):
+        wid = self._ids.get(word)
+        if wid is None:
+            wid = self._ids[word] = len(self._words)
+            self._words.append(word)
+        return wid
+
+    def _context_ids(self, context):
+        ids = tuple(self._ids.get(word) for word in context)
+        return None if None in ids else ids
+
+    def update(self, ngram_text):
+        """Updates ngram counts from `ngram_text`.
+
+        Expects `ngram_text` to be a sequence of sentences (sequences).
+        Each sentence consists of ngrams as tuples of strings.
+
+        :param Iterable(Iterable(tuple(str))) ngram_text: Text containing sentences of ngrams.
+        :raises TypeError: if the ngrams are not tuples.
+        """
+        ids = self._ids
+        for sent in ngram_text:
+            for ngram in sent:
+                if not isinstance(ngram, tuple):
+                    raise TypeError(
+                        "Ngram <{}> isn't a tuple, " "but {}".format(ngram, type(ngram))
+                    )
+                order = len(ngram)
+                pending = self._pending.get(order)
+                if pending is None:
+                    pending = self._pending[order] = array("i")
+                for word in ngram:
+                    wid = ids.get(word)
+                    pending.append(self._intern(word) if wid is None else wid)
+                if len(pending) >= self._buffer_size * order:
+                    self._flush(order)
+
+    def merge(self, other):
+        """Adds the counts of another `CompactNgramCounter` to this one.
+
+        Words new to this counter are interned in the order `other` first
+        saw them, so merging the counters of consecutive shards of a text,
+        in order, gives the same tables and ids as counting the whole text.
+
+        :param CompactNgramCounter other: Counter whose counts are added; it is not modified.
+        :return: This counter.
+        """
+        self._sync()
+        other._sync()
+        remap = np.array([self._intern(word) for word in other._words], dtype=np.int32)
+        for order in sorted(other._grams):
+            self._add(order, remap[other._grams[order]], other._values[order])
+        return self
+
+    def _flush(self, order):
+        pending = self._pending.pop(order)
+        grams = np.frombuffer(pending, dtype=np.intc).astype(np.int32)
+        grams = grams.reshape(-1, order).T
+        self._add(order, grams, np.ones(grams.shape[1], dtype=np.int64))
+
+    def _add(self, order, grams, values):
+        grams, values = _count_rows(grams, values)
+        if order in self._grams:
+            grams, values = _merge_rows(
+                self._grams[order], self._values[order], grams, values
+            )
+        self._grams[order], self._values[order] = grams, values
+        self._version += 1
+        self._derived.clear()
+
+    def _sync(self):
+        for order in list(self._pending):
+            self._flush(order)
+
+    def _span(self, order, ids):
+        """Range of the columns of `order` whose first words are `ids`."""
+        self._sync()
+        grams = self._grams.get(order)
+        if grams is None or ids is None:
+            return 0, 0
+        return _search(grams, ids)
+
+    def _suffixes(self, order):
+        """The table of `order` without its first word, sorted again."""
+        key = ("suffixes", order)
+        if key not in self._derived:
+            grams = self._grams[order][1:]
+            self._derived[key] = np.ascontiguousarray(grams[:, np.lexsort(grams[::-1])])
+        return self._derived[key]
+
+    @property
+    def continuations(self):
+        """Ngram type counts used by Kneser-Ney smoothing, see `NgramCounter.continuations`.
+
+        :rtype: CompactContinuationCounts
+        """
+        self._sync()
+        key = "continuations"
+        if key not in self._derived:
+            self._derived[key] = CompactContinuationCounts(self)
+        return self._derived[key]
+
+    def N(self):
+        """Returns grand total number of ngrams stored.
+
+        This includes ngrams from all orders, so some duplication is expected.
+        :rtype: int
+        """
+        self._sync()
+        return sum(int(values.sum()) for values in self._values.values())
+
+    def __getitem__(self, item):
+        """User-friendly access to ngram counts."""
+        if isinstance(item, int):
+            return self.unigrams if item == 1 else _OrderCounts(self, item)
+        elif isinstance(item, str):
+            return self.unigrams[item]
+        elif isinstance(item, Sequence):
+            return _ContextCounts(self, len(item) + 1, self._context_ids(item))
+
+    def __str__(self):
+        return "<{} with {} ngram orders and {} ngrams>".format(
+            self.__class__.__name__, len(self), self.N()
+        )
+
+    def __len__(self):
+        self._sync()
+        return len(self._grams.keys() | {1})
+
+    def __contains__(self, item):
+        self._sync()
+        return item == 1 or item in self._grams
+
+    def save(self, path):
+        """Writes the counts to `path` in a format that `load` can memory-map.
+
+        The file holds a JSON header with the interned words followed by the
+        raw tables, each aligned to 64 bytes. Words must be strings.
+
+        :param str path: Destination file.
+        """
+        self._sync()
+        tables, offset = [], 0
+        for order in sorted(self._grams):
+            grams = self._grams[order].astype("<i4", copy=False)
+            values = self._values[order].astype("<i8", copy=False)
+            entry = {"order": order, "types": grams.shape[1], "grams": offset}
+            offset = _aligned(offset + grams.nbytes)
+            entry["values"] = offset
+            offset = _aligned(offset + values.nbytes)
+            tables.append((entry, grams, values))
+
+        header = json.dumps(
+            {"words": self._words, "orders": [entry for entry, _, _ in tables]}
+        ).encode("utf-8")
+        start = _aligned(len(_MAGIC) + 8 + len(header))
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for entry, grams, values in tables:
+                for array_, relative in (
+                    (grams, entry["grams"]),
+                    (values, entry["values"]),
+                ):
+                    f.write(b"\0" * (start + relative - f.tell()))
+                    array_.tofile(f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Reopens counts written by `save`.
+
+        :param str path: File written by `save`.
+        :param bool mmap: Map the tables read-only instead of reading them into memory.
+        :rtype: CompactNgramCounter
+        :raises ValueError: if `path` was not written by `save`.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path!r} is not a saved {cls.__name__}")
+            size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(size).decode("utf-8"))
+        start = _aligned(len(_MAGIC) + 8 + size)
+
+        def read(dtype, offset, shape):
+            if mmap:
+                return np.asarray(
+                    np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+                )
+            count = int(np.prod(shape))
+            return np.fromfile(path, dtype=dtype, count=count, offset=offset).reshape(
+                shape
+            )
+
+        counter = cls()
+        for word in header["words"]:
+            counter._intern(word)
+        for entry in header["orders"]:
+            order, types = entry["order"], entry["types"]
+            counter._grams[order] = read("<i4", start + entry["grams"], (order, types))
+            counter._values[order] = read("<i8", start + entry["values"], (types,))
+        return counter
+
+
+class _ContextCounts(Mapping):
+    """Read-only `FreqDist`-like view of the words seen after one context."""
+
+    def __init__(self, counter, order, context):
+        self._counter = counter
+        self._order = order
+        self._context = context  # word ids, or None if a word was never seen
+        self._version = None
+
+    def _span(self):
+        counter = self._counter
+        counter._sync()
+        if self._version != counter._version:
+            self._lo, self._hi = counter._span(self._order, self._context)
+            self._total = None
+            self._version = counter._version
+        return self._lo, self._hi
+
+    def _words(self):
+        lo, hi = self._span()
+        if lo == hi:
+            return np.empty(0, dtype=np.int32)
+        return self._counter._grams[self._order][-1, lo:hi]
+
+    def __getitem__(self, word):
+        wid = self._counter._ids.get(word)
+        lo, hi = self._span()
+        if wid is None or lo == hi:
+            return 0
+        words = self._counter._grams[self._order][-1, lo:hi]
+        i = int(words.searchsorted(words.dtype.type(wid)))
+        if i < len(words) and words[i] == wid:
+            return int(self._counter._values[self._order][lo + i])
+        return 0
+
+    def __contains__(self, word):
+        return self[word] > 0
+
+    def get(self, word, default=None):
+        count = self[word]
+        return count if count else default
+
+    def __iter__(self):
+        words = self._counter._words
+        return (words[wid] for wid in self._words().tolist())
+
+    def __len__(self):
+        lo, hi = self._span()
+        return hi - lo
+
+    def items(self):
+        lo, hi = self._span()
+        words = self._counter._words
+        values = self._counter._values[self._order][lo:hi] if lo < hi else ()
+        return [
+            (words[wid], int(count))
+            for wid, count in zip(self._words().tolist(), list(values))
+        ]
+
+    def values(self):
+        return [count for _, count in self.items()]
+
+    def N(self):
+        """Total number of ngrams with this context."""
+        lo, hi = self._span()
+        if self._total is None:
+            self._total = (
+                int(self._counter._values[self._order][lo:hi].sum()) if lo < hi else 0
+            )
+        return self._total
+
+    def B(self):
+        """Number of distinct words seen after this context."""
+        return len(self)
+
+    def freq(self, word):
+        n = self.N()
+        return self[word] / n if n else 0
+
+    def most_common(self, n=None):
+        return sorted(self.items(), key=lambda item: -item[1])[:n]
+
+    def max(self):
+        return self.most_common(1)[0][0]
+
+    def __repr__(self):
+        return "<{} with {} samples and {} outcomes>".format(
+            self.__class__.__name__, self.B(), self.N()
+        )
+
+
+class _OrderCounts(Mapping):
+    """Read-only `ConditionalFreqDist`-like view of one ngram order."""
+
+    def __init__(self, counter, order):
+        self._counter = counter
+        self._order = order
+
+    def _grams(self):
+        self._counter._sync()
+        return self._counter._grams.get(self._order)
+
+    def __getitem__(self, context):
+        return _ContextCounts(
+            self._counter, self._order, self._counter._context_ids(context)
+        )
+
+    def __contains__(self, context):
+        return len(self[context]) > 0
+
+    def _starts(self):
+        grams = self._grams()
+        if grams is None:
+            return np.empty(0, dtype=np.intp)
+        contexts = grams[:-1]
+        changed = (contexts[:, 1:] != contexts[:, :-1]).any(axis=0)
+        return np.flatnonzero(np.concatenate(([True], changed)))
+
+    def __iter__(self):
+        grams, words = self._grams(), self._counter._words
+        for start in self._starts().tolist():
+            yield tuple(words[wid] for wid in grams[:-1, start].tolist())
+
+    def __len__(self):
+        return len(self._starts())
+
+    def conditions(self):
+        return list(self)
+
+    def N(self):
+        self._grams()
+        values = self._counter._values.get(self._order)
+        return 0 if values is None else int(values.sum())
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} with {len(self)} conditions>"
+
+
+class CompactContinuationCounts:
+    """`ContinuationCounts` answered by binary search over the counter's tables."""
+
+    def __init__(self, counter):
+        self._counter = counter
+
+    def preceding(self, word, context=tuple()):
+        """Count types of the form ``(*, context..., word)`` and ``(*, context..., *)``.
+
+        :rtype: tuple(int, int)
+        """
+        counter, order = self._counter, len(context) + 2
+        counter._sync()
+        context_ids = counter._context_ids(context)
+        if order not in counter._grams or context_ids is None:
+            return 0, 0
+        suffixes = counter._suffixes(order)
+        lo, hi = _search(suffixes, context_ids)
+        wid = counter._ids.get(word)
+        if lo == hi or wid is None:
+            return 0, hi - lo
+        # The rows of `suffixes` after the context hold the last word
+        word_lo, word_hi = _search(suffixes[len(context_ids) :], (wid,), lo, hi)
+        return word_hi - word_lo, hi - lo
+
+    def following(self, context):
+        """Count distinct words seen after `context`.
+
+        :rtype: int
+        """
+        counter = self._counter
+        lo, hi = counter._span(len(context) + 1, counter._context_ids(context))
+        return hi - lo
@@ -98,6 +98,7 @@ class NgramCounter:
         """
         self._counts = defaultdict(ConditionalFreqDist)
         self._counts[1] = self.unigrams = FreqDist()
+        self._continuations = None
 
         if ngram_text:
             self.update(ngram_text)
@@ -126,7 +127,73 @@ class NgramCounter:
                     continue
 
                 context, word = ngram[:-1], ngram[-1]
-                self[ngram_order][context][word] += 1
+                counts = self[ngram_order][context]
+                if self._continuations is not None and not counts[word]:
+                    self._continuations.add(ngram)
+                counts[word] += 1
+
+    def merge(self, other):
+        """Adds the counts of another `NgramCounter` to this one.
+
+        Merging the counters of consecutive shards of a text, in order, gives
+        the same counter as counting the whole text with `update`, including
+        the insertion order of every context and word. The operation is
+        associative, so shards can also be merged pairwise.
+
+        >>> from nltk.lm import NgramCounter
+        >>> counts = NgramCounter([[("a", "b"), ("a",)]])
+        >>> print(counts.merge(NgramCounter([[("a", "c"), ("a",)]])))
+        <NgramCounter with 2 ngram orders and 4 ngrams>
+        >>> sorted(counts[["a"]].items()), counts["a"]
+        ([('b', 1), ('c', 1)], 2)
+
+        :param NgramCounter other: Counter whose counts are added; it is not modified.
+        :return: This counter.
+        """
+        for order, cfd in other._counts.items():
+            if not cfd:
+                continue
+            if order == 1:
+                self.unigrams.update(cfd)
+                continue
+            mine = self._counts[order]
+            for context, counts in cfd.items():
+                target = mine[context]
+                if self._continuations is not None:
+                    for word, count in counts.items():
+                        if count > 0 and not target[word]:
+                            self._continuations.add(context + (word,))
+                target.update(counts)
+        return self
+
+    @property
+    def continuations(self):
+        """Ngram type counts used by Kneser-Ney smoothing.
+
+        Built from the current counts the first time it is accessed and kept
+        up to date by subsequent calls to `update`. Counts changed by assigning
+        to the underlying `FreqDist` objects directly are not tracked.
+
+        >>> from nltk.lm import NgramCounter
+        >>> counts = NgramCounter([[("a", "b"), ("c", "b"), ("a", "c")]])
+        >>> counts.continuations.preceding("b")
+        (2, 3)
+        >>> counts.continuations.following(("a",))
+        2
+
+        :rtype: ContinuationCounts
+        """
+        if self._continuations is None:
+            continuations = ContinuationCounts()
+            for order, cfd in self._counts.items():
+                if order < 2:
+                    continue
+                for context, counts in cfd.items():
+                    for word, count in counts.items():
+                        if count > 0:
+                            continuations.add(context + (word,))
+            self._continuations = continuations
+        return self._continuations
 
     def N(self):
         """Returns grand total number of ngrams stored.
@@ -161,3 +228,49 @@ class NgramCounter:
 
     def __contains__(self, item):
         return item in self._counts
+
+
+class ContinuationCounts:
+    """Counts of distinct ngram types, as needed by Kneser-Ney smoothing.
+
+    For an ngram type ``(w_1, ..., w_n)`` this tracks how many distinct words
+    precede the rest of it and how many distinct words follow its context, so
+    that these numbers can be looked up instead of being recomputed from all
+    higher-order counts.
+    """
+
+    def __init__(self):
+        # order -> middle context -> word -> number of distinct words preceding "middle word"
+        self._preceding = defaultdict(ConditionalFreqDist)
+        # order -> context -> number of distinct words following it
+        self._following = defaultdict(FreqDist)
+
+    def add(self, ngram):
+        """Records a new ngram type; must be called once per type."""
+        order = len(ngram)
+        self._preceding[order][ngram[1:-1]][ngram[-1]] += 1
+        self._following[order][ngram[:-1]] += 1
+
+    def preceding(self, word, context=tuple()):
+        """Count types of the form ``(*, context..., word)`` and ``(*, context..., *)``.
+
+        :param str word: The last word of the ngram.
+        :param tuple(str) context: The words between the wildcard and `word`.
+        :return: Number of distinct words seen before ``context + (word,)`` and
+            number of distinct ngram types with ``context`` in the middle.
+        :rtype: tuple(int, int)
+        """
+        preceding = self._preceding.get(len(context) + 2)
+        counts = preceding.get(context) if preceding is not None else None
+        if counts is None:
+            return 0, 0
+        return counts[word], counts.N()
+
+    def following(self, context):
+        """Count distinct words seen after `context`.
+
+        :param tuple(str) context: Context of at least one word.
+        :rtype: int
+        """
+        following = self._following.get(len(context) + 1)
+        return following[context] if following is not None else 0
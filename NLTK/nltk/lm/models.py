@@ -26,6 +26,10 @@ class MLE(LanguageModel):
         """
         return self.context_counts(context).freq(word)
 
+    def unmasked_score_many(self, words, context=None, cache=None):
+        counts = self.context_counts(context)
+        return [counts.freq(word) for word in words]
+
 
 class Lidstone(LanguageModel):
     """Provides Lidstone-smoothed scores.
@@ -49,6 +53,11 @@ class Lidstone(LanguageModel):
         norm_count = counts.N()
         return (word_count + self.gamma) / (norm_count + len(self.vocab) * self.gamma)
 
+    def unmasked_score_many(self, words, context=None, cache=None):
+        counts = self.context_counts(context)
+        norm_count = counts.N() + len(self.vocab) * self.gamma
+        return [(counts[word] + self.gamma) / norm_count for word in words]
+
 
 class Laplace(Lidstone):
     """Implements Laplace (add one) smoothing.
@@ -85,6 +94,36 @@ class StupidBackoff(LanguageModel):
         else:
             return self.alpha * self.unmasked_score(word, context[1:])
 
+    def unmasked_score_many(self, words, context=None, cache=None):
+        cache = {} if cache is None else cache
+        context = tuple(context) if context else ()
+        missing = [
+            word for word in dict.fromkeys(words) if (context, word) not in cache
+        ]
+        if missing:
+            if not context:
+                counts = self.counts.unigrams
+                scores = [counts.freq(word) for word in missing]
+            else:
+                counts = self.context_counts(context)
+                norm_count = counts.N()
+                unseen = [word for word in missing if not counts[word] > 0]
+                lower = dict(
+                    zip(unseen, self.unmasked_score_many(unseen, context[1:], cache))
+                )
+                scores = [
+                    (
+                        self.alpha * lower[word]
+                        if word in lower
+                        else counts[word] / norm_count
+                    )
+                    for word in missing
+                ]
+            cache.update(
+                ((context, word), score) for word, score in zip(missing, scores)
+            )
+        return [cache[(context, word)] for word in words]
+
 
 class InterpolatedLanguageModel(LanguageModel):
     """Logic common to all interpolated language models.
@@ -111,6 +150,30 @@ class InterpolatedLanguageModel(LanguageModel):
             alpha, gamma = self.estimator.alpha_gamma(word, context)
         return alpha + gamma * self.unmasked_score(word, context[1:])
 
+    def unmasked_score_many(self, words, context=None, cache=None):
+        cache = {} if cache is None else cache
+        context = tuple(context) if context else ()
+        missing = [
+            word for word in dict.fromkeys(words) if (context, word) not in cache
+        ]
+        if missing:
+            if not context:
+                scores = [self.estimator.unigram_score(word) for word in missing]
+            elif not self.counts[context]:
+                scores = self.unmasked_score_many(missing, context[1:], cache)
+            else:
+                lower = self.unmasked_score_many(missing, context[1:], cache)
+                scores = [
+                    alpha + gamma * lower_score
+                    for (alpha, gamma), lower_score in zip(
+                        self.estimator.alpha_gamma_many(missing, context), lower
+                    )
+                ]
+            cache.update(
+                ((context, word), score) for word, score in zip(missing, scores)
+            )
+        return [cache[(context, word)] for word in words]
+
 
 class WittenBellInterpolated(InterpolatedLanguageModel):
     """Interpolated version of Witten-Bell smoothing."""
@@ -44,6 +44,11 @@ class WittenBell(Smoothing):
         gamma = self._gamma(context)
         return (1.0 - gamma) * alpha, gamma
 
+    def alpha_gamma_many(self, words, context):
+        counts = self.counts[context]
+        gamma = self._gamma(context)
+        return [((1.0 - gamma) * counts.freq(word), gamma) for word in words]
+
     def _gamma(self, context):
         n_plus = _count_values_gt_zero(self.counts[context])
         return n_plus / (n_plus + self.counts[context].N())
@@ -67,6 +72,14 @@ class AbsoluteDiscounting(Smoothing):
         gamma = self._gamma(context)
         return alpha, gamma
 
+    def alpha_gamma_many(self, words, context):
+        counts = self.counts[context]
+        norm_count = counts.N()
+        gamma = self._gamma(context)
+        return [
+            (max(counts[word] - self.discount, 0) / norm_count, gamma) for word in words
+        ]
+
     def _gamma(self, context):
         n_plus = _count_values_gt_zero(self.counts[context])
         return (self.discount * n_plus) / self.counts[context].N()
@@ -98,30 +111,43 @@ class KneserNey(Smoothing):
         return word_continuation_count / total_count
 
     def alpha_gamma(self, word, context):
-        prefix_counts = self.counts[context]
-        word_continuation_count, total_count = (
-            (prefix_counts[word], prefix_counts.N())
-            if len(context) + 1 == self._order
-            else self._continuation_counts(word, context)
-        )
+        if len(context) + 1 == self._order:
+            prefix_counts = self.counts[context]
+            word_continuation_count = prefix_counts[word]
+            total_count = prefix_counts.N()
+        else:
+            word_continuation_count, total_count = self._continuation_counts(
+                word, context
+            )
         alpha = max(word_continuation_count - self.discount, 0.0) / total_count
-        gamma = self.discount * _count_values_gt_zero(prefix_counts) / total_count
+        following = self.counts.continuations.following(context)
+        gamma = self.discount * following / total_count
         return alpha, gamma
 
+    def alpha_gamma_many(self, words, context):
+        if len(context) + 1 == self._order:
+            prefix_counts = self.counts[context]
+            total_count = prefix_counts.N()
+            counts = [(prefix_counts[word], total_count) for word in words]
+        else:
+            counts = [self._continuation_counts(word, context) for word in words]
+        following = self.counts.continuations.following(context)
+        return [
+            (
+                max(word_continuation_count - self.discount, 0.0) / total_count,
+                self.discount * following / total_count,
+            )
+            for word_continuation_count, total_count in counts
+        ]
+
     def _continuation_counts(self, word, context=tuple()):
         """Count continuations that end with context and word.
 
         Continuations track unique ngram "types", regardless of how many
         instances were observed for each "type".
         This is different than raw ngram counts which track number of instances.
+
+        The counts come from `NgramCounter.continuations`, which is built once
+        and then kept up to date as the counter is updated.
         """
-        higher_order_ngrams_with_context = (
-            counts
-            for prefix_ngram, counts in self.counts[len(context) + 2].items()
-            if prefix_ngram[1:] == context
-        )
-        higher_order_ngrams_with_word_count, total = 0, 0
-        for counts in higher_order_ngrams_with_context:
-            higher_order_ngrams_with_word_count += int(counts[word] > 0)
-            total += _count_values_gt_zero(counts)
-        return higher_order_ngrams_with_word_count, total
+        return self.counts.continuations.preceding(word, context)
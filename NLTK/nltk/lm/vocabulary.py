@@ -161,6 +161,24 @@ class Vocabulary:
         self.counts.update(*counter_args, **counter_kwargs)
         self._len = sum(1 for _ in self)
 
+    def merge(self, other):
+        """Adds the counts of another vocabulary to this one.
+
+        The cutoff and unknown label of this vocabulary are kept. Merging the
+        vocabularies of consecutive shards of a text, in order, gives the same
+        counts, in the same order, as counting the whole text.
+
+        >>> from nltk.lm import Vocabulary
+        >>> vocab = Vocabulary(["a", "b"], unk_cutoff=2)
+        >>> sorted(vocab.merge(Vocabulary(["a", "c"])))
+        ['<UNK>', 'a']
+
+        :param Vocabulary other: Vocabulary whose counts are added; it is not modified.
+        :return: This vocabulary.
+        """
+        self.update(other.counts)
+        return self
+
     def lookup(self, words):
         """Look up one or more words in the vocabulary.
 
@@ -13,6 +13,10 @@ NLTK Metrics
 Classes and methods for scoring processing modules.
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.metrics" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.metrics.agreement import AnnotationTask
 from nltk.metrics.aline import align
 from nltk.metrics.association import (
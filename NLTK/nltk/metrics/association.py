@@ -22,12 +22,15 @@ _product = lambda s: reduce(lambda x, y: x * y, s)
 
 _SMALL = 1e-20
 
-try:
-    from scipy.stats import fisher_exact
-except ImportError:
 
-    def fisher_exact(*_args, **_kwargs):
-        raise NotImplementedError
+def fisher_exact(*args, **kwargs):
+    # scipy.stats takes most of a second to import: only import it when a
+    # Fisher score is asked for, rather than whenever nltk.metrics is imported
+    try:
+        from scipy.stats import fisher_exact
+    except ImportError as e:
+        raise NotImplementedError from e
+    return fisher_exact(*args, **kwargs)
 
 
 ### Indices to marginals arguments:
@@ -11,11 +11,6 @@ from functools import reduce
 from math import fabs
 from random import shuffle
 
-try:
-    from scipy.stats.stats import betai
-except ImportError:
-    betai = None
-
 from nltk.util import LazyConcatenation, LazyMap
 
 
@@ -198,6 +193,12 @@ def approxrand(a, b, **kwargs):
 
     if verbose:
         print("significance: %f" % significance)
+        # Imported here: importing scipy.stats takes most of a second, and
+        # recent scipy versions no longer have betai
+        try:
+            from scipy.stats.stats import betai
+        except ImportError:
+            betai = None
         if betai:
             for phi in [0.01, 0.05, 0.10, 0.15, 0.25, 0.50]:
                 print(f"prob(phi<={phi:f}): {betai(c, shuffles, phi):f}")
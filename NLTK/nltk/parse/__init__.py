@@ -43,6 +43,10 @@ three sub-modules for specialized kinds of parsing:
     associates a probability with each parse.
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.parse" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.parse.api import ParserI
 from nltk.parse.bllip import BllipParser
 from nltk.parse.chart import (
@@ -12,14 +12,6 @@ from copy import deepcopy
 from operator import itemgetter
 from os import remove
 
-try:
-    from numpy import array
-    from scipy import sparse
-    from sklearn import svm
-    from sklearn.datasets import load_svmlight_file
-except ImportError:
-    pass
-
 from nltk.parse import DependencyEvaluator, DependencyGraph, ParserI
 
 
@@ -509,6 +501,10 @@ class TransitionParser(ParserI):
         :param modelfile : file name to save the trained model
         :type modelfile : str
         """
+        # scikit-learn is imported here rather than with the module, which
+        # nltk.parse (and so nltk.corpus) imports whether or not it is used
+        from sklearn import svm
+        from sklearn.datasets import load_svmlight_file
 
         try:
             input_file = tempfile.NamedTemporaryFile(
@@ -551,6 +547,9 @@ class TransitionParser(ParserI):
         :type modelfile: str
         :return: list (DependencyGraph) with the 'head' and 'rel' information
         """
+        from numpy import array
+        from scipy import sparse
+
         result = []
         # First load the model
         model = pickle.load(open(modelFile, "rb"))
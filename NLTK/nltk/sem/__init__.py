@@ -41,6 +41,10 @@ is then created with domain and valuation as parameters.
     >>> m = Model(dom, val)
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.sem" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.sem.boxer import Boxer
 from nltk.sem.drt import DRS, DrtExpression
 from nltk.sem.evaluate import (
@@ -21,6 +21,10 @@ morphological rules, and part-of-speech and sense ambiguities
 StemmerI defines a standard interface for stemmers.
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.stem" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.stem.api import StemmerI
 from nltk.stem.arlstem import ARLSTem
 from nltk.stem.arlstem2 import ARLSTem2
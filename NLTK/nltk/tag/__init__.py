@@ -65,6 +65,20 @@ For more information, please consult chapter 5 of the NLTK Book.
 isort:skip_file
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.tag" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
+# Private names, so that ``from nltk.tag import *`` (and the top-level nltk
+# namespace) does not pick them up
+import os as _os
+import tempfile as _tempfile
+import threading as _threading
+from collections import deque as _deque
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from functools import partial as _partial
+from itertools import islice as _islice
+
 from nltk.tag.api import TaggerI
 from nltk.tag.util import str2tuple, tuple2str, untag
 from nltk.tag.sequential import (
@@ -90,6 +104,7 @@ from nltk.tag.senna import SennaTagger, SennaChunkTagger, SennaNERTagger
 from nltk.tag.mapping import tagset_mapping, map_tag
 from nltk.tag.crf import CRFTagger
 from nltk.tag.perceptron import PerceptronTagger
+from nltk.tag.perceptron import MappedAveragedPerceptron as _MappedAveragedPerceptron
 
 from nltk.data import load, find
 
@@ -98,14 +113,28 @@ RUS_PICKLE = (
 )
 
 
+# Taggers loaded by `_get_tagger`, shared by all `pos_tag` calls in the process
+_taggers = {}
+_taggers_lock = _threading.Lock()
+
+# Paths of the taggers written in the mapped format for `pos_tag_sents`
+# workers, in a temporary directory that is removed at exit
+_mapped_models = {}
+_mapped_dir = None
+
+
 def _get_tagger(lang=None):
-    if lang == "rus":
-        tagger = PerceptronTagger(False)
-        ap_russian_model_loc = "file:" + str(find(RUS_PICKLE))
-        tagger.load(ap_russian_model_loc)
-    else:
-        tagger = PerceptronTagger()
-    return tagger
+    with _taggers_lock:
+        tagger = _taggers.get(lang)
+        if tagger is None:
+            if lang == "rus":
+                tagger = PerceptronTagger(False)
+                ap_russian_model_loc = "file:" + str(find(RUS_PICKLE))
+                tagger.load(ap_russian_model_loc)
+            else:
+                tagger = PerceptronTagger()
+            _taggers[lang] = tagger
+        return tagger
 
 
 def _pos_tag(tokens, tagset=None, tagger=None, lang=None):
@@ -166,19 +195,87 @@ def pos_tag(tokens, tagset=None, lang="eng"):
     return _pos_tag(tokens, tagset, tagger, lang)
 
 
-def pos_tag_sents(sentences, tagset=None, lang="eng"):
+def pos_tag_sents(sentences, tagset=None, lang="eng", workers=1, chunk_size=1000):
     """
     Use NLTK's currently recommended part of speech tagger to tag the
     given list of sentences, each consisting of a list of tokens.
 
+    With ``workers`` other than 1, chunks of ``chunk_size`` sentences are
+    tagged by a pool of worker processes. Each worker memory-maps the model
+    once, when it starts, from the file of the parent's tagger if it is
+    already mapped, or else from a copy that the parent writes to a temporary
+    file in the format of `PerceptronTagger.save_mapped` the first time.
+    Whatever the start method, the workers neither unpickle nor copy the
+    model: they share the pages of one read-only file. Only sentences and
+    tagged sentences go through the pool, and the output keeps the order
+    of the input.
+
     :param sentences: List of sentences to be tagged
     :type sentences: list(list(str))
     :param tagset: the tagset to be used, e.g. universal, wsj, brown
     :type tagset: str
     :param lang: the ISO 639 code of the language, e.g. 'eng' for English, 'rus' for Russian
     :type lang: str
+    :param workers: Number of worker processes; all CPUs if None.
+    :type workers: int or None
+    :param chunk_size: Number of sentences sent to a worker at a time.
+    :type chunk_size: int
     :return: The list of tagged sentences
     :rtype: list(list(tuple(str, str)))
     """
     tagger = _get_tagger(lang)
+    workers = workers or _os.cpu_count() or 1
+    if workers == 1:
+        return [_pos_tag(sent, tagset, tagger, lang) for sent in sentences]
+
+    sentences = iter(sentences)
+    chunks = iter(lambda: list(_islice(sentences, chunk_size)), [])
+    tag_chunk = _partial(_pos_tag_chunk, tagset=tagset, lang=lang)
+    tagged = []
+    with _ProcessPoolExecutor(
+        workers, initializer=_load_mapped_tagger, initargs=(lang, _mapped_model(lang))
+    ) as executor:
+        # At most two chunks per worker are in flight
+        pending = _deque()
+        for chunk in chunks:
+            pending.append(executor.submit(tag_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                tagged.extend(pending.popleft().result())
+        while pending:
+            tagged.extend(pending.popleft().result())
+    return tagged
+
+
+def _mapped_model(lang):
+    """
+    Return the path of the tagger for ``lang`` in the mapped format, writing
+    it to a temporary file the first time if the tagger is not mapped.
+    """
+    tagger = _get_tagger(lang)
+    if isinstance(tagger.model, _MappedAveragedPerceptron):
+        return tagger.model.path
+    global _mapped_dir
+    with _taggers_lock:
+        path = _mapped_models.get(lang)
+        if path is None:
+            if _mapped_dir is None:
+                _mapped_dir = _tempfile.TemporaryDirectory(prefix="nltk_tagger_")
+            path = _os.path.join(_mapped_dir.name, f"{lang}.bin")
+            tagger.save_mapped(path)
+            _mapped_models[lang] = path
+        return path
+
+
+def _load_mapped_tagger(lang, path):
+    """Map the tagger of a `pos_tag_sents` worker, when the worker starts."""
+    tagger = PerceptronTagger(load=False)
+    tagger.load_mapped(path)
+    # Replaces the tagger a forked worker inherits, whose dict-of-dicts
+    # weights would be copied page by page as reference counts change
+    _taggers[lang] = tagger
+
+
+def _pos_tag_chunk(sentences, tagset=None, lang=None):
+    """Tag `sentences` in a `pos_tag_sents` worker."""
+    tagger = _taggers[lang]
     return [_pos_tag(sent, tagset, tagger, lang) for sent in sentences]
@@ -8,10 +8,18 @@
 #
 # This module is provided under the terms of the MIT License.
 
+import json
 import logging
+import mmap
+import os
 import pickle
 import random
+import sys
+import zlib
+from array import array
 from collections import defaultdict
+from collections.abc import Mapping
+from itertools import islice
 
 from nltk import jsontags
 from nltk.data import find, load
@@ -23,6 +31,10 @@ except ImportError:
     pass
 
 PICKLE = "averaged_perceptron_tagger.pickle"
+MAPPED = "averaged_perceptron_tagger.bin"
+
+_MAGIC = b"NLTKAPT1"
+_ALIGN = 64
 
 
 @jsontags.register_tag
@@ -49,14 +61,55 @@ class AveragedPerceptron:
         self._tstamps = defaultdict(int)
         # Number of instances seen
         self.i = 0
+        # Dense copy of the weights made by `compile`
+        self._compiled = None
 
     def _softmax(self, scores):
         s = np.fromiter(scores.values(), dtype=float)
         exps = np.exp(s)
         return exps / np.sum(exps)
 
+    def compile(self, dtype="float32"):
+        """Freeze the current weights for faster prediction.
+
+        Feature strings are mapped to row ids of a dense
+        ``[n_features, n_classes]`` matrix, so that `predict` only has to
+        gather and sum a few rows and take the argmax. The predicted labels
+        are the same as without compiling, including ties, which go to the
+        alphabetically last label: whenever the two best scores are too close
+        to be told apart at the precision of the matrix, the token is scored
+        again from the weight dicts.
+
+        Training or replacing `weights` drops the compiled copy again.
+
+        :param dtype: Data type of the weight matrix, ``float32`` or ``float64``.
+        :return: This perceptron.
+        """
+        # Reverse alphabetical order, so that the first maximum is the label
+        # the dict path picks among ties
+        classes = sorted(self.classes, reverse=True)
+        columns = {label: column for column, label in enumerate(classes)}
+        rows = {feat: row for row, feat in enumerate(self.weights)}
+        matrix = np.zeros((len(rows), len(classes)), dtype=dtype)
+        for feat, row in rows.items():
+            for label, weight in self.weights[feat].items():
+                if label in columns:
+                    matrix[row, columns[label]] = weight
+        self._compiled = _CompiledWeights(self.weights, rows, matrix, classes)
+        return self
+
     def predict(self, features, return_conf=False):
         """Dot-product the features and current weights and return the best label."""
+        compiled = getattr(self, "_compiled", None)
+        if (
+            compiled is not None
+            and compiled.weights is self.weights
+            and not return_conf
+        ):
+            best_label = compiled.predict(features)
+            if best_label is not None:
+                return best_label, None
+
         scores = defaultdict(float)
         for feat, value in features.items():
             if feat not in self.weights or value == 0:
@@ -84,6 +137,7 @@ class AveragedPerceptron:
         self.i += 1
         if truth == guess:
             return None
+        self._compiled = None
         for f in features:
             weights = self.weights.setdefault(f, {})
             upd_feat(truth, f, weights.get(truth, 0.0), 1.0)
@@ -91,6 +145,7 @@ class AveragedPerceptron:
 
     def average_weights(self):
         """Average weights from all iterations."""
+        self._compiled = None
         for feat, weights in self.weights.items():
             new_feat_weights = {}
             for clas, weight in weights.items():
@@ -119,6 +174,363 @@ class AveragedPerceptron:
         return cls(obj)
 
 
+class _CompiledWeights:
+    """Dense copy of `AveragedPerceptron.weights`, made by `AveragedPerceptron.compile`."""
+
+    def __init__(self, weights, rows, matrix, classes):
+        self.weights = weights
+        self.rows = rows
+        self.matrix = matrix
+        self.classes = classes
+        self.max_weight = float(np.abs(matrix).max(initial=0))
+        # Relative rounding error of one stored weight or one addition
+        self.epsilon = float(np.finfo(matrix.dtype).eps)
+
+    def predict(self, features):
+        """The best label, or None if the dict path has to decide."""
+        if not self.classes:
+            return None
+        rows, values = [], []
+        weighted = False
+        for feat, value in features.items():
+            row = self.rows.get(feat)
+            if row is not None and value != 0:
+                rows.append(row)
+                values.append(value)
+                weighted = weighted or value != 1
+        if not rows:
+            # Every score is 0
+            return self.classes[0]
+
+        gathered = self.matrix.take(rows, axis=0)
+        if weighted:
+            gathered *= np.asarray(values, dtype=self.matrix.dtype)[:, None]
+        scores = np.add.reduce(gathered)
+        best = int(scores.argmax())
+        if len(scores) > 1:
+            # Bound on how far each score can be from the dict path's sum
+            magnitude = self.max_weight * sum(map(abs, values))
+            tolerance = 2 * (len(rows) + 2) * self.epsilon * magnitude
+            runner_up, best_score = np.sort(scores)[-2:]
+            if best_score - runner_up <= tolerance:
+                return None
+        return self.classes[best]
+
+
+class _ArrayPerceptron:
+    """`AveragedPerceptron` training state in arrays, used by
+    `PerceptronTagger.train_streaming`.
+
+    Rows are feature ids, in order of their first update, and columns are
+    class ids, in reverse alphabetical order. As weights only change by
+    whole numbers while training, scores and totals are exact integers, and
+    a feature's totals can be brought up to date for all classes at once.
+    The first update of each weight is also recorded, so the averaged
+    weights list a feature's classes in the same order as `AveragedPerceptron`.
+    """
+
+    def __init__(self, classes, capacity=1 << 12):
+        self.classes = sorted(classes, reverse=True)
+        self.class_ids = {label: cid for cid, label in enumerate(self.classes)}
+        self.feature_ids = {}
+        # Number of instances seen
+        self.i = 0
+        self.weights = np.zeros((capacity, len(self.classes)), dtype=np.int32)
+        self.totals = np.zeros((capacity, len(self.classes)), dtype=np.int64)
+        # Instance at which the totals of a feature were last brought up to date
+        self.tstamps = np.zeros(capacity, dtype=np.int64)
+        # 2 * instance (+ 1 for the guess) of the first update of a weight, or 0
+        self.first = np.zeros((capacity, len(self.classes)), dtype=np.int64)
+
+    def predict(self, features):
+        """The best label, with ties going to the alphabetically last one."""
+        rows, values = [], []
+        for feat, value in features.items():
+            row = self.feature_ids.get(feat)
+            if row is not None and value != 0:
+                rows.append(row)
+                values.append(value)
+        if not rows:
+            return self.classes[0], None
+        scores = np.dot(values, self.weights.take(rows, axis=0))
+        return self.classes[int(scores.argmax())], None
+
+    def update(self, truth, guess, features):
+        """Update the feature weights."""
+        self.i += 1
+        if truth == guess:
+            return None
+        rows = np.fromiter(map(self._feature_id, features), dtype=np.intp)
+        weights = self.weights[rows]
+        self.totals[rows] += (self.i - self.tstamps[rows])[:, None] * weights
+        self.tstamps[rows] = self.i
+        for cid, delta, stamp in (
+            (self.class_ids[truth], 1, 2 * self.i),
+            (self.class_ids[guess], -1, 2 * self.i + 1),
+        ):
+            self.weights[rows, cid] += delta
+            first = self.first[rows, cid]
+            self.first[rows, cid] = np.where(first == 0, stamp, first)
+
+    def _feature_id(self, feat):
+        row = self.feature_ids.get(feat)
+        if row is None:
+            row = self.feature_ids[feat] = len(self.feature_ids)
+            if row == len(self.tstamps):
+                self._grow()
+        return row
+
+    def _grow(self):
+        for name in ("weights", "totals", "tstamps", "first"):
+            array = getattr(self, name)
+            grown = np.zeros((2 * len(array),) + array.shape[1:], dtype=array.dtype)
+            grown[: len(array)] = array
+            setattr(self, name, grown)
+
+    def average_weights(self, chunk_size=1 << 14):
+        """Averaged weights from all iterations, as an `AveragedPerceptron`
+        weights dict."""
+        averaged_weights = {}
+        features = list(self.feature_ids)
+        for start in range(0, len(features), chunk_size):
+            stop = min(start + chunk_size, len(features))
+            totals = (
+                self.totals[start:stop]
+                + (self.i - self.tstamps[start:stop])[:, None]
+                * self.weights[start:stop]
+            )
+            first = self.first[start:stop]
+            for feat, row, row_first in zip(features[start:stop], totals, first):
+                new_feat_weights = {}
+                cids = np.flatnonzero(row)
+                # In order of their first update, like the dicts of AveragedPerceptron
+                for cid in cids[np.argsort(row_first[cids], kind="stable")]:
+                    averaged = round(int(row[cid]) / self.i, 3)
+                    if averaged:
+                        new_feat_weights[self.classes[cid]] = averaged
+                averaged_weights[feat] = new_feat_weights
+        return averaged_weights
+
+
+@jsontags.register_tag
+class MappedAveragedPerceptron:
+    """Read-only `AveragedPerceptron` weights in a memory-mapped file.
+
+    The file holds a JSON header with the tags and the tag dictionary,
+    followed by flat tables: the UTF-8 feature strings, an open-addressing
+    hash table from feature string to row, and the (tag, weight) entries of
+    every row. Opening it only reads the header, so it takes about the same
+    time whatever the size of the model, and processes that map the same
+    file share its pages. Pickling only stores the path.
+
+    `predict` adds up the weights in the same order as
+    `AveragedPerceptron.predict`, so it returns the same labels and
+    confidences.
+    """
+
+    json_tag = "nltk.tag.perceptron.MappedAveragedPerceptron"
+
+    def __init__(self, path):
+        """Map the model file at ``path``, written by `save`.
+
+        :param path: A file path, or an NLTK data path found with `find`.
+        :raises ValueError: if the file was not written by `save`.
+        """
+        if not os.path.exists(path):
+            path = str(find(path))
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path!r} is not a saved {type(self).__name__}")
+            size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(size).decode("utf-8"))
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        start = _aligned(len(_MAGIC) + 8 + size)
+        tables = {}
+        for name, typecode, offset, count in header["tables"]:
+            if name == "strings":
+                # Slices of the mmap are bytes, which compare faster
+                self._strings_start = start + offset
+            view = memoryview(self._buffer)[start + offset :]
+            view = view[: count * array(typecode).itemsize]
+            if sys.byteorder == "big" and typecode != "B":
+                swapped = array(typecode, view.tobytes())
+                swapped.byteswap()
+                view = memoryview(swapped)
+            tables[name] = view.cast(typecode)
+        self._strings = tables["strings"]
+        self._offsets = tables["offsets"]
+        self._slots = tables["slots"]
+        self._indptr = tables["indptr"]
+        self._labels = tables["labels"]
+        self._weights = tables["weights"]
+        self._label_names = header["labels"]
+        self.classes = set(header["classes"])
+        self.tagdict = header["tagdict"]
+        self.weights = _MappedWeights(self)
+
+    @staticmethod
+    def save(weights, path, tagdict=None, classes=()):
+        """Write `AveragedPerceptron` weights to ``path`` in the mapped format.
+
+        :param weights: The dict-of-dicts weights of an `AveragedPerceptron`,
+            keyed by feature strings.
+        :param path: Destination file.
+        :param tagdict: The tag dictionary of the tagger.
+        :param classes: The tags of the tagger.
+        """
+        labels = sorted(set().union(*map(set, weights.values())))
+        label_ids = {label: i for i, label in enumerate(labels)}
+        strings, offsets = bytearray(), array("q", [0])
+        indptr, entry_labels, entry_weights = array("q", [0]), array("H"), array("d")
+        slots = array("i", [-1]) * max(8, 1 << (2 * len(weights)).bit_length())
+        mask = len(slots) - 1
+        for row, (feat, feat_weights) in enumerate(weights.items()):
+            key = feat.encode("utf-8")
+            strings += key
+            offsets.append(len(strings))
+            for label, weight in feat_weights.items():
+                entry_labels.append(label_ids[label])
+                entry_weights.append(weight)
+            indptr.append(len(entry_weights))
+            slot = zlib.crc32(key) & mask
+            while slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            slots[slot] = row
+
+        tables, offset = [], 0
+        for name, table in (
+            ("strings", array("B", strings)),
+            ("offsets", offsets),
+            ("slots", slots),
+            ("indptr", indptr),
+            ("labels", entry_labels),
+            ("weights", entry_weights),
+        ):
+            if sys.byteorder == "big":
+                table.byteswap()
+            tables.append(((name, table.typecode, offset, len(table)), table))
+            offset = _aligned(offset + len(table) * table.itemsize)
+        header = json.dumps(
+            {
+                "classes": sorted(classes),
+                "labels": labels,
+                "tagdict": tagdict or {},
+                "tables": [entry for entry, _ in tables],
+            }
+        ).encode("utf-8")
+        start = _aligned(len(_MAGIC) + 8 + len(header))
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for (_, _, offset, _), table in tables:
+                f.write(b"\0" * (start + offset - f.tell()))
+                table.tofile(f)
+
+    def _row(self, feat):
+        """The row of ``feat``, or None if it has no weights."""
+        key = feat.encode("utf-8")
+        slots, offsets, buffer = self._slots, self._offsets, self._buffer
+        start = self._strings_start
+        mask = len(slots) - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            row = slots[slot]
+            if row < 0:
+                return None
+            if buffer[start + offsets[row] : start + offsets[row + 1]] == key:
+                return row
+            slot = (slot + 1) & mask
+
+    def _row_weights(self, row):
+        labels, weights, names = self._labels, self._weights, self._label_names
+        return [
+            (names[labels[j]], weights[j])
+            for j in range(self._indptr[row], self._indptr[row + 1])
+        ]
+
+    _softmax = AveragedPerceptron._softmax
+
+    def predict(self, features, return_conf=False):
+        """Dot-product the features and current weights and return the best label."""
+        indptr, labels, weights = self._indptr, self._labels, self._weights
+        names = self._label_names
+        scores = defaultdict(float)
+        for feat, value in features.items():
+            if value == 0:
+                continue
+            row = self._row(feat)
+            if row is None:
+                continue
+            for j in range(indptr[row], indptr[row + 1]):
+                scores[names[labels[j]]] += value * weights[j]
+
+        # Do a secondary alphabetic sort, for stability
+        best_label = max(self.classes, key=lambda label: (scores[label], label))
+        # compute the confidence
+        conf = max(self._softmax(scores)) if return_conf == True else None
+
+        return best_label, conf
+
+    def __reduce__(self):
+        return type(self), (self.path,)
+
+    def encode_json_obj(self):
+        return {"path": self.path}
+
+    @classmethod
+    def decode_json_obj(cls, obj):
+        return cls(obj["path"])
+
+
+class _MappedWeights(Mapping):
+    """Read-only dict-of-dicts view of `MappedAveragedPerceptron` weights."""
+
+    def __init__(self, model):
+        self._model = model
+
+    def __getitem__(self, feat):
+        row = self._model._row(feat) if isinstance(feat, str) else None
+        if row is None:
+            raise KeyError(feat)
+        return dict(self._model._row_weights(row))
+
+    def __contains__(self, feat):
+        return isinstance(feat, str) and self._model._row(feat) is not None
+
+    def __iter__(self):
+        strings, offsets = self._model._strings, self._model._offsets
+        for row in range(len(self)):
+            yield strings[offsets[row] : offsets[row + 1]].tobytes().decode("utf-8")
+
+    def __len__(self):
+        return len(self._model._offsets) - 1
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _shuffled_blocks(sentences, block_size):
+    """Yield lists of ``block_size`` consecutive sentences, each shuffled.
+
+    The blocks are visited in random order when ``sentences`` supports
+    ``len`` and slicing, and in order otherwise.
+    """
+    try:
+        starts = list(range(0, len(sentences), block_size))
+    except TypeError:
+        sentences = iter(sentences)
+        blocks = iter(lambda: list(islice(sentences, block_size)), [])
+    else:
+        random.shuffle(starts)
+        blocks = (list(sentences[start : start + block_size]) for start in starts)
+    for block in blocks:
+        random.shuffle(block)
+        yield block
+
+
 @jsontags.register_tag
 class PerceptronTagger(TaggerI):
 
@@ -157,16 +569,20 @@ class PerceptronTagger(TaggerI):
 
     def __init__(self, load=True):
         """
-        :param load: Load the pickled model upon instantiation.
+        :param load: Load the pretrained model upon instantiation, preferring
+            the memory-mapped one if it is installed.
         """
         self.model = AveragedPerceptron()
         self.tagdict = {}
         self.classes = set()
         if load:
-            AP_MODEL_LOC = "file:" + str(
-                find("taggers/averaged_perceptron_tagger/" + PICKLE)
-            )
-            self.load(AP_MODEL_LOC)
+            try:
+                self.load_mapped(find("taggers/averaged_perceptron_tagger/" + MAPPED))
+            except LookupError:
+                AP_MODEL_LOC = "file:" + str(
+                    find("taggers/averaged_perceptron_tagger/" + PICKLE)
+                )
+                self.load(AP_MODEL_LOC)
 
     def tag(self, tokens, return_conf=False, use_tagdict=True):
         """
@@ -210,25 +626,12 @@ class PerceptronTagger(TaggerI):
 
         self._sentences = list()  # to be populated by self._make_tagdict...
         self._make_tagdict(sentences)
+        if not isinstance(self.model, AveragedPerceptron):
+            # Mapped weights are read-only
+            self.model = AveragedPerceptron()
         self.model.classes = self.classes
         for iter_ in range(nr_iter):
-            c = 0
-            n = 0
-            for sentence in self._sentences:
-                words, tags = zip(*sentence)
-
-                prev, prev2 = self.START
-                context = self.START + [self.normalize(w) for w in words] + self.END
-                for i, word in enumerate(words):
-                    guess = self.tagdict.get(word)
-                    if not guess:
-                        feats = self._get_features(i, word, context, prev, prev2)
-                        guess, _ = self.model.predict(feats)
-                        self.model.update(tags[i], guess, feats)
-                    prev2 = prev
-                    prev = guess
-                    c += guess == tags[i]
-                    n += 1
+            c, n = self._train_epoch(self.model, self._sentences)
             random.shuffle(self._sentences)
             logging.info(f"Iter {iter_}: {c}/{n}={_pc(c, n)}")
 
@@ -243,6 +646,77 @@ class PerceptronTagger(TaggerI):
                 # changed protocol from -1 to 2 to make pickling Python 2 compatible
                 pickle.dump((self.model.weights, self.tagdict, self.classes), fout, 2)
 
+    def train_streaming(self, sentences, save_loc=None, nr_iter=5, block_size=10000):
+        """Train a model like `train`, without holding the training data or
+        per-weight dicts in memory.
+
+        ``sentences`` is read once to build the tag dictionary and once per
+        iteration, so it has to be re-iterable, e.g. a corpus view. During
+        training, feature strings and tags are interned to integer ids and
+        the weights, their running totals and the time stamps of their last
+        update are kept in NumPy arrays; the dict-of-dicts weights of `model`
+        are only built when averaging at the end.
+
+        The first iteration reads ``sentences`` in order. Later iterations
+        read blocks of ``block_size`` consecutive sentences, in random order
+        if ``sentences`` supports ``len`` and slicing, and shuffle the
+        sentences within each block. With ``block_size=None`` every iteration
+        reads ``sentences`` in order. For the same order of sentences, the
+        averaged weights are the same as those of `train`.
+
+        :param sentences: A re-iterable collection of sentences, where each
+            sentence is a list of (words, tags) tuples.
+        :param save_loc: If not ``None``, saves a pickled model in this location.
+        :param nr_iter: Number of training iterations.
+        :param block_size: Number of sentences shuffled together, or None.
+        """
+        if iter(sentences) is sentences:
+            raise TypeError("sentences: expected a re-iterable collection")
+
+        self._sentences = None  # not kept, see self._make_tagdict
+        self._make_tagdict(sentences)
+        model = _ArrayPerceptron(self.classes)
+        for iter_ in range(nr_iter):
+            if iter_ == 0 or not block_size:
+                blocks = [sentences]
+            else:
+                blocks = _shuffled_blocks(sentences, block_size)
+            c = n = 0
+            for block in blocks:
+                block_c, block_n = self._train_epoch(model, block)
+                c += block_c
+                n += block_n
+            logging.info(f"Iter {iter_}: {c}/{n}={_pc(c, n)}")
+
+        self.model = AveragedPerceptron(model.average_weights())
+        self.model.classes = self.classes
+        self.model.i = model.i
+        if save_loc is not None:
+            with open(save_loc, "wb") as fout:
+                pickle.dump((self.model.weights, self.tagdict, self.classes), fout, 2)
+
+    def _train_epoch(self, model, sentences):
+        """Train ``model`` on each sentence once; return the number of
+        correctly guessed tokens and the number of tokens."""
+        c = 0
+        n = 0
+        for sentence in sentences:
+            words, tags = zip(*sentence)
+
+            prev, prev2 = self.START
+            context = self.START + [self.normalize(w) for w in words] + self.END
+            for i, word in enumerate(words):
+                guess = self.tagdict.get(word)
+                if not guess:
+                    feats = self._get_features(i, word, context, prev, prev2)
+                    guess, _ = model.predict(feats)
+                    model.update(tags[i], guess, feats)
+                prev2 = prev
+                prev = guess
+                c += guess == tags[i]
+                n += 1
+        return c, n
+
     def load(self, loc):
         """
         :param loc: Load a pickled model at location.
@@ -252,12 +726,39 @@ class PerceptronTagger(TaggerI):
         self.model.weights, self.tagdict, self.classes = load(loc)
         self.model.classes = self.classes
 
+    def save_mapped(self, path):
+        """Save the model in the format of `MappedAveragedPerceptron`.
+
+        :param path: Destination file.
+        :type path: str
+        """
+        MappedAveragedPerceptron.save(
+            self.model.weights, path, self.tagdict, self.classes
+        )
+
+    def load_mapped(self, path):
+        """
+        :param path: Memory-map a model saved by `save_mapped` at location.
+        :type path: str
+        """
+        self.model = MappedAveragedPerceptron(str(path))
+        self.tagdict = self.model.tagdict
+        self.classes = self.model.classes
+
     def encode_json_obj(self):
+        if isinstance(self.model, MappedAveragedPerceptron):
+            # Only a descriptor of the model file
+            return self.model
         return self.model.weights, self.tagdict, list(self.classes)
 
     @classmethod
     def decode_json_obj(cls, obj):
         tagger = cls(load=False)
+        if isinstance(obj, MappedAveragedPerceptron):
+            tagger.model = obj
+            tagger.tagdict = obj.tagdict
+            tagger.classes = obj.classes
+            return tagger
         tagger.model.weights, tagger.tagdict, tagger.classes = obj
         tagger.classes = set(tagger.classes)
         tagger.model.classes = tagger.classes
@@ -315,7 +816,8 @@ class PerceptronTagger(TaggerI):
         """
         counts = defaultdict(lambda: defaultdict(int))
         for sentence in sentences:
-            self._sentences.append(sentence)
+            if self._sentences is not None:
+                self._sentences.append(sentence)
             for word, tag in sentence:
                 counts[word][tag] += 1
                 self.classes.add(tag)
@@ -353,6 +855,24 @@ def _load_data_conll_format(filename):
         return sentences
 
 
+def convert_pickle(pickle_loc, path, descriptor=None):
+    """Convert a pickled tagger model to the `MappedAveragedPerceptron` format.
+
+    :param pickle_loc: Location of the pickle, as accepted by `nltk.data.load`.
+    :param path: Destination of the mapped model.
+    :param descriptor: If not ``None``, also write a JSON-tagged descriptor
+        of the tagger at this location, which `nltk.jsontags.JSONTaggedDecoder`
+        turns into a `PerceptronTagger` mapping ``path``.
+    """
+    tagger = PerceptronTagger(load=False)
+    tagger.load(pickle_loc)
+    tagger.save_mapped(path)
+    if descriptor is not None:
+        tagger.load_mapped(path)
+        with open(descriptor, "w") as fout:
+            json.dump(tagger, fout, cls=jsontags.JSONTaggedEncoder)
+
+
 def _get_pretrain_model():
     # Train and test on English part of ConLL data (WSJ part of Penn Treebank)
     # Train: section 2-11
@@ -39,7 +39,7 @@ Note: Unit tests for this module can be found in test/unit/test_senna.py
 ('NY', 'B-LOC'), (',', 'O'), ('USA', 'B-LOC'), ('.', 'O')]
 """
 
-from nltk.classify import Senna
+from nltk.classify.senna import Senna
 
 
 class SennaTagger(Senna):
@@ -10,7 +10,7 @@ import unittest
 import pytest
 
 from nltk import FreqDist
-from nltk.lm import NgramCounter
+from nltk.lm import CompactNgramCounter, NgramCounter
 from nltk.util import everygrams
 
 
@@ -114,3 +114,179 @@ class TestNgramCounterTraining:
         self.case.assertCountEqual(unigrams, counter[1].keys())
         self.case.assertCountEqual(bigram_contexts, counter[2].keys())
         self.case.assertCountEqual(trigram_contexts, counter[3].keys())
+
+
+class TestContinuationCounts:
+    """Tests for the ngram type counts used by Kneser-Ney smoothing."""
+
+    @staticmethod
+    def scan_preceding(counter, word, context=()):
+        # The full scan KneserNey used to do for every score.
+        with_word, total = 0, 0
+        for prefix, counts in counter[len(context) + 2].items():
+            if prefix[1:] == context:
+                with_word += int(counts[word] > 0)
+                total += sum(1 for count in counts.values() if count > 0)
+        return with_word, total
+
+    def assert_matches_scan(self, counter, words, contexts):
+        for context in contexts:
+            for word in words:
+                assert counter.continuations.preceding(
+                    word, context
+                ) == self.scan_preceding(counter, word, context)
+            if context:
+                assert counter.continuations.following(context) == sum(
+                    1 for count in counter[context].values() if count > 0
+                )
+
+    def test_matches_full_scan(self):
+        text = [list("abcdabd"), list("egdbea")]
+        counter = NgramCounter(everygrams(sent, max_len=3) for sent in text)
+        self.assert_matches_scan(
+            counter, "abcdegz", [(), ("a",), ("b",), ("d",), ("z",)]
+        )
+
+    def test_updated_incrementally(self):
+        text = [list("abcdabd"), list("egdbea")]
+        counter = NgramCounter([everygrams(text[0], max_len=3)])
+        counter.continuations
+        counter.update([everygrams(text[1], max_len=3)])
+
+        expected = NgramCounter(everygrams(sent, max_len=3) for sent in text)
+        self.assert_matches_scan(
+            counter, "abcdegz", [(), ("a",), ("b",), ("d",), ("e",)]
+        )
+        assert counter.continuations.preceding("a") == (
+            expected.continuations.preceding("a")
+        )
+
+    def test_repeated_ngrams_counted_once(self):
+        counter = NgramCounter([[("a", "b"), ("a", "b"), ("c", "b")]])
+        counter.continuations
+        counter.update([[("a", "b")]])
+        assert counter.continuations.preceding("b") == (2, 2)
+        assert counter.continuations.following(("a",)) == 1
+
+
+class TestNgramCounterMerge:
+    @classmethod
+    def setup_class(self):
+        self.text = [list("abcdabd"), list("egdbea"), list("bdbc")]
+
+    @staticmethod
+    def ordered_counts(counter):
+        # Insertion order matters too: merged counters must equal serial ones
+        return [
+            (order, [(context, list(fd.items())) for context, fd in cfd.items()])
+            for order, cfd in sorted(counter._counts.items())
+            if order > 1
+        ] + [list(counter.unigrams.items())]
+
+    def test_merge_matches_serial_update(self):
+        expected = NgramCounter(everygrams(sent, max_len=3) for sent in self.text)
+        merged = NgramCounter([everygrams(self.text[0], max_len=3)])
+        for sent in self.text[1:]:
+            merged.merge(NgramCounter([everygrams(sent, max_len=3)]))
+        assert self.ordered_counts(merged) == self.ordered_counts(expected)
+        assert len(merged) == len(expected)
+
+    def test_merge_is_associative(self):
+        a, b, c = (NgramCounter([everygrams(sent, max_len=3)]) for sent in self.text)
+        left = NgramCounter().merge(a).merge(b).merge(c)
+        a, b, c = (NgramCounter([everygrams(sent, max_len=3)]) for sent in self.text)
+        right = a.merge(b.merge(c))
+        assert self.ordered_counts(left) == self.ordered_counts(right)
+
+    def test_merge_updates_continuations(self):
+        merged = NgramCounter([everygrams(self.text[0], max_len=3)])
+        merged.continuations
+        merged.merge(NgramCounter([everygrams(self.text[1], max_len=3)]))
+        expected = NgramCounter(everygrams(sent, max_len=3) for sent in self.text[:2])
+        for word in "abcdeg":
+            for context in [(), ("a",), ("d",)]:
+                assert merged.continuations.preceding(
+                    word, context
+                ) == expected.continuations.preceding(word, context)
+
+
+class TestCompactNgramCounter:
+    """CompactNgramCounter must give the same counts as NgramCounter."""
+
+    @classmethod
+    def setup_class(self):
+        self.text = [list("abcdabd"), list("egdbea")]
+        self.expected = NgramCounter(everygrams(sent, max_len=3) for sent in self.text)
+
+    def assert_same_counts(self, counter):
+        assert counter.N() == self.expected.N()
+        assert dict(counter.unigrams.items()) == dict(self.expected.unigrams.items())
+        for order in (2, 3):
+            assert sorted(counter[order]) == sorted(self.expected[order])
+            for context, counts in self.expected[order].items():
+                assert dict(counter[context].items()) == dict(counts.items())
+                assert counter[context].N() == counts.N()
+        assert counter[["z"]]["a"] == 0
+        assert counter["z"] == 0
+        assert not counter[["a", "z"]]
+
+    def test_same_counts(self):
+        counter = CompactNgramCounter(everygrams(sent, max_len=3) for sent in self.text)
+        self.assert_same_counts(counter)
+
+    def test_merges_buffered_updates(self):
+        counter = CompactNgramCounter(buffer_size=2)
+        for sent in self.text:
+            counter.update([everygrams(sent, max_len=3)])
+            counter.N()
+        self.assert_same_counts(counter)
+
+    def test_continuations(self):
+        counter = CompactNgramCounter(everygrams(sent, max_len=3) for sent in self.text)
+        for context in [(), ("a",), ("b",), ("d",), ("z",)]:
+            for word in "abcdegz":
+                assert counter.continuations.preceding(
+                    word, context
+                ) == self.expected.continuations.preceding(word, context)
+        for context in [("a",), ("d", "b"), ("z",)]:
+            assert counter.continuations.following(
+                context
+            ) == self.expected.continuations.following(context)
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_save_and_load(self, tmp_path, mmap):
+        counter = CompactNgramCounter(everygrams(sent, max_len=3) for sent in self.text)
+        path = str(tmp_path / "counts.ngc")
+        counter.save(path)
+        loaded = CompactNgramCounter.load(path, mmap=mmap)
+        self.assert_same_counts(loaded)
+
+        loaded.update([[("a", "b"), ("x",)]])
+        assert loaded[["a"]]["b"] == counter[["a"]]["b"] + 1
+        assert loaded["x"] == 1
+        self.assert_same_counts(CompactNgramCounter.load(path))
+
+    def test_merge_matches_serial_update(self, tmp_path):
+        merged = CompactNgramCounter([everygrams(self.text[0], max_len=3)])
+        other = CompactNgramCounter([everygrams(self.text[1], max_len=3)])
+        path = str(tmp_path / "counts.ngc")
+        other.save(path)
+        merged.merge(CompactNgramCounter.load(path))
+        self.assert_same_counts(merged)
+
+        serial = CompactNgramCounter(everygrams(sent, max_len=3) for sent in self.text)
+        serial._sync()
+        assert merged._words == serial._words
+        for order in (1, 2, 3):
+            assert (merged._grams[order] == serial._grams[order]).all()
+            assert (merged._values[order] == serial._values[order]).all()
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "counts.ngc"
+        path.write_bytes(b"not a counter")
+        with pytest.raises(ValueError):
+            CompactNgramCounter.load(str(path))
+
+    def test_train_on_illegal_sentences(self):
+        with pytest.raises(TypeError):
+            CompactNgramCounter([["Check", "this", "out", "!"]])
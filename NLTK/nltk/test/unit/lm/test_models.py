@@ -5,12 +5,15 @@
 # URL: <https://www.nltk.org/>
 # For license information, see LICENSE.TXT
 import math
+import random
 from operator import itemgetter
 
 import pytest
 
 from nltk.lm import (
     MLE,
+    CompactNgramCounter,
+    NgramCounter,
     AbsoluteDiscountingInterpolated,
     KneserNeyInterpolated,
     Laplace,
@@ -19,7 +22,7 @@ from nltk.lm import (
     Vocabulary,
     WittenBellInterpolated,
 )
-from nltk.lm.preprocessing import padded_everygrams
+from nltk.lm.preprocessing import padded_everygram_pipeline, padded_everygrams
 
 
 @pytest.fixture(scope="session")
@@ -418,6 +421,47 @@ def test_kneserney_trigram_score(
     )
 
 
+def test_kneserney_score_after_refit(trigram_training_data, vocabulary):
+    # Continuation counts built by the first fit must follow later updates.
+    first, second = trigram_training_data
+    model = KneserNeyInterpolated(order=3, discount=0.75, vocabulary=vocabulary)
+    model.fit([first])
+    model.score("c", ["b"])
+    model.fit([second])
+
+    expected = KneserNeyInterpolated(order=3, discount=0.75, vocabulary=vocabulary)
+    expected.fit(trigram_training_data)
+    for word, context in [("c", None), ("c", ["b"]), ("c", ["a", "b"]), ("d", ["a"])]:
+        assert model.score(word, context) == expected.score(word, context)
+
+
+@pytest.mark.parametrize(
+    "model_class",
+    [
+        MLE,
+        Lidstone,
+        Laplace,
+        WittenBellInterpolated,
+        AbsoluteDiscountingInterpolated,
+        KneserNeyInterpolated,
+        StupidBackoff,
+    ],
+)
+def test_compact_counter_scores(model_class, trigram_training_data, vocabulary):
+    params = {"gamma": 0.1} if model_class is Lidstone else {}
+    expected = model_class(order=3, vocabulary=vocabulary, **params)
+    expected.fit(trigram_training_data)
+    model = model_class(
+        order=3, vocabulary=vocabulary, counter=CompactNgramCounter(), **params
+    )
+    model.fit(trigram_training_data)
+    for context in [None, ["a"], ["b"], ["z"], ["a", "b"], ["e", "g"], ["z", "b"]]:
+        for word in ["a", "b", "c", "d", "e", "z", "y"]:
+            assert pytest.approx(model.score(word, context), 1e-12) == (
+                expected.score(word, context)
+            )
+
+
 @pytest.fixture
 def absolute_discounting_trigram_model(trigram_training_data, vocabulary):
     model = AbsoluteDiscountingInterpolated(order=3, vocabulary=vocabulary)
@@ -545,6 +589,50 @@ def test_sums_to_1(model_fixture, context, request):
     assert pytest.approx(scores_for_context, 1e-7) == 1.0
 
 
+@pytest.mark.parametrize(
+    "model_fixture",
+    [
+        "mle_bigram_model",
+        "mle_trigram_model",
+        "lidstone_trigram_model",
+        "laplace_bigram_model",
+        "wittenbell_trigram_model",
+        "absolute_discounting_trigram_model",
+        "kneserney_trigram_model",
+        "stupid_backoff_trigram_model",
+    ],
+)
+def test_batch_scores(model_fixture, request):
+    model = request.getfixturevalue(model_fixture)
+    words = ["a", "b", "c", "d", "e", "z", "y", "<s>", "</s>"]
+    contexts = [(), ("a",), ("b",), ("z",), ("y",), ("a", "b"), ("e", "g"), ("z", "b")]
+    ngrams = [
+        context[-model.order + 1 :] + (word,) if model.order > 1 else (word,)
+        for context in contexts
+        for word in words
+    ]
+
+    scores = model.score_many(ngrams)
+    assert list(scores) == [model.score(ngram[-1], ngram[:-1]) for ngram in ngrams]
+    assert list(model.logscore_many(ngrams)) == pytest.approx(
+        [model.logscore(ngram[-1], ngram[:-1]) for ngram in ngrams]
+    )
+    assert len(model.score_many([])) == 0
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 10000])
+def test_streaming_perplexity(mle_bigram_model, batch_size):
+    sents = [
+        [("<s>", "a"), ("a", "b"), ("b", "c")],
+        [("<s>", "a"), ("a", "d")],
+    ]
+    perplexity = mle_bigram_model.streaming_perplexity(
+        iter(sents), batch_size=batch_size
+    )
+    expected = mle_bigram_model.perplexity([ngram for sent in sents for ngram in sent])
+    assert pytest.approx(perplexity, 1e-9) == expected
+
+
 ###############################################################################
 #                               Generating Text                               #
 ###############################################################################
@@ -608,3 +696,56 @@ def test_generate_None_text_seed(mle_trigram_model):
     assert mle_trigram_model.generate(
         text_seed=None, random_seed=3
     ) == mle_trigram_model.generate(random_seed=3)
+
+
+@pytest.mark.parametrize("cache_size", [1, 4096])
+def test_generate_many_matches_consecutive_generate(mle_trigram_model, cache_size):
+    random_generator = random.Random(7)
+    expected = [
+        mle_trigram_model.generate(6, text_seed=["<s>"], random_seed=random_generator)
+        for _ in range(20)
+    ]
+    assert (
+        mle_trigram_model.generate_many(
+            20, 6, text_seed=["<s>"], random_seed=7, cache_size=cache_size
+        )
+        == expected
+    )
+
+
+def test_generate_long_text(mle_trigram_model):
+    # Generation is iterative, so long texts do not hit the recursion limit.
+    generated = mle_trigram_model.generate(5000, random_seed=1)
+    assert len(generated) == 5000
+    assert set(generated) <= set(mle_trigram_model.vocab)
+
+
+@pytest.mark.parametrize("counter_class", [NgramCounter, CompactNgramCounter])
+@pytest.mark.parametrize("workers, shard_size", [(1, 1), (2, 1), (2, 1000)])
+def test_fit_sharded_matches_fit(training_data, counter_class, workers, shard_size):
+    sents = training_data + [list("bdbdbd"), ["a"], []]
+    expected = KneserNeyInterpolated(3, counter=counter_class())
+    expected.fit(*padded_everygram_pipeline(3, sents))
+
+    model = KneserNeyInterpolated(3, counter=counter_class())
+    model.fit_sharded(iter(sents), workers=workers, shard_size=shard_size)
+
+    assert list(model.vocab.counts.items()) == list(expected.vocab.counts.items())
+    assert model.counts.N() == expected.counts.N()
+    for order in (2, 3):
+        for context in expected.counts[order]:
+            assert list(model.counts[context].items()) == list(
+                expected.counts[context].items()
+            )
+    for context in [None, ["a"], ["b", "d"]]:
+        for word in ["a", "b", "d", "z"]:
+            assert model.score(word, context) == expected.score(word, context)
+
+
+def test_fit_sharded_with_given_vocabulary(training_data, vocabulary):
+    expected = MLE(2, vocabulary=vocabulary)
+    expected.fit(padded_everygram_pipeline(2, training_data)[0])
+    model = MLE(2, vocabulary=vocabulary)
+    model.fit_sharded(training_data, workers=1, shard_size=1)
+    assert model.counts[["a"]] == expected.counts[["a"]]
+    assert model.counts["<UNK>"] == expected.counts["<UNK>"] > 0
@@ -138,6 +138,14 @@ class NgramModelVocabularyTests(unittest.TestCase):
             ),
         )
 
+    def test_merge_matches_counting_all_words(self):
+        words = ["z", "a", "b", "c", "f", "d", "e", "g", "a", "d", "b", "e", "w"]
+        merged = Vocabulary(words[:4], unk_cutoff=2)
+        merged.merge(Vocabulary(words[4:9])).merge(Vocabulary(words[9:]))
+        self.assertEqual(merged, self.vocab)
+        self.assertEqual(list(merged.counts.items()), list(self.vocab.counts.items()))
+        self.assertEqual(len(merged), len(self.vocab))
+
     @unittest.skip(
         reason="Test is known to be flaky as it compares (runtime) performance."
     )
@@ -1,11 +1,19 @@
 """
 Corpus View Regression Tests
 """
+
+import os
+import random
+import tempfile
+import threading
 import unittest
 
 import nltk.data
+from nltk.corpus.reader import TaggedCorpusReader
 from nltk.corpus.reader.util import (
     StreamBackedCorpusView,
+    concat,
+    map_shards,
     read_line_block,
     read_whitespace_block,
 )
@@ -46,3 +54,201 @@ class TestCorpusViews(unittest.TestCase):
 
             v = StreamBackedCorpusView(f, read_line_block)
             self.assertEqual(len(v), len(self.linetok.tokenize(file_data)))
+
+
+class LineReader:
+    """Read one stripped line per block, counting the blocks read."""
+
+    blocks_read = 0
+
+    def __call__(self, stream):
+        LineReader.blocks_read += 1
+        return [stream.readline().strip()]
+
+
+class TestCorpusViewCache(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".txt")
+        self.lines = [f"line {i} with some words" for i in range(500)]
+        with os.fdopen(fd, "w", encoding="utf8") as f:
+            f.write("\n".join(self.lines))
+        self.blocks_read = 0
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def read_block(self, stream):
+        self.blocks_read += 1
+        return [stream.readline().strip()]
+
+    def test_block_cache(self):
+        # Blocks are only read once if they fit in the cache
+        view = StreamBackedCorpusView(self.path, self.read_block, cache_size=1 << 20)
+        self.assertEqual(list(view), self.lines)
+        self.assertEqual(self.blocks_read, len(self.lines))
+        rng = random.Random(0)
+        for i in rng.sample(range(len(self.lines)), 100):
+            self.assertEqual(view[i], self.lines[i])
+            self.assertEqual(list(view[i : i + 3]), self.lines[i : i + 3])
+        self.assertEqual(self.blocks_read, len(self.lines))
+
+    def test_cache_size(self):
+        # The cached blocks stay within the byte budget, and evicted blocks
+        # are read again
+        view = StreamBackedCorpusView(self.path, self.read_block, cache_size=1000)
+        self.assertEqual(list(view), self.lines)
+        self.assertLessEqual(view._cached_bytes, 1000)
+        blocks_read = self.blocks_read
+        self.assertEqual(view[-1], self.lines[-1])
+        self.assertEqual(self.blocks_read, blocks_read)
+        self.assertEqual(view[0], self.lines[0])
+        self.assertEqual(self.blocks_read, blocks_read + 1)
+
+    def test_thread_safe(self):
+        view = StreamBackedCorpusView(
+            self.path, self.read_block, cache_size=4096, thread_safe=True
+        )
+        errors = []
+
+        def read(seed):
+            rng = random.Random(seed)
+            try:
+                for _ in range(200):
+                    i = rng.randrange(len(self.lines))
+                    self.assertEqual(view[i], self.lines[i])
+                    self.assertEqual(list(view[i : i + 5]), self.lines[i : i + 5])
+                self.assertEqual(list(view), self.lines)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        view.close()
+        self.assertEqual(errors, [])
+
+    def test_offset_index(self):
+        with tempfile.TemporaryDirectory() as index_dir:
+            view = StreamBackedCorpusView(
+                self.path, LineReader(), offset_index=index_dir
+            )
+            self.assertEqual(len(view), len(self.lines))
+            self.assertEqual(len(os.listdir(index_dir)), 1)
+
+            # A new view knows its length, and reads only the blocks it needs
+            LineReader.blocks_read = 0
+            view = StreamBackedCorpusView(
+                self.path, LineReader(), offset_index=index_dir
+            )
+            self.assertEqual(len(view), len(self.lines))
+            self.assertEqual(view[400], self.lines[400])
+            self.assertEqual(view[-1], self.lines[-1])
+            self.assertEqual(LineReader.blocks_read, 2)
+            self.assertEqual(list(view), self.lines)
+
+            # The index is only used by views with the same block reader
+            view = StreamBackedCorpusView(
+                self.path, read_line_block, offset_index=index_dir
+            )
+            self.assertIsNone(view._len)
+            view.__len__()
+            self.assertEqual(len(os.listdir(index_dir)), 2)
+
+            # or if the file is unchanged
+            with open(self.path, "a", encoding="utf8") as f:
+                f.write("\nlast line")
+            view = StreamBackedCorpusView(
+                self.path, LineReader(), offset_index=index_dir
+            )
+            self.assertEqual(view[-1], "last line")
+            self.assertEqual(list(view), self.lines + ["last line"])
+
+            # A block reader whose state cannot be described gets no index
+            view = StreamBackedCorpusView(
+                self.path, self.read_block, offset_index=index_dir
+            )
+            self.assertEqual(len(view), len(self.lines) + 1)
+            self.assertIsNone(view._offset_index)
+            self.assertEqual(len(os.listdir(index_dir)), 2)
+
+    def test_offset_index_reader_code(self):
+        # Lambdas share their name, and these pairs share their bytecode:
+        # they only differ in the global function or the constant they use
+        readers = [
+            lambda stream: read_line_block(stream),
+            lambda stream: read_whitespace_block(stream),
+            lambda stream: [stream.readline()[:4]],
+            lambda stream: [stream.readline()[:6]],
+        ]
+        with tempfile.TemporaryDirectory() as index_dir:
+            for reader in readers:
+                expected = list(StreamBackedCorpusView(self.path, reader))
+                view = StreamBackedCorpusView(self.path, reader, offset_index=index_dir)
+                self.assertEqual(len(view), len(expected))
+                view = StreamBackedCorpusView(self.path, reader, offset_index=index_dir)
+                self.assertEqual(len(view), len(expected))
+                self.assertEqual(list(view), expected)
+            self.assertEqual(len(os.listdir(index_dir)), len(readers))
+
+    def test_offset_index_view_state(self):
+        # The views of a corpus reader share their class and block reader,
+        # and only differ in their state
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, "a.pos"), "w", encoding="utf8") as f:
+                f.write("a/DT b/NN ./.\nc/DT d/NN ./.\n\ne/DT f/NN ./.\n")
+            index_dir = os.path.join(root, "index")
+            old_offset_index = StreamBackedCorpusView.offset_index
+            StreamBackedCorpusView.offset_index = index_dir
+            try:
+                reader = TaggedCorpusReader(root, "a.pos")
+                self.assertEqual(len(reader.words("a.pos")), 9)
+                sents = reader.sents("a.pos")
+                self.assertEqual(len(sents), 3)
+                self.assertEqual(
+                    list(sents), [["a", "b", "."], ["c", "d", "."], ["e", "f", "."]]
+                )
+                self.assertEqual(len(os.listdir(index_dir)), 2)
+
+                # Views with the same state load the index of their own kind
+                reader = TaggedCorpusReader(root, "a.pos")
+                for view, length in [
+                    (reader.sents("a.pos"), 3),
+                    (reader.words("a.pos"), 9),
+                ]:
+                    self.assertEqual(view._len, None)
+                    view._load_index()
+                    self.assertEqual(view._len, length)
+
+                # The state of a view includes the settings of its reader
+                reader = TaggedCorpusReader(root, "a.pos", sep="_")
+                self.assertEqual(
+                    reader.tagged_words("a.pos")[:2], [("a/DT", None), ("b/NN", None)]
+                )
+                self.assertEqual(len(reader.tagged_words("a.pos")), 9)
+                self.assertEqual(len(os.listdir(index_dir)), 3)
+            finally:
+                StreamBackedCorpusView.offset_index = old_offset_index
+
+    def test_partition(self):
+        view = StreamBackedCorpusView(self.path, self.read_block)
+        for n in (1, 3, 7, 1000):
+            parts = view.partition(n)
+            self.assertEqual(len(parts), n)
+            self.assertEqual([line for part in parts for line in part], self.lines)
+            self.assertEqual(list(view.shard(n - 1, n)), list(parts[-1]))
+        sizes = [part._eofpos - part._filepos[0] for part in view.partition(5)]
+        self.assertLessEqual(max(sizes) - min(sizes), 50)
+
+        # Concatenated views are cut across and within their pieces
+        views = concat([view, StreamBackedCorpusView(self.path, self.read_block)])
+        parts = views.partition(3)
+        self.assertEqual([len(part._pieces) for part in parts], [1, 2, 1])
+        self.assertEqual(
+            [line for part in parts for line in part], self.lines + self.lines
+        )
+        self.assertEqual(
+            map_shards(len, views, workers=1, shards=4),
+            [len(part) for part in views.partition(4)],
+        )
@@ -13,3 +13,52 @@ def test_find_raises_exception_with_full_resource_name():
     with pytest.raises(LookupError) as exc:
         nltk.data.find(no_such_thing)
         assert no_such_thing in str(exc)
+
+
+class Grammar:
+    """A resource type that supports weak references"""
+
+
+def test_resource_cache_limits():
+    cache = nltk.data.ResourceCache(max_entries=2, max_bytes=100)
+    cache.put("a", ["a"], 10)
+    cache.put("b", ["b"], 10)
+    assert cache.get("a") == ["a"]
+    cache.put("c", ["c"], 10)
+    # "b" is the least recently used, and lists can't be weakly referenced
+    assert cache.get("b") is None
+    cache.put("d", ["d"], 90)
+    assert cache.get("a") is None
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions) == (1, 2, 2)
+    assert (info.entries, info.bytes) == (2, 100)
+
+
+def test_resource_cache_weak_references():
+    cache = nltk.data.ResourceCache(max_entries=1, weak_threshold=1000)
+    large, evicted = Grammar(), Grammar()
+    cache.put("large", large, 2000)
+    cache.put("evicted", evicted, 10)
+    cache.put("small", Grammar(), 10)
+    assert cache.info().entries == 1
+    # Resources in use are still cached, but not kept alive by the cache
+    assert cache.get("large") is large
+    assert cache.get("evicted") is evicted
+    del large, evicted
+    assert cache.get("large") is None
+    assert cache.get("evicted") is None
+    assert cache.info().weak_entries == 0
+
+
+def test_load_cache(tmp_path):
+    resource = tmp_path / "toy.cfg"
+    resource.write_text("S -> 'a'\n")
+    nltk.data.clear_cache()
+    before = nltk.data.cache_info()
+    grammar = nltk.data.load(resource.as_uri())
+    assert nltk.data.load(resource.as_uri()) is grammar
+    info = nltk.data.cache_info()
+    assert (info.hits, info.misses) == (before.hits + 1, before.misses + 1)
+    assert (info.entries, info.bytes) == (1, len("S -> 'a'\n"))
+    nltk.data.clear_cache()
+    assert nltk.data.cache_info().entries == 0
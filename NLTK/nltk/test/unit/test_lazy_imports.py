@@ -0,0 +1,80 @@
+"""
+Tests for the lazy imports of the top-level nltk namespace
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import nltk
+
+# The modules of which nltk only has some names, rather than all of them
+PARTIAL_MODULES = {"nltk.decorators", "nltk.downloader", "nltk.internals"}
+
+# Names exported by the modules of the table after it was written, which
+# are deliberately not in the top-level namespace
+NOT_IN_NLTK = {"iter_word_tokenize"}
+
+
+def public_names(module):
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith("_")]
+    return names
+
+
+def test_lazy_names_match_modules():
+    # The table has the names of ``from nltk.<module> import *`` for each
+    # module in order, except those of the top-level modules themselves
+    expected = {}
+    for module_name, names in nltk._LAZY_IMPORTS.items():
+        if module_name in PARTIAL_MODULES:
+            names = names.split()
+        else:
+            names = public_names(importlib.import_module(module_name))
+        for name in names:
+            expected[name] = module_name
+    for name in nltk._LAZY_MODULES:
+        expected.pop(name, None)
+    assert set(nltk._lazy_names) <= set(expected)
+    for name, module_name in expected.items():
+        if name in NOT_IN_NLTK:
+            assert name not in nltk._lazy_names, name
+        elif name in nltk._lazy_names:
+            assert nltk._lazy_names[name] == module_name, name
+        else:
+            # A submodule of the package, that another import added to it
+            value = getattr(importlib.import_module(module_name), name)
+            assert getattr(value, "__name__", None) == f"{module_name}.{name}", name
+
+
+@pytest.mark.parametrize("name", sorted(nltk._lazy_names))
+def test_lazy_name(name):
+    module = importlib.import_module(nltk._lazy_names[name])
+    value = getattr(module, name, None)
+    if value is None:
+        value = importlib.import_module(f"{module.__name__}.{name}")
+    assert getattr(nltk, name) is value
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, nltk\n"
+        "nltk.word_tokenize, nltk.FreqDist\n"
+        "print(' '.join(sorted(sys.modules)))"
+    )
+    modules = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert "nltk.tokenize" in modules
+    for module in ("nltk.classify", "nltk.parse", "nltk.sem", "nltk.tag"):
+        assert module not in modules
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        nltk.no_such_name
+    assert "word_tokenize" in dir(nltk)
+    assert "word_tokenize" in nltk.__all__
@@ -0,0 +1,253 @@
+"""
+Tests for the averaged perceptron tagger that do not need the pretrained model.
+"""
+
+import json
+import pickle
+import random
+
+import pytest
+
+import nltk.tag
+from nltk.jsontags import JSONTaggedDecoder
+from nltk.tag.perceptron import (
+    AveragedPerceptron,
+    MappedAveragedPerceptron,
+    PerceptronTagger,
+    convert_pickle,
+)
+
+np = pytest.importorskip("numpy")
+
+LEXICON = {
+    "DT": ["the", "a", "this", "that", "every"],
+    "JJ": ["big", "red", "old", "fast", "light", "round", "Open"],
+    "NN": ["dog", "cat", "idea", "light", "run", "book", "table", "ice-cream"],
+    "NNS": ["dogs", "cats", "ideas", "books", "runs"],
+    "VBZ": ["runs", "books", "sees", "likes", "is"],
+    "VBD": ["ran", "saw", "liked", "was", "opened"],
+    "IN": ["on", "in", "under", "that", "with"],
+    "CD": ["1999", "42", "7", "2023"],
+    ".": [".", "!"],
+}
+TEMPLATES = [
+    ["DT", "NN", "VBZ", "DT", "JJ", "NN", "."],
+    ["DT", "JJ", "NN", "VBD", "IN", "DT", "NN", "."],
+    ["NNS", "VBD", "CD", "NNS", "."],
+    ["DT", "NN", "VBD", "IN", "CD", "."],
+    ["JJ", "NNS", "VBZ", "."],
+]
+
+
+def synthetic_sentences(count, seed):
+    rng = random.Random(seed)
+    return [
+        [(rng.choice(LEXICON[tag]), tag) for tag in rng.choice(TEMPLATES)]
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def tagger():
+    tagger = PerceptronTagger(load=False)
+    random.seed(0)
+    tagger.train(synthetic_sentences(300, seed=1), nr_iter=3)
+    return tagger
+
+
+@pytest.fixture(scope="module")
+def test_sentences():
+    sentences = [[word for word, _ in sent] for sent in synthetic_sentences(200, 2)]
+    # Words the tagger never saw
+    return sentences + [["unknown", "words", "are", "Tagged", "2001", "too", "."]]
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_compiled_tags_match_dict_path(tagger, test_sentences, dtype):
+    expected = [tagger.tag(sent, use_tagdict=False) for sent in test_sentences]
+    tagger.model.compile(dtype)
+    try:
+        assert [
+            tagger.tag(sent, use_tagdict=False) for sent in test_sentences
+        ] == expected
+    finally:
+        tagger.model._compiled = None
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_compiled_ties_go_to_last_label(dtype):
+    model = AveragedPerceptron({"bias": {"A": 1.0, "B": 1.0}, "x": {"C": -1.0}})
+    model.classes = {"A", "B", "C"}
+    expected = model.predict({"bias": 1, "x": 1})
+    model.compile(dtype)
+    assert model.predict({"bias": 1, "x": 1}) == expected == ("B", None)
+    # No known feature: every score is 0
+    assert model.predict({"unseen": 1}) == ("C", None)
+
+
+def test_float32_near_ties_use_exact_scores():
+    # 0.1 + 0.2 > 0.3 in double precision, but not in single precision
+    model = AveragedPerceptron({"f1": {"A": 0.1}, "f2": {"A": 0.2}, "f3": {"B": 0.3}})
+    model.classes = {"A", "B"}
+    features = {"f1": 1, "f2": 1, "f3": 1}
+    assert model.predict(features) == ("A", None)
+    assert model.compile("float32").predict(features) == ("A", None)
+
+
+def test_training_drops_compiled_weights():
+    model = AveragedPerceptron({"bias": {"A": 1.0}})
+    model.classes = {"A", "B"}
+    model.compile()
+    model.update("B", "A", {"bias": 1})
+    assert model.predict({"bias": 1}) == ("B", None)
+
+    # Replacing the weights also bypasses the stale matrix
+    model.compile()
+    model.weights = {"bias": {"A": 2.0}}
+    assert model.predict({"bias": 1}) == ("A", None)
+
+
+def test_pos_tag_reuses_one_tagger(tagger, monkeypatch):
+    loaded = []
+
+    def load_tagger(load=True):
+        loaded.append(load)
+        return tagger
+
+    monkeypatch.setattr(nltk.tag, "_taggers", {})
+    monkeypatch.setattr(nltk.tag, "PerceptronTagger", load_tagger)
+    sent = ["the", "dog", "sees", "a", "cat", "."]
+    assert nltk.tag.pos_tag(sent) == nltk.tag.pos_tag(sent) == tagger.tag(sent)
+    assert nltk.tag.pos_tag_sents([sent]) == [tagger.tag(sent)]
+    assert loaded == [True]
+
+
+def test_parallel_pos_tag_sents_keeps_order(tagger, test_sentences, monkeypatch):
+    monkeypatch.setattr(nltk.tag, "_taggers", {"eng": tagger})
+    monkeypatch.setattr(nltk.tag, "_mapped_models", {})
+    expected = nltk.tag.pos_tag_sents(test_sentences)
+    assert expected == [tagger.tag(sent) for sent in test_sentences]
+    assert (
+        nltk.tag.pos_tag_sents(iter(test_sentences), workers=2, chunk_size=7)
+        == expected
+    )
+
+
+def test_pos_tag_sents_workers_map_the_model(tagger, test_sentences, monkeypatch):
+    monkeypatch.setattr(nltk.tag, "_taggers", {"eng": tagger})
+    monkeypatch.setattr(nltk.tag, "_mapped_models", {})
+    path = nltk.tag._mapped_model("eng")
+    assert nltk.tag._mapped_model("eng") == path
+
+    # What the initializer does in each worker
+    nltk.tag._load_mapped_tagger("eng", path)
+    worker_tagger = nltk.tag._taggers["eng"]
+    assert isinstance(worker_tagger.model, MappedAveragedPerceptron)
+    assert nltk.tag._pos_tag_chunk(test_sentences, lang="eng") == [
+        tagger.tag(sent) for sent in test_sentences
+    ]
+    # A mapped tagger is used from its own file
+    assert nltk.tag._mapped_model("eng") == path
+
+
+def test_streaming_training_matches_train(monkeypatch):
+    sentences = synthetic_sentences(300, seed=1)
+    # Same order of sentences in every iteration
+    monkeypatch.setattr(random, "shuffle", lambda sentences: None)
+    tagger = PerceptronTagger(load=False)
+    tagger.train(sentences, nr_iter=3)
+    monkeypatch.undo()
+
+    streamed = PerceptronTagger(load=False)
+    streamed.train_streaming(sentences, nr_iter=3, block_size=None)
+    assert streamed.model.weights == tagger.model.weights
+    assert list(streamed.model.weights) == list(tagger.model.weights)
+    for feat, weights in tagger.model.weights.items():
+        assert list(streamed.model.weights[feat].items()) == list(weights.items())
+    assert streamed.model.i == tagger.model.i
+    assert streamed.tagdict == tagger.tagdict
+    assert streamed.classes == tagger.classes
+
+
+class Reiterable:
+    """Re-iterable sentences without ``len`` or slicing."""
+
+    def __init__(self, sentences):
+        self.sentences = sentences
+
+    def __iter__(self):
+        return iter(self.sentences)
+
+
+@pytest.mark.parametrize("wrap", [list, Reiterable])
+def test_streaming_training_shuffles_blocks(tagger, test_sentences, wrap):
+    streamed = PerceptronTagger(load=False)
+    random.seed(0)
+    streamed.train_streaming(
+        wrap(synthetic_sentences(300, seed=1)), nr_iter=3, block_size=32
+    )
+    expected = [tagger.tag(sent) for sent in test_sentences]
+    tagged = [streamed.tag(sent) for sent in test_sentences]
+    agree = sum(
+        a == b for sent, other in zip(expected, tagged) for a, b in zip(sent, other)
+    )
+    assert agree / sum(map(len, expected)) > 0.95
+
+
+def test_streaming_training_needs_reiterable_sentences():
+    with pytest.raises(TypeError):
+        PerceptronTagger(load=False).train_streaming(
+            iter(synthetic_sentences(10, seed=1))
+        )
+
+
+def test_mapped_model_tags_like_the_dict_model(tagger, test_sentences, tmp_path):
+    path = tmp_path / "tagger.bin"
+    tagger.save_mapped(str(path))
+    mapped = PerceptronTagger(load=False)
+    mapped.load_mapped(str(path))
+
+    assert isinstance(mapped.model, MappedAveragedPerceptron)
+    assert mapped.tagdict == tagger.tagdict
+    assert mapped.classes == tagger.classes
+    assert dict(mapped.model.weights) == tagger.model.weights
+    assert list(mapped.model.weights) == list(tagger.model.weights)
+    for feat, weights in tagger.model.weights.items():
+        assert list(mapped.model.weights[feat].items()) == list(weights.items())
+    assert "unseen feature" not in mapped.model.weights
+    for sent in test_sentences:
+        assert mapped.tag(sent) == tagger.tag(sent)
+        assert mapped.tag(sent, return_conf=True, use_tagdict=False) == tagger.tag(
+            sent, return_conf=True, use_tagdict=False
+        )
+
+    # Pickles only refer to the file
+    assert len(pickle.dumps(mapped.model)) < 200
+    assert pickle.loads(pickle.dumps(mapped)).tag(test_sentences[0]) == tagger.tag(
+        test_sentences[0]
+    )
+
+
+def test_convert_pickle_with_descriptor(tagger, test_sentences, tmp_path):
+    pickle_path = tmp_path / "tagger.pickle"
+    with open(pickle_path, "wb") as fout:
+        pickle.dump((tagger.model.weights, tagger.tagdict, tagger.classes), fout, 2)
+    convert_pickle(
+        "file:" + str(pickle_path),
+        str(tmp_path / "tagger.bin"),
+        descriptor=str(tmp_path / "tagger.json"),
+    )
+    with open(tmp_path / "tagger.json") as fin:
+        loaded = json.load(fin, cls=JSONTaggedDecoder)
+    assert isinstance(loaded, PerceptronTagger)
+    assert isinstance(loaded.model, MappedAveragedPerceptron)
+    assert [loaded.tag(sent) for sent in test_sentences] == [
+        tagger.tag(sent) for sent in test_sentences
+    ]
+
+
+def test_mapped_model_rejects_other_files(tmp_path):
+    path = tmp_path / "tagger.pickle"
+    path.write_bytes(pickle.dumps({}))
+    with pytest.raises(ValueError):
+        MappedAveragedPerceptron(str(path))
@@ -2,20 +2,25 @@
 Unit tests for nltk.tokenize.
 See also nltk/test/tokenize.doctest
 """
+import re
 from typing import List, Tuple
 
 import pytest
 
 from nltk.tokenize import (
     LegalitySyllableTokenizer,
+    NLTKWordTokenizer,
     StanfordSegmenter,
     SyllableTokenizer,
     TreebankWordTokenizer,
     TweetTokenizer,
+    iter_word_tokenize,
     punkt,
     sent_tokenize,
     word_tokenize,
 )
+from nltk.tokenize.treebank import TreebankWordDetokenizer
+from nltk.tokenize.util import fuse_substitutions
 
 
 def load_stanford_segmenter():
@@ -262,6 +267,39 @@ class TestTokenize:
             predicted = tokenizer.tokenize(test_input)
             assert predicted == expected
 
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"cache_size": 2, "batch_size": 3},
+            {"cache_size": 0, "batch_size": 1},
+            {"workers": 2, "batch_size": 4},
+        ],
+    )
+    def test_tweet_tokenizer_many(self, kwargs):
+        """
+        Test that TweetTokenizer.tokenize_many gives the same tokens as
+        tokenize, with duplicate texts and in a process pool
+        """
+        texts = [
+            "RT @remy: This is waaaaayyyy too much for you!!!!!! :D",
+            "Price: &pound;100 &bogus; &#x41; &#150; &lt;3 @someone_else",
+            "My number is 601-984-4813, except it's not. XD",
+            "",
+            "HAHA :P @a_very_long_username_indeed",
+        ]
+        texts = texts + texts[::-1] + texts[:2]
+        for preserve_case in (True, False):
+            tokenizer = TweetTokenizer(
+                preserve_case=preserve_case, reduce_len=True, strip_handles=True
+            )
+            expected = [tokenizer.tokenize(text) for text in texts]
+            result = list(tokenizer.tokenize_many(iter(texts), **kwargs))
+            assert result == expected
+            # Duplicate texts do not share their token lists
+            result[0].append("x")
+            assert result[-2] == expected[-2]
+
     def test_sonority_sequencing_syllable_tokenizer(self):
         """
         Test SyllableTokenizer tokenizer.
@@ -706,6 +744,94 @@ class TestTokenize:
         result = list(tokenizer.span_tokenize(test3))
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "He said \"no\" and ''left''.",
+            '``Hi\'\' "there"\n"yo"',
+            '«"a"» “b” ‘c’ „d',
+            "```x'' '''y ''",
+            "It's\nfine, isn't it? 'Tis (really) gonna -- be...",
+            "a,,b :c ;d @e #f $1,000 50% &g *h 'x y' z' ",
+            '"a" "b" a"b" "',
+            "",
+            "   ",
+        ],
+    )
+    def test_nltk_word_span_tokenizer(self, text):
+        """
+        Test that NLTKWordTokenizer.span_tokenize finds the same spans as
+        aligning the tokens with the converted quotes restored
+        """
+        tokenizer = NLTKWordTokenizer()
+        tokens = tokenizer.tokenize(text)
+        expected = list(tokenizer._align_span_tokenize(text, tokens))
+        result = list(tokenizer.span_tokenize(text))
+        assert result == expected
+        assert len(result) == len(tokens)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Cannot! I'm gonna, GOTTA go; lemme gimme d'ye more'n wanna.",
+            "wanna\tgo? Wanna. cannots gonnagotta can not gim me",
+            "more'n'more'n d'ye'd 'tis 'Twas don't can't",
+            "gon na got ta lem me wan na d 'ye more 'n",
+            "Xx gonna xx",
+            "",
+        ],
+    )
+    def test_fused_contractions(self, monkeypatch, text):
+        """
+        Test that the CONTRACTIONS2 patterns, fused into a single pass, give
+        the same output as when they are applied one after the other
+        """
+        from nltk.tokenize import destructive, treebank
+
+        class Tokenizer(NLTKWordTokenizer):
+            # A backreference keeps these patterns from being fused
+            CONTRACTIONS2 = NLTKWordTokenizer.CONTRACTIONS2 + [
+                re.compile(r"(?i)\b(x)(\1)\b")
+            ]
+
+        tokenizers = [NLTKWordTokenizer(), TreebankWordTokenizer(), Tokenizer()]
+        detokenizer = TreebankWordDetokenizer()
+        fused = [tokenizer.tokenize(text) for tokenizer in tokenizers]
+        fused.append(detokenizer.detokenize(text.split()))
+
+        def sequential_passes(contractions, template):
+            return [(regexp, template) for regexp in contractions]
+
+        monkeypatch.setattr(destructive, "_contractions_passes", sequential_passes)
+        monkeypatch.setattr(treebank, "_contractions_passes", sequential_passes)
+        expected = [tokenizer.tokenize(text) for tokenizer in tokenizers]
+        expected.append(detokenizer.detokenize(text.split()))
+        assert fused == expected
+
+    def test_fuse_substitutions(self):
+        """
+        Test fusing substitutions with different templates, and substitutions
+        that cannot be fused
+        """
+        rules = [
+            (re.compile(r"a|b"), r"<\g<0>>"),
+            (re.compile(r"(c)(d)?"), r"\2\1"),
+            (re.compile(r"e"), "E"),
+        ]
+        regexp, replacement = fuse_substitutions(rules)
+        text = "abcdce-abc"
+        expected = text
+        for rule, template in rules:
+            expected = rule.sub(template, expected)
+        assert regexp.sub(replacement, text) == expected == "<a><b>dccE-<a><b>c"
+
+        with pytest.raises(ValueError):
+            fuse_substitutions([(re.compile("(?i)a"), "b"), (re.compile("c"), "d")])
+        with pytest.raises(ValueError):
+            fuse_substitutions([(re.compile(r"(a)\1"), "b"), (re.compile("c"), "d")])
+        with pytest.raises(ValueError):
+            fuse_substitutions([(re.compile("a"), str.upper), (re.compile("c"), "d")])
+
     def test_word_tokenize(self):
         """
         Test word_tokenize function
@@ -837,6 +963,63 @@ class TestTokenize:
         # The sentence should be split into two sections,
         # with one split and hence one decision.
 
+    def test_punkt_train_parallel(self):
+        """
+        Test that training on shards of a text finds the same parameters as
+        training on the whole text.
+        """
+        sentences = [
+            "Mr. Smith went to Washington.",
+            "He met Dr. Jones at 3 p.m. on Jan. 5.",
+            "They said hello, e.g. to the U.S. team.",
+            "i.e. nothing happened.\n",
+            "Then, St. Louis called!",
+            "\n\nA new paragraph starts here.",
+            "The Inc. and the Co. merged; etc., etc.",
+        ]
+        text = " ".join(sentences * 20)
+        chunks = [text[i : i + 37] for i in range(0, len(text), 37)]
+
+        expected = punkt.PunktTrainer()
+        expected.INCLUDE_ALL_COLLOCS = True
+        expected.train(text)
+        trainer = punkt.PunktTrainer()
+        trainer.INCLUDE_ALL_COLLOCS = True
+        trainer.train_parallel(chunks, workers=1, shard_size=100)
+
+        params, expected_params = trainer.get_params(), expected.get_params()
+        assert expected_params.abbrev_types
+        assert params.abbrev_types == expected_params.abbrev_types
+        assert params.collocations == expected_params.collocations
+        assert params.sent_starters == expected_params.sent_starters
+        assert params.ortho_context == expected_params.ortho_context
+        with pytest.raises(TypeError):
+            trainer.train_parallel(iter(chunks))
+
+    def test_punkt_statistics_merge(self):
+        def stats(types, candidates):
+            result = punkt.PunktStatistics()
+            result.type_fdist.update(types)
+            for typ, next_typ in candidates:
+                result.add_rare_abbrev_candidate(typ, next_typ)
+            return result
+
+        def parts():
+            return (
+                stats(["a", "b."], [("x", "y")]),
+                stats(["b.", "c"], [("x", None), ("y", "z")]),
+                stats(["a"], [("x", "w"), ("y", "z"), ("y", "z")]),
+            )
+
+        a, b, c = parts()
+        left = a.merge(b).merge(c)
+        a, b, c = parts()
+        right = a.merge(b.merge(c))
+        assert left.type_fdist == right.type_fdist == {"a": 2, "b.": 2, "c": 1}
+        assert left.rare_abbrev_candidates == right.rare_abbrev_candidates
+        # Repeated pairs are stored once, and None settles a type
+        assert left.rare_abbrev_candidates == {"x": {None}, "y": {"z"}}
+
     @pytest.mark.parametrize(
         "sentences, expected",
         [
@@ -865,3 +1048,64 @@ class TestTokenize:
     )
     def test_sent_tokenize(self, sentences: str, expected: List[str]):
         assert sent_tokenize(sentences) == expected
+
+    def test_iter_word_tokenize(self, monkeypatch, tmp_path):
+        """
+        Test that streaming tokenization gives the tokens and offsets of
+        tokenizing the whole text, wherever the chunks are cut.
+        """
+        import nltk.tokenize
+
+        sent_tokenizer = punkt.PunktSentenceTokenizer()
+        monkeypatch.setattr(nltk.tokenize, "load", lambda url: sent_tokenizer)
+        text = (
+            "Good muffins cost $3.88\nin New York.  Please buy me\ntwo of them."
+            ' "Thanks," he said!!! Then\tleft...  Dr. Who said: "Bye."\n'
+        )
+        expected = word_tokenize(text)
+        records = [
+            (index, token, (start + s, start + e))
+            for index, (start, end) in enumerate(sent_tokenizer.span_tokenize(text))
+            for token, (s, e) in zip(
+                word_tokenize(text[start:end], preserve_line=True),
+                NLTKWordTokenizer().span_tokenize(text[start:end]),
+            )
+        ]
+        for size in (1, 2, 7, 16, len(text)):
+            chunks = [text[i : i + size] for i in range(0, len(text), size)]
+            assert list(iter_word_tokenize(chunks)) == expected
+            assert list(iter_word_tokenize(chunks, spans=True)) == records
+
+        path = tmp_path / "text.txt"
+        path.write_text(text, encoding="utf-8")
+        assert list(iter_word_tokenize(path, chunk_size=5)) == expected
+        with open(path, encoding="utf-8") as fin:
+            assert list(iter_word_tokenize(fin, chunk_size=5)) == expected
+        with open(path, "rb") as fin:
+            assert list(iter_word_tokenize(fin, chunk_size=5)) == expected
+
+    def test_iter_word_tokenize_without_sentence_breaks(self, monkeypatch):
+        """
+        Test that text without sentence-final punctuation, such as a log, is
+        tokenized as it is read rather than held back as one sentence.
+        """
+        import nltk.tokenize
+
+        sent_tokenizer = punkt.PunktSentenceTokenizer()
+        monkeypatch.setattr(nltk.tokenize, "load", lambda url: sent_tokenizer)
+        line = "2023-01-01 INFO worker 17 started job 42 on host alpha\n"
+        read = []
+
+        def chunks():
+            for _ in range(2000):
+                read.append(len(line))
+                yield line
+
+        tokens = []
+        for _, token, (start, end) in iter_word_tokenize(
+            chunks(), spans=True, max_sentence_length=1000
+        ):
+            # No more than max_sentence_length and a chunk is held back
+            assert sum(read) - end <= 1000 + len(line)
+            tokens.append(token)
+        assert tokens == line.split() * 2000
@@ -59,6 +59,12 @@ tokenization, see the other methods provided in this package.
 For further information, please see Chapter 3 of the NLTK book.
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.tokenize" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
+import codecs as _codecs
+import os as _os
 import re
 
 from nltk.data import load
@@ -130,3 +136,172 @@ def word_tokenize(text, language="english", preserve_line=False):
     return [
         token for sent in sentences for token in _treebank_word_tokenizer.tokenize(sent)
     ]
+
+
+def iter_word_tokenize(
+    source,
+    language="english",
+    spans=False,
+    encoding="utf-8",
+    chunk_size=65536,
+    max_sentence_length=10000,
+):
+    """
+    Lazily tokenize a stream of text, yielding the same tokens as
+    `word_tokenize` would for the whole of it.
+
+    The text is read in chunks of ``chunk_size`` characters, and a sentence
+    is tokenized as soon as the next one has started, so memory use does not
+    grow with the length of the text.  A sentence longer than
+    ``max_sentence_length`` characters, e.g. in a log without sentence-final
+    punctuation, is broken at whitespace rather than held back whole, so that
+    memory use stays bounded; only for such sentences do the tokens differ
+    from those of `word_tokenize`.
+
+        >>> from nltk.tokenize import iter_word_tokenize
+        >>> chunks = ["Good muffins cost $3.88\\nin New York.  Ple", "ase buy me two."]
+        >>> list(iter_word_tokenize(chunks)) # doctest: +NORMALIZE_WHITESPACE
+        ['Good', 'muffins', 'cost', '$', '3.88', 'in', 'New', 'York', '.',
+        'Please', 'buy', 'me', 'two', '.']
+        >>> list(iter_word_tokenize(chunks, spans=True))[-5:] # doctest: +NORMALIZE_WHITESPACE
+        [(1, 'Please', (38, 44)), (1, 'buy', (45, 48)), (1, 'me', (49, 51)),
+        (1, 'two', (52, 55)), (1, '.', (55, 56))]
+
+    :param source: A path, a file object opened in text or binary mode, or an
+        iterable of ``str`` or ``bytes`` chunks. A ``str`` is taken as a path.
+    :param language: the model name in the Punkt corpus
+    :type language: str
+    :param spans: If True, yield ``(sentence_index, token, (start, end))``
+        records, where ``start`` and ``end`` are character offsets in the
+        whole text, instead of tokens.
+    :type spans: bool
+    :param encoding: Encoding of paths and ``bytes`` chunks.
+    :type encoding: str
+    :param chunk_size: Number of characters (or bytes) read at a time from
+        paths and file objects.
+    :type chunk_size: int
+    :param max_sentence_length: Longest sentence, in characters, that is
+        held back whole: longer ones are broken at their last whitespace
+        before this length, or at this length if they have none.
+    :type max_sentence_length: int
+    """
+    sent_tokenizer = load(f"tokenizers/punkt/{language}.pickle")
+    sentences = _iter_sentences(
+        _read_chunks(source, encoding, chunk_size), sent_tokenizer, max_sentence_length
+    )
+    for index, (offset, sent) in enumerate(sentences):
+        tokens = _treebank_word_tokenizer.tokenize(sent)
+        if not spans:
+            yield from tokens
+            continue
+        for token, (start, end) in zip(
+            tokens, _treebank_word_tokenizer._spans(sent, tokens)
+        ):
+            yield index, token, (offset + start, offset + end)
+
+
+def _read_chunks(source, encoding, chunk_size):
+    """Yield the text of ``source`` as ``str`` chunks."""
+    if isinstance(source, (str, _os.PathLike)):
+        with open(source, encoding=encoding) as fin:
+            yield from _read_chunks(fin, encoding, chunk_size)
+        return
+    if hasattr(source, "read"):
+        read = source.read
+        source = iter(lambda: read(chunk_size), read(0))
+    decoder = _codecs.getincrementaldecoder(encoding)()
+    for chunk in source:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _iter_sentences(chunks, sent_tokenizer, max_length):
+    """Yield ``(offset, sentence)`` for the sentences of the text in ``chunks``.
+
+    Only text up to the last whitespace is split into sentences, so that
+    every word is complete, and the last of those sentences is held back
+    until the text after it is known, as Punkt looks at the following word
+    to decide on a sentence break.  Each chunk is only scanned from the last
+    word before it, which is all the context Punkt needs, so the time is
+    linear in the length of the text; a held back sentence longer than
+    ``max_length`` is broken at whitespace.
+    """
+    buffer = ""  # from the start of the word of the held back sentence
+    offset = 0  # of buffer in the whole text
+    first = 0  # start of the held back sentence in buffer
+    scanned = 0  # end of the text of buffer already split into sentences
+    for chunk in chunks:
+        buffer += chunk
+        cut = len(buffer)
+        while cut > scanned and not buffer[cut - 1].isspace():
+            cut -= 1
+        sentences = []
+        if cut > scanned:
+            sentences = _split_sentences(buffer, first, scanned, cut, sent_tokenizer)
+        if sentences:
+            # The last word has no word after it yet, so the breaks in and
+            # after it are not decided: hold back the sentence it starts in,
+            # and the buffer from the start of the word that sentence starts
+            # in, as the context of the breaks in that word
+            last = _word_start(buffer, cut)
+            held = len(sentences) - 1
+            while held > 0 and sentences[held][0] > last:
+                held -= 1
+            for start, end in sentences[:held]:
+                yield offset + start, buffer[start:end]
+            first = sentences[held][0]
+            keep = _word_start(buffer, first + 1)
+            buffer = buffer[keep:]
+            offset += keep
+            first -= keep
+            scanned = cut - keep
+        while len(buffer) - first > max_length:
+            # Break at the last whitespace before max_length, or in the word
+            end = first + max_length
+            while end > first and not buffer[end - 1].isspace():
+                end -= 1
+            if not buffer[first:end].strip():
+                end = first + max_length
+            sentence = buffer[first : len(buffer[:end].rstrip())]
+            if sentence:
+                yield offset + first, sentence
+            keep = len(buffer) - len(buffer[end:].lstrip())
+            buffer = buffer[keep:]
+            offset += keep
+            first = 0
+            scanned = max(scanned - keep, 0)
+    sentences = _split_sentences(buffer, first, scanned, len(buffer), sent_tokenizer)
+    for start, end in sentences:
+        yield offset + start, buffer[start:end]
+
+
+def _split_sentences(buffer, first, scanned, end, sent_tokenizer):
+    """Return the ``(start, end)`` spans of the sentences of ``buffer[first:end]``,
+    of which there are none if it is only whitespace.
+
+    ``buffer[first:scanned]`` has already been split and holds one sentence,
+    so only the text from its last word onwards is scanned again: the break
+    after that word could not be decided without the word that follows it.
+    """
+    start = _word_start(buffer, scanned)
+    spans = [
+        (start + sent_start, start + sent_end)
+        for sent_start, sent_end in sent_tokenizer.span_tokenize(buffer[start:end])
+    ]
+    if spans:
+        spans[0] = (first, spans[0][1])
+    return spans
+
+
+def _word_start(text, end):
+    """Return the start of the last word of ``text[:end]``, or 0."""
+    while end > 0 and text[end - 1].isspace():
+        end -= 1
+    while end > 0 and not text[end - 1].isspace():
+        end -= 1
+    return end
@@ -44,11 +44,17 @@ domains and tasks. The basic logic is this:
 ######################################################################
 
 import html
-from typing import List
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
 import regex  # https://github.com/nltk/nltk/issues/2409
 
 from nltk.tokenize.api import TokenizerI
+from nltk.tokenize.util import _ordered_map
 
 ######################################################################
 # The following strings are components in the regular expression
@@ -227,6 +233,9 @@ HANDLES_RE = regex.compile(
     r"(([A-Za-z0-9_]){15}(?!@)|([A-Za-z0-9_]){1,14}(?![A-Za-z0-9_]*@))"
 )
 
+# For normalizing word lengthening:
+LENGTHENING_RE = regex.compile(r"(.)\1{2,}")
+
 
 ######################################################################
 # Functions for converting html entities
@@ -297,7 +306,10 @@ def _replace_html_entities(text, keep=(), remove_illegal=True, encoding="utf-8")
 
         return "" if remove_illegal else match.group(0)
 
-    return ENT_RE.sub(_convert_entity, _str_to_unicode(text, encoding))
+    text = _str_to_unicode(text, encoding)
+    if "&" not in text:
+        return text
+    return ENT_RE.sub(_convert_entity, text)
 
 
 ######################################################################
@@ -365,6 +377,110 @@ class TweetTokenizer(TokenizerI):
         :return: a tokenized list of strings; joining this list returns\
         the original string if `preserve_case=False`.
         """
+        words = self._words(text)
+        # Possibly alter the case, but avoid changing emoticons like :D into :d:
+        if not self.preserve_case:
+            words = list(
+                map((lambda x: x if EMOTICON_RE.search(x) else x.lower()), words)
+            )
+        return words
+
+    def tokenize_many(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = 1,
+        cache_size: int = 4096,
+        batch_size: int = 256,
+    ) -> Iterator[List[str]]:
+        """
+        Tokenize a stream of texts, yielding the same token lists as
+        `tokenize`, in order.
+
+            >>> from nltk.tokenize import TweetTokenizer
+            >>> tknzr = TweetTokenizer(preserve_case=False)
+            >>> tweets = ["RT @nltk_org: Tokenize ALL the tweets :D", "I &lt;3 NLTK"]
+            >>> for tokens in tknzr.tokenize_many(tweets + tweets[:1]):
+            ...     print(tokens)
+            ['rt', '@nltk_org', ':', 'tokenize', 'all', 'the', 'tweets', ':D']
+            ['i', '<3', 'nltk']
+            ['rt', '@nltk_org', ':', 'tokenize', 'all', 'the', 'tweets', ':D']
+
+        ``texts`` is read lazily, ``batch_size`` texts at a time, so it can
+        be an unbounded stream such as a Twitter firehose. Exact duplicates
+        of any of the last ``cache_size`` distinct texts, e.g. retweets, are
+        only tokenized once, and so are the words of a batch that are
+        lowercased when `preserve_case` is False.
+
+        With several ``workers``, the batches are tokenized in a pool of
+        worker processes. This only pays off for long streams, as the texts
+        and their tokens are pickled to and from the workers.
+
+        :param texts: The texts to tokenize.
+        :type texts: iterable(str)
+        :param workers: Number of worker processes; 1 tokenizes in this
+            process, and None uses all CPUs.
+        :type workers: int or None
+        :param cache_size: Number of distinct texts whose tokens are kept,
+            or 0 for no cache.
+        :type cache_size: int
+        :param batch_size: Number of texts tokenized at a time.
+        :type batch_size: int
+        :rtype: iter(list(str))
+        """
+        workers = workers or os.cpu_count() or 1
+        cache = OrderedDict()
+        pending = deque()
+
+        def uncached_texts():
+            iterator = iter(texts)
+            for batch in iter(lambda: list(islice(iterator, batch_size)), []):
+                # The tokens of cached texts are looked up now, in case they
+                # are evicted before the batch is done
+                known = {}
+                for text in batch:
+                    if text in cache:
+                        known[text] = cache[text]
+                        cache.move_to_end(text)
+                new = list(dict.fromkeys(text for text in batch if text not in known))
+                pending.append((batch, known, new))
+                yield new
+
+        executor = ProcessPoolExecutor(workers) if workers > 1 else None
+        with executor or nullcontext():
+            for tokens in _ordered_map(
+                executor, workers, self._tokenize_batch, uncached_texts()
+            ):
+                batch, known, new = pending.popleft()
+                for text, words in zip(new, tokens):
+                    known[text] = words
+                    if cache_size:
+                        cache[text] = words
+                        if len(cache) > cache_size:
+                            cache.popitem(last=False)
+                for text in batch:
+                    yield list(known[text])
+
+    def _tokenize_batch(self, texts):
+        """
+        Tokenize each of ``texts`` like `tokenize`, returning tuples of
+        tokens.
+        """
+        batch = []
+        lowered = {}
+        for text in texts:
+            words = self._words(text)
+            if not self.preserve_case:
+                for i, word in enumerate(words):
+                    if word not in lowered:
+                        lowered[word] = (
+                            word if EMOTICON_RE.search(word) else word.lower()
+                        )
+                    words[i] = lowered[word]
+            batch.append(tuple(words))
+        return batch
+
+    def _words(self, text):
+        """The tokens of ``text``, in their original case."""
         # Fix HTML character entities:
         text = _replace_html_entities(text)
         # Remove username handles
@@ -380,11 +496,6 @@ class TweetTokenizer(TokenizerI):
             words = self.PHONE_WORD_RE.findall(safe_text)
         else:
             words = self.WORD_RE.findall(safe_text)
-        # Possibly alter the case, but avoid changing emoticons like :D into :d:
-        if not self.preserve_case:
-            words = list(
-                map((lambda x: x if EMOTICON_RE.search(x) else x.lower()), words)
-            )
         return words
 
     @property
@@ -420,14 +531,15 @@ def reduce_lengthening(text):
     Replace repeated character sequences of length 3 or greater with sequences
     of length 3.
     """
-    pattern = regex.compile(r"(.)\1{2,}")
-    return pattern.sub(r"\1\1\1", text)
+    return LENGTHENING_RE.sub(r"\1\1\1", text)
 
 
 def remove_handles(text):
     """
     Remove Twitter username handles from text.
     """
+    if "@" not in text:
+        return text
     # Substitute handles with ' ' to ensure that text on either side of removed handles are tokenized correctly
     return HANDLES_RE.sub(" ", text)
 
@@ -9,10 +9,11 @@
 
 import re
 import warnings
+from functools import lru_cache
 from typing import Iterator, List, Tuple
 
 from nltk.tokenize.api import TokenizerI
-from nltk.tokenize.util import align_tokens
+from nltk.tokenize.util import align_tokens, fuse_substitutions
 
 
 class MacIntyreContractions:
@@ -177,8 +178,10 @@ class NLTKWordTokenizer(TokenizerI):
         for regexp, substitution in self.ENDING_QUOTES:
             text = regexp.sub(substitution, text)
 
-        for regexp in self.CONTRACTIONS2:
-            text = regexp.sub(r" \1 \2 ", text)
+        for regexp, substitution in _contractions_passes(
+            tuple(self.CONTRACTIONS2), r" \1 \2 "
+        ):
+            text = regexp.sub(substitution, text)
         for regexp in self.CONTRACTIONS3:
             text = regexp.sub(r" \1 \2 ", text)
 
@@ -192,7 +195,11 @@ class NLTKWordTokenizer(TokenizerI):
     def span_tokenize(self, text: str) -> Iterator[Tuple[int, int]]:
         r"""
         Returns the spans of the tokens in ``text``.
-        Uses the post-hoc nltk.tokens.align_tokens to return the offset spans.
+
+        The rules of `tokenize` only insert spaces and turn double quotes into
+        ``` `` ``` or ``''``, so the tokens are walked in step with ``text``:
+        each token starts at the next non-whitespace character, and a converted
+        quote covers the ``"``, ``` `` ``` or ``''`` found there.
 
             >>> from nltk.tokenize import NLTKWordTokenizer
             >>> s = '''Good muffins cost $3.88\nin New (York).  Please (buy) me\ntwo of them.\n(Thanks).'''
@@ -207,27 +214,78 @@ class NLTKWordTokenizer(TokenizerI):
             ... 'me', 'two', 'of', 'them.', '(', 'Thanks', ')', '.']
             >>> [s[start:end] for start, end in NLTKWordTokenizer().span_tokenize(s)] == expected
             True
+            >>> s = '''He said "no" and ''left''.'''
+            >>> [s[start:end] for start, end in NLTKWordTokenizer().span_tokenize(s)]
+            ['He', 'said', '"', 'no', '"', 'and', "''", 'left', "''", '.']
 
         :param text: A string with a sentence or sentences.
         :type text: str
         :yield: Tuple[int, int]
         """
-        raw_tokens = self.tokenize(text)
-
+        yield from self._spans(text, self.tokenize(text))
+
+    def _spans(self, text, raw_tokens):
+        """The spans in ``text`` of ``raw_tokens``, the tokens of ``text``."""
+        spans = []
+        end = 0
+        for tok in raw_tokens:
+            start = end
+            if not text.startswith(tok, start):
+                start = _WHITESPACE.match(text, end).end()
+            if text.startswith(tok, start):
+                end = start + len(tok)
+            elif tok in ("``", "''") and text.startswith('"', start):
+                end = start + 1
+            elif tok in ("``", "''") and text[start : start + 2] in ("``", "''"):
+                end = start + 2
+            else:
+                # Not produced by the rules of `tokenize`, e.g. by a subclass
+                return self._align_span_tokenize(text, raw_tokens)
+            spans.append((start, end))
+        return spans
+
+    def _align_span_tokenize(self, text, raw_tokens):
+        """Find the spans of ``raw_tokens`` with `align_tokens`."""
         # Convert converted quotes back to original double quotes
         # Do this only if original text contains double quote(s) or double
         # single-quotes (because '' might be transformed to `` if it is
         # treated as starting quotes).
         if ('"' in text) or ("''" in text):
             # Find double quotes and converted quotes
-            matched = [m.group() for m in re.finditer(r"``|'{2}|\"", text)]
+            matched = (m.group() for m in re.finditer(r"``|'{2}|\"", text))
 
             # Replace converted quotes back to double quotes
             tokens = [
-                matched.pop(0) if tok in ['"', "``", "''"] else tok
-                for tok in raw_tokens
+                next(matched) if tok in ['"', "``", "''"] else tok for tok in raw_tokens
             ]
         else:
             tokens = raw_tokens
 
-        yield from align_tokens(tokens, text)
+        return align_tokens(tokens, text)
+
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+@lru_cache(maxsize=16)
+def _contractions_passes(contractions, template):
+    """
+    The substitutions that apply ``template`` to the matches of the
+    ``CONTRACTIONS2`` patterns of a Treebank-style tokenizer, fused into a
+    single pass where possible.
+
+    Each of these patterns matches a whole word, and is tried at every word
+    boundary, so one pass that tests each boundary once is much faster than a
+    pass per pattern.
+
+    :param contractions: The compiled ``CONTRACTIONS2`` patterns.
+    :type contractions: tuple(re.Pattern)
+    :param template: The replacement for each match.
+    :type template: str
+    :rtype: tuple(tuple(re.Pattern, str))
+    """
+    rules = [(regexp, template) for regexp in contractions]
+    try:
+        return (fuse_substitutions(rules),)
+    except ValueError:
+        return tuple(rules)
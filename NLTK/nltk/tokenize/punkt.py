@@ -105,14 +105,19 @@ The algorithm for this tokenizer is described in::
 # TODO: Frequent sentence starters optionally exclude always-capitalised words
 # FIXME: Problem with ending string with e.g. '!!!' -> '!! !'
 
+import copy
 import math
+import os
 import re
 import string
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from typing import Any, Dict, Iterator, List, Match, Optional, Tuple, Union
 
 from nltk.probability import FreqDist
 from nltk.tokenize.api import TokenizerI
+from nltk.tokenize.util import _ordered_map
 
 ######################################################################
 # { Orthographic Context Constants
@@ -633,6 +638,76 @@ class PunktBaseClass:
 ######################################################################
 
 
+class PunktStatistics:
+    """
+    Training data gathered by `PunktTrainer.train_parallel` over a shard
+    of text. The statistics of consecutive shards are combined with
+    `merge`, which is associative: shards may be merged in any grouping,
+    as long as their order in the text is kept.
+    """
+
+    def __init__(self):
+        self.type_fdist = FreqDist()
+        """The frequency of each case-normalized token type."""
+
+        self.num_period_toks = 0
+        """The number of words ending in period."""
+
+        self.collocation_fdist = FreqDist()
+        """The frequency of potential collocations."""
+
+        self.sent_starter_fdist = FreqDist()
+        """The frequency of potential sentence starters."""
+
+        self.sentbreak_count = 0
+        """The number of sentence breaks."""
+
+        self.ortho_context = defaultdict(int)
+        """The orthographic contexts of each token type."""
+
+        self.rare_abbrev_candidates = {}
+        """Maps each type that may be a rare abbreviation to the set of
+        types of the tokens following it. The set ``{None}`` stands for a
+        sentence-internal punctuation mark, which settles the question
+        whatever the other tokens are. Repeated pairs are only stored
+        once, so this grows with the vocabulary rather than the text."""
+
+    def merge(self, other):
+        """
+        Adds the statistics of ``other``, gathered over the text following
+        that of these statistics, to these statistics.
+
+        :return: self
+        :rtype: PunktStatistics
+        """
+        self.type_fdist.update(other.type_fdist)
+        self.num_period_toks += other.num_period_toks
+        self.collocation_fdist.update(other.collocation_fdist)
+        self.sent_starter_fdist.update(other.sent_starter_fdist)
+        self.sentbreak_count += other.sentbreak_count
+        for typ, flag in other.ortho_context.items():
+            self.ortho_context[typ] |= flag
+        for typ, next_types in other.rare_abbrev_candidates.items():
+            for next_typ in next_types:
+                self.add_rare_abbrev_candidate(typ, next_typ)
+        return self
+
+    def add_rare_abbrev_candidate(self, typ, next_typ):
+        """
+        Records that ``typ`` may be a rare abbreviation, as it is followed
+        by a token of type ``next_typ``, or by a sentence-internal
+        punctuation mark if ``next_typ`` is None.
+        """
+        next_types = self.rare_abbrev_candidates.get(typ)
+        if next_types is None:
+            self.rare_abbrev_candidates[typ] = {next_typ}
+        elif next_typ is None:
+            next_types.clear()
+            next_types.add(None)
+        elif None not in next_types:
+            next_types.add(next_typ)
+
+
 class PunktTrainer(PunktBaseClass):
     """Learns parameters used in Punkt sentence boundary detection."""
 
@@ -766,18 +841,7 @@ class PunktTrainer(PunktBaseClass):
                 self._num_period_toks += 1
 
         # Look for new abbreviations, and for types that no longer are
-        unique_types = self._unique_types(tokens)
-        for abbr, score, is_add in self._reclassify_abbrev_types(unique_types):
-            if score >= self.ABBREV:
-                if is_add:
-                    self._params.abbrev_types.add(abbr)
-                    if verbose:
-                        print(f"  Abbreviation: [{score:6.4f}] {abbr}")
-            else:
-                if not is_add:
-                    self._params.abbrev_types.remove(abbr)
-                    if verbose:
-                        print(f"  Removed abbreviation: [{score:6.4f}] {abbr}")
+        self._update_abbrev_types(self._unique_types(tokens), verbose)
 
         # Make a preliminary pass through the document, marking likely
         # sentence breaks, abbreviations, and ellipsis tokens.
@@ -815,6 +879,214 @@ class PunktTrainer(PunktBaseClass):
     def _unique_types(self, tokens):
         return {aug_tok.type for aug_tok in tokens}
 
+    def _update_abbrev_types(self, unique_types, verbose):
+        for abbr, score, is_add in self._reclassify_abbrev_types(unique_types):
+            if score >= self.ABBREV:
+                if is_add:
+                    self._params.abbrev_types.add(abbr)
+                    if verbose:
+                        print(f"  Abbreviation: [{score:6.4f}] {abbr}")
+            else:
+                if not is_add:
+                    self._params.abbrev_types.remove(abbr)
+                    if verbose:
+                        print(f"  Removed abbreviation: [{score:6.4f}] {abbr}")
+
+    def train_parallel(
+        self, texts, verbose=False, finalize=True, workers=None, shard_size=1 << 20
+    ):
+        """
+        Collects training data from the concatenation of ``texts``, like
+        `train` does from a single string, with the same resulting
+        parameters, but using a pool of worker processes.
+
+        The text is cut at line breaks into shards of about ``shard_size``
+        characters, which are read twice: once to count word types, from
+        which abbreviations are found, and once to gather the remaining
+        statistics given those abbreviations. The `PunktStatistics` of the
+        shards are merged in text order by the calling process. ``texts``
+        has to be re-iterable, e.g. a list of strings or a corpus view.
+
+        :param texts: A re-iterable collection of strings, whose
+            concatenation is the training text.
+        :param workers: Number of worker processes; all CPUs if None.
+        :type workers: int or None
+        :param shard_size: Number of characters sent to a worker at a time.
+        :type shard_size: int
+        """
+        if iter(texts) is texts:
+            raise TypeError("texts: expected a re-iterable collection")
+        self._finalized = False
+        workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(workers) if workers > 1 else None
+        with executor or nullcontext():
+            # Type frequencies, and abbreviations from them
+            stats = PunktStatistics()
+            last_toks = []
+            shard_trainer = self._shard_trainer()
+            for shard_stats, last_tok in _ordered_map(
+                executor,
+                workers,
+                shard_trainer._count_shard_types,
+                self._line_shards(texts, shard_size),
+            ):
+                stats.merge(shard_stats)
+                last_toks.append(last_tok)
+            self._type_fdist.update(stats.type_fdist)
+            self._num_period_toks += stats.num_period_toks
+            self._update_abbrev_types(set(stats.type_fdist), verbose)
+
+            # Each shard continues from the last token of the shards before it
+            prev_toks = []
+            prev_tok = None
+            for last_tok in last_toks:
+                prev_toks.append(prev_tok)
+                if last_tok is not None:
+                    prev_tok = last_tok
+
+            stats = PunktStatistics()
+            shard_trainer = self._shard_trainer()
+            for shard_stats in _ordered_map(
+                executor,
+                workers,
+                shard_trainer._gather_shard_stats,
+                self._line_shards(texts, shard_size),
+                prev_toks,
+            ):
+                stats.merge(shard_stats)
+
+        for typ, flag in stats.ortho_context.items():
+            self._params.add_ortho_context(typ, flag)
+        self._sentbreak_count += stats.sentbreak_count
+        self._sent_starter_fdist.update(stats.sent_starter_fdist)
+        self._collocation_fdist.update(stats.collocation_fdist)
+
+        # Rare abbreviations need the orthographic contexts of the whole text
+        for typ, next_types in stats.rare_abbrev_candidates.items():
+            count = self._type_fdist[typ] + self._type_fdist[typ[:-1]]
+            if typ in self._params.abbrev_types or count >= self.ABBREV_BACKOFF:
+                continue
+            for next_typ in next_types:
+                if next_typ is not None:
+                    typ2ortho_context = self._params.ortho_context[next_typ]
+                    if not (typ2ortho_context & _ORTHO_BEG_UC) or (
+                        typ2ortho_context & _ORTHO_MID_UC
+                    ):
+                        continue
+                self._params.abbrev_types.add(typ)
+                if verbose:
+                    print("  Rare Abbrev: %s." % typ)
+                break
+
+        if finalize:
+            self.finalize_training(verbose)
+
+    def _line_shards(self, texts, shard_size):
+        """
+        Yields the concatenation of ``texts`` in shards of about
+        ``shard_size`` characters. Each shard but the last ends with the
+        line break after a line with tokens, so that a shard tokenizes as
+        the same text does within the whole.
+        """
+        pieces = []
+        size = 0
+        for text in texts:
+            pieces.append(text)
+            size += len(text)
+            if size < shard_size:
+                continue
+            buffer = "".join(pieces)
+            cut = buffer.rfind("\n")
+            while cut > 0:
+                line = buffer[buffer.rfind("\n", 0, cut) + 1 : cut]
+                tokens = iter(self._lang_vars.word_tokenize(line))
+                if line.strip() and next(tokens, None) is not None:
+                    break
+                cut = buffer.rfind("\n", 0, cut)
+            else:
+                # No line with tokens is complete yet
+                pieces = [buffer]
+                continue
+            yield buffer[: cut + 1]
+            pieces = [buffer[cut + 1 :]]
+            size = len(pieces[0])
+        buffer = "".join(pieces)
+        if buffer:
+            yield buffer
+
+    def _shard_trainer(self):
+        """
+        Returns a copy of this trainer without its training data, but with
+        its abbreviations, to gather the statistics of shards.
+        """
+        trainer = copy.copy(self)
+        trainer._type_fdist = FreqDist()
+        trainer._num_period_toks = 0
+        trainer._collocation_fdist = FreqDist()
+        trainer._sent_starter_fdist = FreqDist()
+        trainer._sentbreak_count = 0
+        trainer._params = PunktParameters()
+        trainer._params.abbrev_types = set(self._params.abbrev_types)
+        return trainer
+
+    def _count_shard_types(self, text):
+        """
+        Returns the type frequencies of a shard of text, and its last token.
+        """
+        stats = PunktStatistics()
+        aug_tok = None
+        for aug_tok in self._tokenize_words(text):
+            stats.type_fdist[aug_tok.type] += 1
+            if aug_tok.period_final:
+                stats.num_period_toks += 1
+        return stats, None if aug_tok is None else aug_tok.tok
+
+    def _gather_shard_stats(self, text, prev_tok):
+        """
+        Returns the statistics of a shard of text other than type
+        frequencies, given ``prev_tok``, the token before the shard.
+        """
+        stats = PunktStatistics()
+        tokens = list(self._annotate_first_pass(self._tokenize_words(text)))
+
+        context = "internal"
+        if prev_tok is not None:
+            prev_tok = self._Token(prev_tok)
+            self._first_pass_annotation(prev_tok)
+            context = self._next_ortho_context(prev_tok)
+        self._params.clear_ortho_context()
+        self._get_orthography_data(tokens, context)
+        stats.ortho_context = self._params.ortho_context
+        stats.sentbreak_count = self._get_sentbreak_count(tokens)
+
+        if prev_tok is not None:
+            tokens.insert(0, prev_tok)
+        for aug_tok1, aug_tok2 in _pair_iter(tokens):
+            if not aug_tok1.period_final or not aug_tok2:
+                continue
+
+            # The rare abbreviation heuristic of _is_rare_abbrev_type, but
+            # for the orthographic contexts, which are known after merging
+            if (
+                aug_tok1.sentbreak
+                and not aug_tok1.abbr
+                and aug_tok1.type_no_sentperiod not in self._params.abbrev_types
+            ):
+                typ = aug_tok1.type_no_sentperiod
+                if aug_tok2.tok[:1] in self._lang_vars.internal_punctuation:
+                    stats.add_rare_abbrev_candidate(typ, None)
+                elif aug_tok2.first_lower:
+                    stats.add_rare_abbrev_candidate(typ, aug_tok2.type_no_sentperiod)
+
+            if self._is_potential_sent_starter(aug_tok2, aug_tok1):
+                stats.sent_starter_fdist[aug_tok2.type] += 1
+
+            if self._is_potential_collocation(aug_tok1, aug_tok2):
+                stats.collocation_fdist[
+                    (aug_tok1.type_no_period, aug_tok2.type_no_sentperiod)
+                ] += 1
+        return stats
+
     def finalize_training(self, verbose=False):
         """
         Uses data that has been gathered in training to determine likely
@@ -885,15 +1157,17 @@ class PunktTrainer(PunktBaseClass):
     # { Orthographic data
     # ////////////////////////////////////////////////////////////
 
-    def _get_orthography_data(self, tokens):
+    def _get_orthography_data(self, tokens, context="internal"):
         """
         Collect information about whether each token type occurs
         with different case patterns (i) overall, (ii) at
         sentence-initial positions, and (iii) at sentence-internal
         positions.
+
+        ``context``, one of 'initial', 'internal' or 'unknown', is that of
+        the first token, as decided by `_next_ortho_context` from the token
+        before it.
         """
-        # 'initial' or 'internal' or 'unknown'
-        context = "internal"
         tokens = list(tokens)
 
         for aug_tok in tokens:
@@ -919,15 +1193,20 @@ class PunktTrainer(PunktBaseClass):
                 self._params.add_ortho_context(typ, flag)
 
             # Decide whether the next word is at a sentence boundary.
-            if aug_tok.sentbreak:
-                if not (aug_tok.is_number or aug_tok.is_initial):
-                    context = "initial"
-                else:
-                    context = "unknown"
-            elif aug_tok.ellipsis or aug_tok.abbr:
-                context = "unknown"
-            else:
-                context = "internal"
+            context = self._next_ortho_context(aug_tok)
+
+    def _next_ortho_context(self, aug_tok):
+        """
+        Returns the orthographic context of the token after ``aug_tok``,
+        before taking line and paragraph starts into account.
+        """
+        if aug_tok.sentbreak:
+            if not (aug_tok.is_number or aug_tok.is_initial):
+                return "initial"
+            return "unknown"
+        elif aug_tok.ellipsis or aug_tok.abbr:
+            return "unknown"
+        return "internal"
 
     # ////////////////////////////////////////////////////////////
     # { Abbreviations
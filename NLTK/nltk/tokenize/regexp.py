@@ -113,7 +113,10 @@ class RegexpTokenizer(TokenizerI):
         self._gaps = gaps
         self._discard_empty = discard_empty
         self._flags = flags
-        self._regexp = None
+        # Compiled up front, so that the state of a tokenizer does not change
+        # when it is first used (it is part of the key of corpus view offset
+        # indexes); _check_regexp() still compiles it for older pickles.
+        self._regexp = re.compile(pattern, flags)
 
     def _check_regexp(self):
         if self._regexp is None:
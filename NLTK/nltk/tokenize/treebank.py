@@ -22,7 +22,7 @@ import warnings
 from typing import Iterator, List, Tuple
 
 from nltk.tokenize.api import TokenizerI
-from nltk.tokenize.destructive import MacIntyreContractions
+from nltk.tokenize.destructive import MacIntyreContractions, _contractions_passes
 from nltk.tokenize.util import align_tokens
 
 
@@ -157,8 +157,10 @@ class TreebankWordTokenizer(TokenizerI):
         for regexp, substitution in self.ENDING_QUOTES:
             text = regexp.sub(substitution, text)
 
-        for regexp in self.CONTRACTIONS2:
-            text = regexp.sub(r" \1 \2 ", text)
+        for regexp, substitution in _contractions_passes(
+            tuple(self.CONTRACTIONS2), r" \1 \2 "
+        ):
+            text = regexp.sub(substitution, text)
         for regexp in self.CONTRACTIONS3:
             text = regexp.sub(r" \1 \2 ", text)
 
@@ -365,8 +367,10 @@ class TreebankWordDetokenizer(TokenizerI):
         # Note: CONTRACTIONS4 are not used in tokenization.
         for regexp in self.CONTRACTIONS3:
             text = regexp.sub(r"\1\2", text)
-        for regexp in self.CONTRACTIONS2:
-            text = regexp.sub(r"\1\2", text)
+        for regexp, substitution in _contractions_passes(
+            tuple(self.CONTRACTIONS2), r"\1\2"
+        ):
+            text = regexp.sub(substitution, text)
 
         # Reverse the regexes applied for ending quotes.
         for regexp, substitution in self.ENDING_QUOTES:
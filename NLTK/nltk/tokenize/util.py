@@ -5,6 +5,8 @@
 # URL: <https://www.nltk.org>
 # For license information, see LICENSE.TXT
 
+import re
+from collections import deque
 from re import finditer
 from xml.sax.saxutils import escape, unescape
 
@@ -293,3 +295,140 @@ def align_tokens(tokens, sentence):
         point = start + len(token)
         offsets.append((start, point))
     return offsets
+
+
+# Inline flags at the start of a pattern
+_GLOBAL_FLAGS = re.compile(r"(?:\(\?[aiLmsux]+\))*")
+
+# Group references in a replacement template, and other escapes
+_TEMPLATE_ESCAPE = re.compile(r"\\(?:g<(\w+)>|([1-9]\d?))|\\.")
+
+
+def fuse_substitutions(rules):
+    r"""
+    Compile a list of ``(regexp, replacement)`` substitutions into a single
+    ``(regexp, replacement)`` substitution, which applies them in one pass
+    over the text.
+
+        >>> import re
+        >>> from nltk.tokenize.util import fuse_substitutions
+        >>> rules = [(re.compile(r"(?i)\b(can)(not)\b"), r" \1 \2 "),
+        ...          (re.compile(r"(?i)\b(gon)(na)\b"), r" \1 \2 ")]
+        >>> regexp, replacement = fuse_substitutions(rules)
+        >>> regexp.pattern
+        '\\b(?:(can)(not)\\b|(gon)(na)\\b)'
+        >>> regexp.sub(replacement, "Gonna go, cannot stay")
+        ' Gon na  go,  can not  stay'
+
+    The result is the same as that of applying the rules one after the other
+    only if the rules do not interact: no rule may match text that an earlier
+    rule has matched or inserted, or depend on text that another rule
+    changes. Where the matches of two rules start at the same position, the
+    earlier rule wins.
+
+    The rules are combined into one alternation, so the fused pattern loses
+    the fast scan for a leading literal or character set that the ``re``
+    module gives to each of them. Fusing pays off for rules like the
+    contractions above, which are tried at every word boundary anyway, and
+    share that test once fused.
+
+    :param rules: The substitutions, in order. All patterns must have the
+        same flags, and must not contain named groups or backreferences.
+        Replacements must be template strings.
+    :type rules: list(tuple(re.Pattern, str))
+    :return: A compiled pattern, and a template string or a function taking
+        a match object.
+    :rtype: tuple(re.Pattern, str or callable)
+    :raises ValueError: If the rules cannot be fused.
+    """
+    if len(rules) == 1:
+        return rules[0]
+
+    flags = rules[0][0].flags
+    for regexp, replacement in rules:
+        if regexp.flags != flags:
+            raise ValueError(f"Cannot fuse {regexp.pattern!r}: different flags")
+        if regexp.groupindex or re.search(r"\\[1-9]|\(\?P=", regexp.pattern):
+            raise ValueError(f"Cannot fuse {regexp.pattern!r}: group references")
+        if regexp.flags & re.VERBOSE:
+            raise ValueError(f"Cannot fuse {regexp.pattern!r}: verbose pattern")
+        if not isinstance(replacement, str):
+            raise ValueError(f"Cannot fuse {regexp.pattern!r}: not a template")
+
+    # Rules whose templates only differ in their group references share a
+    # template, where the references of the rules that did not match are
+    # replaced by empty strings. Otherwise, an empty group at the end of each
+    # pattern tells which rule matched.
+    skeletons = {
+        tuple(_TEMPLATE_ESCAPE.sub(_reference_skeleton, replacement).split("\0"))
+        for regexp, replacement in rules
+    }
+    shared = len(skeletons) == 1
+
+    patterns = []
+    templates = {}
+    group = 0
+    for regexp, replacement in rules:
+        pattern = regexp.pattern[_GLOBAL_FLAGS.match(regexp.pattern).end() :]
+        if "|" in pattern:
+            pattern = f"(?:{pattern})"
+        # The groups of each rule are renumbered after those of earlier rules
+        template = _TEMPLATE_ESCAPE.sub(
+            lambda m, offset=group: _shift_reference(m, offset), replacement
+        )
+        group += regexp.groups
+        if not shared:
+            pattern += "()"
+            group += 1
+        patterns.append(pattern)
+        templates[group] = template
+
+    # A word boundary that starts every pattern is tested once
+    prefix = ""
+    while all(pattern.startswith(r"\b") for pattern in patterns):
+        prefix += r"\b"
+        patterns = [pattern[2:] for pattern in patterns]
+    regexp = re.compile(f"{prefix}(?:{'|'.join(patterns)})", flags)
+
+    if not shared:
+        return regexp, lambda match: match.expand(templates[match.lastindex])
+    parts = [re.split(r"(\\g<[1-9]\d*>)", template) for template in templates.values()]
+    return regexp, "".join(
+        "".join(pieces) if i % 2 else pieces[0] for i, pieces in enumerate(zip(*parts))
+    )
+
+
+def _reference_skeleton(match):
+    """Replace a group reference in a template by a NUL character."""
+    name, number = match.groups()
+    if name is None and number is None or name == "0":
+        return match.group()
+    return "\0"
+
+
+def _shift_reference(match, offset):
+    """Renumber a group reference in a template by ``offset``."""
+    name, number = match.groups()
+    if name is None and number is None or name == "0":
+        return match.group()
+    if name is not None and not name.isdigit():
+        raise ValueError(f"Cannot fuse a reference to group {name!r}")
+    return rf"\g<{int(name or number) + offset}>"
+
+
+def _ordered_map(executor, workers, func, *iterables):
+    """
+    Yields ``func(*args)`` for the arguments from ``iterables``, in order,
+    computed in ``executor`` with at most two calls per worker in flight,
+    or in this process if ``executor`` is None.
+    """
+    if executor is None:
+        yield from map(func, *iterables)
+        return
+    pending = deque()
+    for args in zip(*iterables):
+        pending.append(executor.submit(func, *args))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
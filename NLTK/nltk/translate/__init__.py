@@ -12,6 +12,10 @@ These interfaces are prone to change.
 isort:skip_file
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.translate" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 from nltk.translate.api import AlignedSent, Alignment, PhraseTable
 from nltk.translate.ibm_model import IBMModel
 from nltk.translate.ibm1 import IBMModel1
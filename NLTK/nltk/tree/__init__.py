@@ -15,6 +15,10 @@ This package may be used for representing hierarchical language
 structures, such as syntax trees and morphological trees.
 """
 
+# The names of this package that are also in the top-level namespace
+# are listed under "nltk.tree" in _LAZY_IMPORTS in nltk/__init__.py;
+# a new export is not in ``nltk.*`` until it is added there.
+
 # TODO: add LabelledTree (can be used for dependency trees)
 
 from nltk.tree.immutable import (
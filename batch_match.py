@@ -0,0 +1,169 @@
+# Headless batch resume matching
+#
+# Matches a directory (or a manifest listing one PDF path per line) of resumes
+# against the persisted job index and streams JSON lines while it works:
+#
+#     python batch_match.py resumes/ --top-k 5 --output matches.jsonl
+#
+# Text extraction and cleaning run in a process pool. Resumes are handled in
+# fixed-size batches, each batch is vectorized into one sparse matrix and
+# queried with a single top-k call, and at most two batches are held in memory
+# at a time (the one being matched and the one being extracted).
+import argparse  # Command line interface
+import json  # JSONL output records
+import os  # File system paths and CPU count
+import sys  # Default output stream
+from multiprocessing import Pool  # Process pool for extraction and cleaning
+
+import job_index  # Persisted TF-IDF index over the job skills
+from pdf_text import MAX_PAGES, read_pdf_text  # PyMuPDF text extraction for PDF files
+from text_cleaning import clean_text, looks_like_resume  # Shared resume and job text cleaning
+
+
+BATCH_SIZE = 256
+
+
+def iter_resume_paths(source):
+    """
+    Yields PDF paths from a directory (searched recursively, in sorted order)
+    or from a manifest file with one path per line.
+
+    Relative paths in a manifest are resolved against the manifest's directory;
+    blank lines and lines starting with '#' are skipped.
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith('.pdf'):
+                    yield os.path.join(root, name)
+    else:
+        base = os.path.dirname(os.path.abspath(source))
+        with open(source, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    yield os.path.join(base, line)
+
+
+def extract_and_clean(path, max_pages=MAX_PAGES):
+    """
+    Worker step: reads, extracts and cleans one resume.
+
+    Returns:
+        tuple: `(path, cleaned_text, error)`, where exactly one of
+        `cleaned_text` and `error` is None.
+    """
+    try:
+        with open(path, 'rb') as f:
+            text = read_pdf_text(f.read(), max_pages=max_pages)
+    except Exception as e:
+        return path, None, f"Failed to extract text from the PDF: {e}"
+    if not text:
+        return path, None, "No text found in the PDF."
+    cleaned = clean_text(text)
+    if not looks_like_resume(cleaned):
+        return path, None, "Not a valid resume PDF."
+    return path, cleaned, None
+
+
+def _extract_batch(paths, max_pages):
+    return [extract_and_clean(path, max_pages) for path in paths]
+
+
+def _batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def match_batch(index, results, top_k):
+    """
+    Vectorizes one batch of cleaned resumes as a single sparse matrix, runs one
+    top-k query and yields the output records in input order.
+    """
+    cleaned_texts = [cleaned for _, cleaned, error in results if error is None]
+    if cleaned_texts:
+        distances, indices = index.kneighbors(index.transform(cleaned_texts), top_k)
+
+    # Read after the query, so it has every job the query returned
+    titles = index.jobs['Job Title']
+    row = 0
+    for path, cleaned, error in results:
+        if error is not None:
+            yield {'file': path, 'error': error}
+            continue
+        for rank, (job, distance) in enumerate(zip(indices[row], distances[row]), start=1):
+            yield {'file': path, 'rank': rank, 'job_title': titles.loc[job], 'score': round(float(1 - distance), 6)}
+        row += 1
+
+
+def run_batch(paths, index, out, top_k=5, workers=None, batch_size=BATCH_SIZE, max_pages=MAX_PAGES):
+    """
+    Matches every resume in `paths` and writes one JSON line per record to `out`.
+
+    Extraction of the next batch runs in the pool while the current batch is
+    being matched and written, so the workers stay busy.
+
+    Returns:
+        int: Number of records written.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, batch_size // (workers * 4))
+    written = 0
+    with Pool(workers) as pool:
+        pending = None
+        for batch in _batches(paths, batch_size):
+            chunks = list(_batches(batch, chunksize))
+            submitted = pool.starmap_async(_extract_batch, [(chunk, max_pages) for chunk in chunks])
+            if pending is not None:
+                written += _write(match_batch(index, _collect(pending), top_k), out)
+            pending = submitted
+        if pending is not None:
+            written += _write(match_batch(index, _collect(pending), top_k), out)
+    return written
+
+
+def _collect(async_result):
+    # Joins the per-chunk result lists back into one list, in input order
+    return [result for chunk in async_result.get() for result in chunk]
+
+
+def _write(records, out):
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False) + '\n')
+        count += 1
+    out.flush()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Match a batch of resume PDFs against the job index.')
+    parser.add_argument('source', help='directory of PDFs, or a manifest file with one PDF path per line')
+    parser.add_argument('--jobs', default='cleaned_file.csv', help='job CSV the index is built from')
+    parser.add_argument('--index-dir', default=job_index.INDEX_DIR, help='directory holding the index artifacts')
+    parser.add_argument('--output', '-o', help='JSONL output file (default: stdout)')
+    parser.add_argument('--top-k', type=int, default=5, help='number of jobs per resume')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='resumes vectorized per query')
+    parser.add_argument('--max-pages', type=int, default=MAX_PAGES, help='reject PDFs with more pages than this')
+    args = parser.parse_args(argv)
+
+    index = job_index.load_index(args.jobs, args.index_dir)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        run_batch(iter_resume_paths(args.source), index, out, top_k=args.top_k,
+                  workers=args.workers, batch_size=args.batch_size, max_pages=args.max_pages)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == '__main__':
+    main()
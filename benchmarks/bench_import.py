@@ -0,0 +1,92 @@
+"""Cold start cost of importing nltk: each statement runs in a fresh
+interpreter, which reports its time, the modules it imported and its memory
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10
+    python benchmarks/bench_import.py --check
+
+With --check, exits with status 1 if a statement takes longer than its
+budget, or imports one of the heavy modules that it should not need.
+"""
+
+import argparse  # Command line interface
+import json  # Results of the child interpreters
+import os  # Environment of the child interpreters
+import resource  # Peak memory
+import subprocess  # Fresh interpreters
+import sys  # Interpreter path, imported modules
+
+# (statement, budget in seconds, modules it must not import)
+STATEMENTS = [
+    ("import nltk", 0.1, ["nltk.tokenize", "nltk.corpus", "numpy", "scipy"]),
+    ("from nltk import word_tokenize", 0.5, ["nltk.parse", "nltk.tag", "scipy"]),
+    ("from nltk import FreqDist", 0.3, ["nltk.tokenize", "nltk.parse", "scipy"]),
+    ("from nltk import pos_tag", 1.0, ["scipy", "sklearn"]),
+    ("from nltk.corpus import brown", 1.0, ["scipy", "sklearn"]),
+    ("from nltk.stem import WordNetLemmatizer", 1.0, ["scipy", "sklearn"]),
+]
+
+
+def child(statement):
+    import time
+
+    before = set(sys.modules)
+    start = time.perf_counter()
+    exec(statement, {})
+    seconds = time.perf_counter() - start
+    print(
+        json.dumps(
+            {
+                "seconds": seconds,
+                "modules": sorted(set(sys.modules) - before),
+                "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+            }
+        )
+    )
+
+
+def run(statement):
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ),
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="best of N runs")
+    parser.add_argument("--check", action="store_true", help="enforce the budgets")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(args.child)
+
+    failures = []
+    for statement, budget, forbidden in STATEMENTS:
+        results = [run(statement) for _ in range(args.repeat)]
+        best = min(results, key=lambda result: result["seconds"])
+        modules = set(best["modules"])
+        print(
+            f"  {statement:42} {best['seconds'] * 1000:8.1f} ms"
+            f" {len(modules):5} modules {best['rss'] / 1e6:7.1f} MB"
+        )
+        if best["seconds"] > budget:
+            failures.append(f"{statement}: over the {budget} s budget")
+        for module in forbidden:
+            if module in modules:
+                failures.append(f"{statement}: imports {module}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Per-token scoring cost of nltk.lm.KneserNeyInterpolated, before and after the
+continuation-count index
+
+    python benchmarks/bench_lm_kneser_ney.py                    # 10M-token corpus
+    python benchmarks/bench_lm_kneser_ney.py --tokens 1000000   # quicker run
+
+The old implementation rescanned every higher-order ngram type for each
+lower-order score, so only a small sample of tokens is scored with it.
+A 10M-token trigram model needs several GB of RAM.
+"""
+
+import argparse  # Command line interface
+import random  # Synthetic Zipfian corpus
+import time  # Timing
+
+from nltk.lm import KneserNeyInterpolated
+from nltk.lm.preprocessing import padded_everygram_pipeline
+from nltk.lm.smoothing import KneserNey, _count_values_gt_zero
+
+
+class ScanningKneserNey(KneserNey):
+    """KneserNey as it was before the continuation-count index."""
+
+    def alpha_gamma(self, word, context):
+        prefix_counts = self.counts[context]
+        word_continuation_count, total_count = (
+            (prefix_counts[word], prefix_counts.N())
+            if len(context) + 1 == self._order
+            else self._continuation_counts(word, context)
+        )
+        alpha = max(word_continuation_count - self.discount, 0.0) / total_count
+        gamma = self.discount * _count_values_gt_zero(prefix_counts) / total_count
+        return alpha, gamma
+
+    def _continuation_counts(self, word, context=tuple()):
+        higher_order_ngrams_with_context = (
+            counts
+            for prefix_ngram, counts in self.counts[len(context) + 2].items()
+            if prefix_ngram[1:] == context
+        )
+        higher_order_ngrams_with_word_count, total = 0, 0
+        for counts in higher_order_ngrams_with_context:
+            higher_order_ngrams_with_word_count += int(counts[word] > 0)
+            total += _count_values_gt_zero(counts)
+        return higher_order_ngrams_with_word_count, total
+
+
+def zipf_corpus(n_tokens, vocab_size, seed):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocab_size)]
+    weights = [1.0 / rank for rank in range(1, vocab_size + 1)]
+    sentences, produced = [], 0
+    while produced < n_tokens:
+        length = rng.randint(5, 30)
+        sentences.append(rng.choices(words, weights, k=length))
+        produced += length
+    return sentences
+
+
+def per_token(model, ngrams):
+    start = time.perf_counter()
+    for ngram in ngrams:
+        model.score(ngram[-1], ngram[:-1])
+    return (time.perf_counter() - start) / len(ngrams)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--tokens", type=int, default=10_000_000)
+    parser.add_argument("--vocab", type=int, default=50_000)
+    parser.add_argument("--order", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=100_000, help="tokens scored with the index")
+    parser.add_argument("--legacy-queries", type=int, default=20, help="tokens scored with the full scan")
+    args = parser.parse_args()
+
+    train = zipf_corpus(args.tokens, args.vocab, seed=0)
+    test = zipf_corpus(args.queries, args.vocab, seed=1)
+
+    start = time.perf_counter()
+    model = KneserNeyInterpolated(args.order)
+    model.fit(*padded_everygram_pipeline(args.order, train))
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.counts.continuations
+    index_time = time.perf_counter() - start
+
+    ngrams = [
+        ngram
+        for ngrams in padded_everygram_pipeline(args.order, test)[0]
+        for ngram in ngrams
+        if len(ngram) == args.order
+    ][: args.queries]
+
+    indexed = per_token(model, ngrams)
+    model.estimator.__class__ = ScanningKneserNey
+    scanning = per_token(model, ngrams[: args.legacy_queries])
+
+    print(f"corpus: {args.tokens:,} tokens, {args.order}-grams, {len(model.vocab):,} types")
+    print(f"  fit                      {fit_time:10.2f} s")
+    print(f"  continuation index build {index_time:10.2f} s")
+    print(f"  score, full scan         {scanning * 1e3:10.3f} ms/token")
+    print(f"  score, index             {indexed * 1e3:10.3f} ms/token")
+    print(f"  speedup                  {scanning / indexed:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
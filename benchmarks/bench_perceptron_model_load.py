@@ -0,0 +1,88 @@
+"""Startup and per-token cost of nltk.tag.perceptron.PerceptronTagger models loaded
+from the pickle and from the memory-mapped format
+
+    python benchmarks/bench_perceptron_model_load.py
+    python benchmarks/bench_perceptron_model_load.py --features 1000000
+
+Uses the synthetic model of bench_perceptron_tagger.py. "Python heap" is what
+tracemalloc sees while loading, i.e. what every worker process pays on its own;
+the pages of the mapped file are shared between processes.
+"""
+
+import argparse  # Command line interface
+import os  # File sizes
+import pickle  # The existing model format
+import tempfile  # Scratch directory for the model files
+import time  # Timing
+import tracemalloc  # Python heap used by a loaded model
+
+from bench_perceptron_tagger import synthetic_tagger, tag_all, zipf_sentences
+
+from nltk.tag.perceptron import PerceptronTagger
+
+
+def load_pickle(path):
+    tagger = PerceptronTagger(load=False)
+    with open(path, "rb") as fin:
+        tagger.model.weights, tagger.tagdict, tagger.classes = pickle.load(fin)
+    tagger.model.classes = tagger.classes
+    return tagger
+
+
+def load_mapped(path):
+    tagger = PerceptronTagger(load=False)
+    tagger.load_mapped(path)
+    return tagger
+
+
+def measure(load, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tagger = load(path)
+    elapsed = time.perf_counter() - start
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tagger, elapsed, heap
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--features", type=int, default=200_000)
+    parser.add_argument("--vocab", type=int, default=50_000)
+    parser.add_argument("--tokens", type=int, default=20_000)
+    args = parser.parse_args()
+
+    tagger = synthetic_tagger(args.features, args.vocab, seed=0)
+    sentences = zipf_sentences(args.tokens, args.vocab, seed=1)
+    n_tokens = sum(map(len, sentences))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = os.path.join(tmp, "model.pickle")
+        mapped_path = os.path.join(tmp, "model.bin")
+        with open(pickle_path, "wb") as fout:
+            pickle.dump((tagger.model.weights, tagger.tagdict, tagger.classes), fout, 2)
+        tagger.save_mapped(mapped_path)
+
+        print(f"model: {len(tagger.model.weights):,} features")
+        expected = None
+        for name, load, path in (
+            ("pickle", load_pickle, pickle_path),
+            ("mapped", load_mapped, mapped_path),
+        ):
+            loaded, load_time, heap = measure(load, path)
+            tagged, tag_time = tag_all(loaded, sentences)
+            expected = expected or tagged
+            assert tagged == expected, f"{name} tags differ"
+            print(
+                f"  {name}  file {os.path.getsize(path) / 2**20:6.1f} MB"
+                f"  load {load_time * 1e3:8.1f} ms"
+                f"  Python heap {heap / 2**20:6.1f} MB"
+                f"  tag {tag_time / n_tokens * 1e6:6.1f} us/token"
+            )
+            del loaded
+
+
+if __name__ == "__main__":
+    main()
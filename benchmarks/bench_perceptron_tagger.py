@@ -0,0 +1,90 @@
+"""Per-token tagging cost of nltk.tag.perceptron.PerceptronTagger with the
+dict-of-dicts weights and with the compiled dense matrix
+
+    python benchmarks/bench_perceptron_tagger.py
+    python benchmarks/bench_perceptron_tagger.py --features 300000 --tokens 50000
+
+The pretrained model is not needed: a model of the same shape (45 tags, a few
+hundred thousand features, a handful of non-zero weights per feature) is made
+up from the features of a synthetic Zipfian corpus. The tag dictionary is
+left empty so that every token goes through the perceptron.
+"""
+
+import argparse  # Command line interface
+import random  # Synthetic corpus and weights
+import time  # Timing
+
+from nltk.tag.perceptron import PerceptronTagger
+
+TAGS = [f"T{i:02d}" for i in range(45)]
+
+
+def zipf_sentences(n_tokens, vocab_size, seed):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocab_size)]
+    weights = [1.0 / rank for rank in range(1, vocab_size + 1)]
+    sentences, produced = [], 0
+    while produced < n_tokens:
+        length = rng.randint(5, 30)
+        sentences.append(rng.choices(words, weights, k=length))
+        produced += length
+    return sentences
+
+
+def synthetic_tagger(n_features, vocab_size, seed):
+    rng = random.Random(seed)
+    tagger = PerceptronTagger(load=False)
+    tagger.classes = tagger.model.classes = set(TAGS)
+    weights = tagger.model.weights
+    for sentence in zipf_sentences(n_features, vocab_size, seed):
+        context = tagger.START + [tagger.normalize(w) for w in sentence] + tagger.END
+        prev, prev2 = tagger.START
+        for i, word in enumerate(sentence):
+            for feature in tagger._get_features(i, word, context, prev, prev2):
+                if feature not in weights:
+                    labels = rng.sample(TAGS, rng.randint(1, 8))
+                    weights[feature] = {
+                        label: round(rng.gauss(0, 2), 3) for label in labels
+                    }
+            prev2, prev = prev, rng.choice(TAGS)
+        if len(weights) >= n_features:
+            break
+    return tagger
+
+
+def tag_all(tagger, sentences):
+    start = time.perf_counter()
+    tagged = [tagger.tag(sentence, use_tagdict=False) for sentence in sentences]
+    return tagged, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--features", type=int, default=200_000)
+    parser.add_argument("--vocab", type=int, default=50_000)
+    parser.add_argument("--tokens", type=int, default=20_000)
+    args = parser.parse_args()
+
+    tagger = synthetic_tagger(args.features, args.vocab, seed=0)
+    sentences = zipf_sentences(args.tokens, args.vocab, seed=1)
+    n_tokens = sum(map(len, sentences))
+
+    expected, dict_time = tag_all(tagger, sentences)
+    print(f"model: {len(tagger.model.weights):,} features, {len(TAGS)} tags")
+    print(f"  dict weights     {dict_time / n_tokens * 1e6:8.1f} us/token")
+    for dtype in ("float64", "float32"):
+        start = time.perf_counter()
+        tagger.model.compile(dtype)
+        compile_time = time.perf_counter() - start
+        tagged, compiled_time = tag_all(tagger, sentences)
+        assert tagged == expected, f"{dtype} tags differ from the dict path"
+        print(
+            f"  compiled {dtype}  {compiled_time / n_tokens * 1e6:8.1f} us/token"
+            f"  ({dict_time / compiled_time:.1f}x, compiled in {compile_time:.2f} s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
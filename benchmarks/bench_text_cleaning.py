@@ -0,0 +1,82 @@
+"""Benchmark of the single-pass TextNormalizer against the old per-row clean_text
+
+    python benchmarks/bench_text_cleaning.py            # resume.csv and 1M rows
+    python benchmarks/bench_text_cleaning.py --rows 200000
+
+Every run also checks that both implementations give identical output.
+"""
+
+import argparse  # Command line interface
+import itertools  # Cycling the sample rows up to the large corpus size
+import os  # Paths relative to the repository
+import re  # The old implementation
+import sys  # Making the repository importable
+import time  # Timing
+
+import pandas as pd  # Pandas is used for reading the CSV and for the Series path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from text_cleaning import clean_text, clean_texts, lemmatizer_dict, stop_words  # noqa: E402
+
+
+def legacy_clean_text(txt):
+    # The clean_text that resume.py used to apply row by row
+    clean_text = re.sub(r'http\S+\s|RT|cc|#\S+\s|@\S+|[^\x00-\x7f]', ' ', txt)
+    clean_text = re.sub(r'[%s]' % re.escape("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""), ' ', clean_text)
+    clean_text = re.sub(r'\s+', ' ', clean_text).strip().lower()
+    tokens = re.findall(r'\b\w+\b', clean_text)
+    tokens = [word for word in tokens if word not in stop_words]
+    tokens = [lemmatizer_dict.get(word, word) for word in tokens]
+    return ' '.join(tokens)
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(name, texts, repeat):
+    series = pd.Series(texts)
+    old_time, old = best_of(repeat, lambda: series.apply(legacy_clean_text))
+    row_time, _ = best_of(repeat, lambda: series.apply(clean_text))
+    new_time, new = best_of(repeat, lambda: clean_texts(series))
+    gen_time, gen = best_of(repeat, lambda: clean_texts(iter(texts)))
+    assert old.tolist() == new.tolist() == gen, 'outputs differ'
+
+    print(f'{name}: {len(texts):,} rows')
+    print(f'  legacy clean_text via apply   {old_time:8.3f} s')
+    print(f'  TextNormalizer via apply      {row_time:8.3f} s  ({old_time / row_time:5.1f}x)')
+    print(f'  normalize_many on the Series  {new_time:8.3f} s  ({old_time / new_time:5.1f}x)')
+    print(f'  normalize_many on a generator {gen_time:8.3f} s  ({old_time / gen_time:5.1f}x)')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--csv', default=os.path.join(ROOT, 'resume.csv'))
+    parser.add_argument('--rows', type=int, default=1_000_000, help='size of the large synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    sample = pd.read_csv(args.csv)['Skills'].tolist()
+    run(os.path.basename(args.csv), sample, args.repeat)
+
+    # Resume-like rows with some of the noise the cleaning removes
+    noisy = [
+        f'RT @recruiter {text} see https://jobs.example.com/{i} #hiring cc team — more details'
+        if i % 4 == 0 else text
+        for i, text in enumerate(sample)
+    ]
+    run('synthetic', list(itertools.islice(itertools.cycle(noisy), args.rows)), 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,549 @@
+r"""Throughput, peak memory and start-up cost of the tokenizers in nltk.tokenize
+
+    python benchmarks/bench_tokenizers.py                        # everything
+    python benchmarks/bench_tokenizers.py --output run.json      # save results
+    python benchmarks/bench_tokenizers.py --compare run.json     # compare to a run
+    python benchmarks/bench_tokenizers.py --tokenizers punkt TweetTokenizer \
+        --corpora tweets --no-cold
+
+The corpora are generated from a fixed seed (news prose, tweets, code-heavy
+text), plus the .doctest files shipped in nltk/test and, when the nltk_data
+package is installed, Project Gutenberg texts. Each tokenizer is run on the
+unit it is meant for: a whole document, a line (a sentence or a tweet) or a
+word for the syllable tokenizers.
+
+Warm runs report the best of --repeat runs after a warm-up call, as tokens/s
+and bytes/s of UTF-8 input, and the peak memory traced by tracemalloc during
+one more run. Cold runs start a fresh interpreter per tokenizer and time the
+import, the set-up (including nltk.data.load of the Punkt pickles) and the
+first call. Tokenizers whose data packages are not installed are reported as
+skipped.
+"""
+
+import argparse  # Command line interface
+import glob  # Bundled corpora
+import importlib  # Cold imports
+import importlib.util  # Locating nltk without importing it
+import json  # Machine-readable results
+import os  # Paths
+import platform  # Run metadata
+import random  # Synthetic corpora
+import re  # Cleaning up error messages
+import resource  # Peak RSS of the cold runs
+import subprocess  # Cold runs
+import sys  # Interpreter path
+import time  # Timing
+import tracemalloc  # Peak memory of the warm runs
+import warnings  # Silencing tokenizer warnings
+
+SEED = 0
+
+# Words for the synthetic corpora
+WORDS = (
+    "the of and to in a is that for it as was with be by on not he I this are "
+    "or his from at which but have an they you were her she there been one all "
+    "we their has would when if so no will more about up out who said can what "
+    "government market company people year percent report officials million "
+    "week president minister police court state city bank price growth election"
+).split()
+NAMES = "Smith Jones Brown Garcia Miller Davis Wilson Anderson Taylor Thomas".split()
+ABBREVIATIONS = "Mr. Mrs. Dr. Prof. Inc. Corp. Jan. Feb. U.S. U.K. e.g. i.e.".split()
+CONTRACTIONS = "don't can't won't it's I'm they're we've she'd cannot gonna".split()
+HASHTAGS = "#nlp #python #news #breaking #MondayMotivation #ThrowbackThursday".split()
+EMOJI = "🙂 😂 🔥 👍 ❤️ 🎉 :-) :D ;) <3 :/ XD".split()
+IDENTIFIERS = (
+    "self data value result config tokenizer_fn x_train np.array os.path".split()
+)
+
+# Stop words for TextTilingTokenizer, which otherwise needs nltk_data
+STOPWORDS = "the of and to in a is that for it as was with be by on not this".split()
+
+
+def news_corpus(size, rng):
+    paragraphs, produced = [], 0
+    while produced < size:
+        sentences = []
+        for _ in range(rng.randint(2, 6)):
+            words = rng.choices(WORDS, k=rng.randint(6, 30))
+            words[0] = words[0].capitalize()
+            for _ in range(rng.randint(0, 3)):
+                words.insert(
+                    rng.randrange(len(words)),
+                    rng.choice(
+                        [
+                            rng.choice(NAMES),
+                            rng.choice(ABBREVIATIONS) + " " + rng.choice(NAMES),
+                            rng.choice(CONTRACTIONS),
+                            f"${rng.randint(1, 999)},{rng.randint(0, 999):03d}",
+                            f"{rng.uniform(0, 100):.1f}%",
+                            f"({rng.choice(WORDS)})",
+                            "--",
+                        ]
+                    ),
+                )
+                if rng.random() < 0.3:
+                    words[rng.randrange(len(words))] += ","
+            sentence = " ".join(words) + rng.choice(".....?!;")
+            if rng.random() < 0.2:
+                sentence = f'"{sentence}" {rng.choice(NAMES)} said.'
+            sentences.append(sentence)
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        produced += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def tweets_corpus(size, rng):
+    tweets, produced = [], 0
+    while produced < size:
+        parts = rng.choices(WORDS + CONTRACTIONS, k=rng.randint(3, 20))
+        for _ in range(rng.randint(1, 5)):
+            parts.insert(
+                rng.randrange(len(parts) + 1),
+                rng.choice(
+                    [
+                        "@" + rng.choice(NAMES).lower() + str(rng.randint(0, 99)),
+                        rng.choice(HASHTAGS),
+                        rng.choice(EMOJI),
+                        f"https://t.co/{rng.getrandbits(40):x}",
+                        "s" + "o" * rng.randint(2, 8),
+                        "!!!" + "!" * rng.randint(0, 5),
+                        "&amp;",
+                        f"+1 {rng.randint(200, 999)}-{rng.randint(200, 999)}-"
+                        f"{rng.randint(1000, 9999)}",
+                    ]
+                ),
+            )
+        if rng.random() < 0.2:
+            parts.insert(0, "RT")
+        tweet = " ".join(parts)
+        tweets.append(tweet)
+        produced += len(tweet) + 1
+    return "\n".join(tweets)
+
+
+def code_corpus(size, rng):
+    lines, produced = [], 0
+    while produced < size:
+        a, b = rng.sample(IDENTIFIERS, 2)
+        line = rng.choice(
+            [
+                f"def {a.replace('.', '_')}({b}, n={rng.randint(0, 9)}):",
+                f"    {a} = {b}[{rng.randint(0, 9)}:-1] + {rng.random():.3f}",
+                f"    if {a} >= {b} and not ({a} != {rng.randint(0, 99)}):",
+                f"    return [{a}.get('{b}', None) for {a} in {b}]",
+                f"    {a}({b}, key=lambda k: k ** 2, **kwargs)  # TODO: fix",
+                f"$ grep -rn '{a}' src/{b}/*.py | wc -l && echo \"done\"",
+                f'{{"{a}": [{rng.randint(0, 9)}, {rng.randint(0, 9)}], '
+                f'"{b}": null}}',
+                f"(define ({a.replace('.', '-')} x) (if (> x 0) (* x 2) ({b} x)))",
+                "",
+            ]
+        )
+        lines.append(line)
+        produced += len(line) + 1
+    return "\n".join(lines)
+
+
+def read_corpus(paths, size):
+    text, produced = [], 0
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            chunk = f.read()
+        text.append(chunk)
+        produced += len(chunk)
+        if produced >= size:
+            break
+    return "".join(text)[:size]
+
+
+def load_corpora(size):
+    """Returns a dict from corpus name to text; none of them needs nltk to be imported."""
+    rng = random.Random(SEED)
+    corpora = {
+        "news": news_corpus(size, rng),
+        "tweets": tweets_corpus(size, rng),
+        "code": code_corpus(size, rng),
+    }
+    nltk_dir = importlib.util.find_spec("nltk").submodule_search_locations[0]
+    doctests = sorted(glob.glob(os.path.join(nltk_dir, "test", "*.doctest")))
+    if doctests:
+        corpora["doctests"] = read_corpus(doctests, size)
+    for data_dir in nltk_data_path():
+        gutenberg = sorted(
+            glob.glob(os.path.join(data_dir, "corpora", "gutenberg", "*.txt"))
+        )
+        if gutenberg:
+            corpora["gutenberg"] = read_corpus(gutenberg, size)
+            break
+    return corpora
+
+
+def nltk_data_path():
+    """The usual nltk_data directories, without importing nltk.data."""
+    paths = os.environ.get("NLTK_DATA", "").split(os.pathsep)
+    paths += [
+        os.path.expanduser("~/nltk_data"),
+        os.path.join(sys.prefix, "nltk_data"),
+        os.path.join(sys.prefix, "share", "nltk_data"),
+        os.path.join(sys.prefix, "lib", "nltk_data"),
+        "/usr/share/nltk_data",
+        "/usr/local/share/nltk_data",
+        "/usr/lib/nltk_data",
+        "/usr/local/lib/nltk_data",
+    ]
+    return [path for path in paths if path and os.path.isdir(path)]
+
+
+# Tokenizer set-ups. Each takes the corpora, which some use as training data,
+# and returns the function that is timed. Imports are done by the set-up, so
+# that cold runs time them.
+
+
+def punkt(corpora):
+    from nltk.data import load
+
+    return load("tokenizers/punkt/english.pickle").tokenize
+
+
+def punkt_trained(corpora):
+    from nltk.tokenize.punkt import PunktSentenceTokenizer
+
+    return PunktSentenceTokenizer(corpora["news"]).tokenize
+
+
+def word_tokenize(corpora):
+    from nltk.tokenize import word_tokenize
+
+    word_tokenize("Loads the Punkt model.")
+    return word_tokenize
+
+
+def nltk_word(corpora):
+    from nltk.tokenize import NLTKWordTokenizer
+
+    return NLTKWordTokenizer().tokenize
+
+
+def treebank_word(corpora):
+    from nltk.tokenize import TreebankWordTokenizer
+
+    return TreebankWordTokenizer().tokenize
+
+
+def tweet(corpora):
+    from nltk.tokenize import TweetTokenizer
+
+    return TweetTokenizer().tokenize
+
+
+def toktok(corpora):
+    from nltk.tokenize import ToktokTokenizer
+
+    return ToktokTokenizer().tokenize
+
+
+def nist(corpora):
+    from nltk.tokenize.nist import NISTTokenizer
+
+    return NISTTokenizer().tokenize
+
+
+def word_punct(corpora):
+    from nltk.tokenize import WordPunctTokenizer
+
+    return WordPunctTokenizer().tokenize
+
+
+def regexp(corpora):
+    from nltk.tokenize import RegexpTokenizer
+
+    return RegexpTokenizer(r"\w+|\$[\d\.]+|\S+").tokenize
+
+
+def whitespace(corpora):
+    from nltk.tokenize import WhitespaceTokenizer
+
+    return WhitespaceTokenizer().tokenize
+
+
+def blankline(corpora):
+    from nltk.tokenize import BlanklineTokenizer
+
+    return BlanklineTokenizer().tokenize
+
+
+def lines(corpora):
+    from nltk.tokenize import LineTokenizer
+
+    return LineTokenizer().tokenize
+
+
+def sexpr(corpora):
+    from nltk.tokenize import SExprTokenizer
+
+    return SExprTokenizer(strict=False).tokenize
+
+
+def mwe(corpora):
+    from nltk.tokenize import MWETokenizer
+
+    tokenizer = MWETokenizer([("New", "York"), ("in", "spite", "of"), ("a", "lot")])
+    return lambda text: tokenizer.tokenize(text.split())
+
+
+def syllable(corpora):
+    from nltk.tokenize import SyllableTokenizer
+
+    return SyllableTokenizer().tokenize
+
+
+def legality(corpora):
+    from nltk.tokenize import LegalitySyllableTokenizer
+
+    return LegalitySyllableTokenizer(corpora["news"].split()).tokenize
+
+
+def texttiling(corpora):
+    from nltk.tokenize import TextTilingTokenizer
+
+    return TextTilingTokenizer(stopwords=STOPWORDS).tokenize
+
+
+# name -> (set-up, unit of input, corpora it runs on or None for all)
+TOKENIZERS = {
+    "punkt": (punkt, "text", None),
+    "punkt_trained": (punkt_trained, "text", None),
+    "word_tokenize": (word_tokenize, "line", None),
+    "NLTKWordTokenizer": (nltk_word, "line", None),
+    "TreebankWordTokenizer": (treebank_word, "line", None),
+    "TweetTokenizer": (tweet, "line", None),
+    "ToktokTokenizer": (toktok, "line", None),
+    "NISTTokenizer": (nist, "line", None),
+    "WordPunctTokenizer": (word_punct, "line", None),
+    "RegexpTokenizer": (regexp, "line", None),
+    "WhitespaceTokenizer": (whitespace, "text", None),
+    "BlanklineTokenizer": (blankline, "text", None),
+    "LineTokenizer": (lines, "text", None),
+    "SExprTokenizer": (sexpr, "line", None),
+    "MWETokenizer": (mwe, "line", None),
+    "SyllableTokenizer": (syllable, "word", None),
+    "LegalitySyllableTokenizer": (legality, "word", None),
+    "TextTilingTokenizer": (texttiling, "text", ("news", "doctests", "gutenberg")),
+}
+
+
+def inputs(text, unit):
+    if unit == "text":
+        return [text]
+    if unit == "line":
+        return [line for line in text.splitlines() if line.strip()]
+    return text.split()
+
+
+def tokenize_all(tokenize, items):
+    return sum(len(tokenize(item)) for item in items)
+
+
+def warm_run(name, corpus, text, corpora, repeat):
+    setup, unit, _ = TOKENIZERS[name]
+    result = {"tokenizer": name, "corpus": corpus, "unit": unit}
+    try:
+        tokenize = setup(corpora)
+    except LookupError as e:
+        return {**result, "status": "skipped", "reason": missing_resource(e)}
+    items = inputs(text, unit)
+    try:
+        tokenize(items[0])
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            tokens = tokenize_all(tokenize, items)
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        outputs = [tokenize(item) for item in items]
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del outputs
+    except Exception as e:
+        tracemalloc.stop()
+        return {**result, "status": "error", "reason": f"{type(e).__name__}: {e}"}
+    size = len(text.encode("utf-8"))
+    return {
+        **result,
+        "status": "ok",
+        "bytes": size,
+        "tokens": tokens,
+        "seconds": best,
+        "tokens_per_second": tokens / best,
+        "bytes_per_second": size / best,
+        "peak_memory_bytes": peak,
+    }
+
+
+def cold_child(name, size):
+    """Run in a fresh interpreter: import, set up and call one tokenizer."""
+    setup, unit, _ = TOKENIZERS[name]
+    corpora = load_corpora(size)
+    item = inputs(corpora["news"], unit)[0]
+    start = time.perf_counter()
+    importlib.import_module("nltk.tokenize")
+    imported = time.perf_counter()
+    try:
+        tokenize = setup(corpora)
+    except LookupError as e:
+        print(json.dumps({"status": "skipped", "reason": missing_resource(e)}))
+        return
+    ready = time.perf_counter()
+    tokenize(item)
+    done = time.perf_counter()
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    print(
+        json.dumps(
+            {
+                "status": "ok",
+                "import_seconds": imported - start,
+                "setup_seconds": ready - imported,
+                "first_call_seconds": done - ready,
+                "seconds": done - start,
+                "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                * scale,
+            }
+        )
+    )
+
+
+def cold_run(name, size):
+    command = [sys.executable, os.path.abspath(__file__), "--cold-child", name]
+    start = time.perf_counter()
+    process = subprocess.run(
+        command + ["--size", str(size)], capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    result = {"tokenizer": name}
+    if process.returncode:
+        error = process.stderr.strip().splitlines()[-1:] or ["no output"]
+        return {**result, "status": "error", "reason": error[0]}
+    result.update(json.loads(process.stdout.strip().splitlines()[-1]))
+    if result["status"] == "ok":
+        # Including interpreter start-up and corpus generation
+        result["process_seconds"] = elapsed
+    return result
+
+
+def missing_resource(error):
+    for line in re.sub(r"\x1b\[\d+m", "", str(error)).splitlines():
+        if "Resource" in line:
+            return " ".join(line.split())
+    return "missing resource"
+
+
+def compare(results, baseline):
+    """Print the change of each measurement against an earlier run."""
+    old = {(r["tokenizer"], r["corpus"]): r for r in baseline["warm"]}
+    print(f"\ncompared to {baseline['meta']['date']}")
+    for r in results["warm"]:
+        before = old.get((r["tokenizer"], r["corpus"]))
+        if r["status"] == "ok" and before and before["status"] == "ok":
+            print(
+                f"  {r['tokenizer']:26} {r['corpus']:10}"
+                f" {r['bytes_per_second'] / before['bytes_per_second']:6.2f}x bytes/s"
+                f" {r['peak_memory_bytes'] / max(before['peak_memory_bytes'], 1):6.2f}x memory"
+            )
+    old = {r["tokenizer"]: r for r in baseline["cold"]}
+    for r in results["cold"]:
+        before = old.get(r["tokenizer"])
+        if r["status"] == "ok" and before and before["status"] == "ok":
+            print(
+                f"  {r['tokenizer']:26} {'cold':10}"
+                f" {r['seconds'] / before['seconds']:6.2f}x seconds"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--tokenizers", nargs="+", choices=TOKENIZERS, default=list(TOKENIZERS)
+    )
+    parser.add_argument("--corpora", nargs="+", help="default: all available")
+    parser.add_argument("--size", type=int, default=100_000, help="bytes per corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N warm runs")
+    parser.add_argument("--no-cold", action="store_true", help="skip the cold runs")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    parser.add_argument("--cold-child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    if args.cold_child:
+        cold_child(args.cold_child, args.size)
+        return
+
+    corpora = load_corpora(args.size)
+    names = args.corpora or list(corpora)
+    import nltk
+
+    results = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "nltk": nltk.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "size": args.size,
+            "repeat": args.repeat,
+            "seed": SEED,
+        },
+        "corpora": {
+            name: {"bytes": len(corpora[name].encode("utf-8"))} for name in names
+        },
+        "warm": [],
+        "cold": [],
+    }
+
+    print(f"{'tokenizer':26} {'corpus':10} {'tokens/s':>12} {'MB/s':>8} {'peak MB':>8}")
+    for name in args.tokenizers:
+        for corpus in names:
+            only = TOKENIZERS[name][2]
+            if only is not None and corpus not in only:
+                continue
+            r = warm_run(name, corpus, corpora[corpus], corpora, args.repeat)
+            results["warm"].append(r)
+            if r["status"] == "ok":
+                print(
+                    f"{name:26} {corpus:10} {r['tokens_per_second']:12,.0f}"
+                    f" {r['bytes_per_second'] / 1e6:8.2f}"
+                    f" {r['peak_memory_bytes'] / 1e6:8.1f}"
+                )
+            else:
+                print(f"{name:26} {corpus:10} {r['status']}: {r['reason']}")
+
+    if not args.no_cold:
+        print(
+            f"\n{'cold start':26} {'import s':>10} {'setup s':>10} {'call s':>10} {'RSS MB':>8}"
+        )
+        for name in args.tokenizers:
+            r = cold_run(name, args.size)
+            results["cold"].append(r)
+            if r["status"] == "ok":
+                print(
+                    f"{name:26} {r['import_seconds']:10.3f} {r['setup_seconds']:10.3f}"
+                    f" {r['first_call_seconds']:10.3f} {r['max_rss_bytes'] / 1e6:8.1f}"
+                )
+            else:
+                print(f"{name:26} {r['status']}: {r['reason']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
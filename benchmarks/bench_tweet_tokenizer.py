@@ -0,0 +1,86 @@
+"""Throughput of nltk.tokenize.TweetTokenizer on a stream of tweets, one
+tokenize call at a time and with tokenize_many
+
+    python benchmarks/bench_tweet_tokenizer.py
+    python benchmarks/bench_tweet_tokenizer.py --tweets 500000 --duplicates 0.5
+    python benchmarks/bench_tweet_tokenizer.py --workers 4 --lowercase
+
+The tweets come from the synthetic tweet corpus of bench_tokenizers.py. A
+--duplicates fraction of them repeats one of the previous --pool tweets,
+like retweets and copy-pasted spam do in a firehose.
+"""
+
+import argparse  # Command line interface
+import os  # CPU count
+import random  # Duplicate tweets
+import time  # Timing
+
+from bench_tokenizers import tweets_corpus  # Synthetic tweets
+
+from nltk.tokenize import TweetTokenizer
+
+
+def tweet_stream(n_tweets, duplicates, pool, seed):
+    rng = random.Random(seed)
+    unique = tweets_corpus(n_tweets * 100, rng).split("\n")[:n_tweets]
+    tweets = []
+    for tweet in unique:
+        if tweets and rng.random() < duplicates:
+            tweet = rng.choice(tweets[-pool:])
+        tweets.append(tweet)
+    return tweets
+
+
+def report(name, tweets, megabytes, seconds):
+    print(
+        f"  {name:32} {len(tweets) / seconds:10,.0f} tweets/s"
+        f" {megabytes / seconds:8.2f} MB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--tweets", type=int, default=100_000)
+    parser.add_argument("--duplicates", type=float, default=0.3)
+    parser.add_argument(
+        "--pool",
+        type=int,
+        default=1000,
+        help="duplicates repeat one of the last N tweets",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--lowercase", action="store_true", help="preserve_case=False")
+    args = parser.parse_args()
+
+    tweets = tweet_stream(args.tweets, args.duplicates, args.pool, seed=0)
+    megabytes = sum(len(tweet.encode("utf-8")) for tweet in tweets) / 1e6
+    tokenizer = TweetTokenizer(preserve_case=not args.lowercase)
+    tokenizer.tokenize("Compiles the regular expressions :-)")
+    print(
+        f"{len(tweets):,} tweets, {megabytes:.1f} MB,"
+        f" {len(set(tweets)) / len(tweets):.0%} distinct"
+    )
+
+    start = time.perf_counter()
+    expected = [tokenizer.tokenize(tweet) for tweet in tweets]
+    report("tokenize", tweets, megabytes, time.perf_counter() - start)
+
+    runs = [
+        ("tokenize_many, no cache", {"cache_size": 0}),
+        ("tokenize_many", {}),
+    ]
+    if args.workers > 1:
+        runs.append(
+            (f"tokenize_many, {args.workers} workers", {"workers": args.workers})
+        )
+    for name, kwargs in runs:
+        start = time.perf_counter()
+        result = list(tokenizer.tokenize_many(iter(tweets), **kwargs))
+        report(name, tweets, megabytes, time.perf_counter() - start)
+        assert result == expected, f"{name} differs from tokenize"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Throughput of the Treebank-style word tokenizers with the CONTRACTIONS2
+patterns applied one pass each and fused into a single pass
+
+    python benchmarks/bench_word_tokenizer.py                # NLTK's doctests
+    python benchmarks/bench_word_tokenizer.py corpus.txt     # any text files
+
+By default the text is the .doctest files shipped in nltk/test, so that no
+nltk_data package is needed. Each line is tokenized on its own, as
+word_tokenize does with each sentence, and the output of both variants is
+checked to be identical.
+"""
+
+import argparse  # Command line interface
+import glob  # Default input files
+import os  # Paths
+import time  # Timing
+
+import nltk
+from nltk.tokenize import destructive, treebank
+from nltk.tokenize.destructive import NLTKWordTokenizer
+from nltk.tokenize.treebank import TreebankWordDetokenizer, TreebankWordTokenizer
+
+
+def sequential_passes(contractions, template):
+    return tuple((regexp, template) for regexp in contractions)
+
+
+def read_lines(paths):
+    lines = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            lines.extend(line.strip() for line in f)
+    return [line for line in lines if line]
+
+
+def run(func, lines, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = [func(line) for line in lines]
+        best = min(best, time.perf_counter() - start)
+    return output, best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    paths = args.files or sorted(
+        glob.glob(os.path.join(os.path.dirname(nltk.__file__), "test", "*.doctest"))
+    )
+    lines = read_lines(paths)
+    megabytes = sum(len(line.encode("utf-8")) for line in lines) / 1e6
+    detokenizer = TreebankWordDetokenizer()
+    benchmarks = [
+        ("NLTKWordTokenizer", NLTKWordTokenizer().tokenize),
+        ("TreebankWordTokenizer", TreebankWordTokenizer().tokenize),
+        ("TreebankWordDetokenizer", lambda line: detokenizer.detokenize(line.split())),
+    ]
+
+    print(f"text: {len(paths)} files, {len(lines):,} lines, {megabytes:.1f} MB")
+    fused_passes = destructive._contractions_passes
+    for name, func in benchmarks:
+        destructive._contractions_passes = sequential_passes
+        treebank._contractions_passes = sequential_passes
+        expected, sequential_time = run(func, lines, args.repeat)
+        destructive._contractions_passes = fused_passes
+        treebank._contractions_passes = fused_passes
+        output, fused_time = run(func, lines, args.repeat)
+        assert output == expected, f"{name} output differs with fused passes"
+        print(f"  {name}")
+        print(f"    sequential  {megabytes / sequential_time:8.2f} MB/s")
+        print(f"    fused       {megabytes / fused_time:8.2f} MB/s")
+        print(f"    speedup     {sequential_time / fused_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+# Persisted TF-IDF job index for the resume analyzer
+#
+# Fitting the vectorizer over the job skills on every Streamlit rerun is wasted
+# work, so the fitted state is written to disk once per version of the source CSV
+# and memory-mapped back on startup.
+#
+# Build it ahead of time with:  python job_index.py cleaned_file.csv
+import argparse  # Command line interface for the build step
+import hashlib  # SHA-256 of the source CSV keys the artifact
+import json  # Vocabulary and metadata are stored as JSON
+import os  # File system paths and atomic renames
+import shutil  # Removing half-written artifacts
+import tempfile  # Scratch directory for atomic builds
+import threading  # Building the matcher once per process
+
+import numpy as np  # Arrays are saved as .npy so they can be memory-mapped
+import pandas as pd  # Pandas is used for reading the job CSV
+from scipy import sparse  # Sparse job matrix
+from sklearn.feature_extraction.text import TfidfVectorizer  # Converts text to numerical feature vectors
+
+from job_matcher import JobMatcher  # Inverted-index top-k over the job matrix
+from text_cleaning import clean_text, clean_texts
+
+
+INDEX_DIR = '.job_index'  # Artifacts live next to the app, one sub-directory per source file and digest
+INDEX_VERSION = 2  # Bump when the cleaning or the artifact layout changes
+MAX_FEATURES = 5000
+N_NEIGHBORS = 5
+
+# (path, size, mtime) -> digest, so reruns do not re-hash an unchanged file
+_digest_memo = {}
+
+
+def source_digest(csv_path):
+    """
+    Returns the SHA-256 hex digest of the source CSV.
+
+    The digest is memoised on the file's size and modification time, so calling
+    this on every Streamlit rerun only costs a `stat` while the file is unchanged.
+
+    Args:
+        csv_path (str): Path of the job CSV.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    stat = os.stat(csv_path)
+    key = (os.path.abspath(csv_path), stat.st_size, stat.st_mtime_ns)
+    digest = _digest_memo.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(csv_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        _digest_memo[key] = digest
+    return digest
+
+
+def dataset_name(csv_path):
+    """
+    Returns the name that the artifacts of `csv_path` share across its versions.
+
+    It is the file name plus a short hash of the absolute path, so two CSVs with
+    the same name in different directories can share an index directory.
+    """
+    path = os.path.realpath(csv_path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}-{hashlib.sha1(path.encode('utf-8')).hexdigest()[:8]}"
+
+
+def index_path(csv_path, index_dir=INDEX_DIR, digest=None):
+    """Returns the artifact directory for the current contents of `csv_path`."""
+    digest = digest or source_digest(csv_path)
+    return os.path.join(index_dir, f'{dataset_name(csv_path)}-{digest}-v{INDEX_VERSION}')
+
+
+def _remove_stale(index_dir, dataset, keep):
+    """
+    Removes the artifacts of older versions of `dataset`, keeping `keep`.
+
+    Only complete artifacts whose manifest names the same dataset are removed, so
+    the indexes of other CSVs in a shared `index_dir` are left alone. Processes
+    that still have an old artifact memory-mapped keep their pages: unlinking a
+    mapped file does not unmap it.
+    """
+    for name in os.listdir(index_dir):
+        stale = os.path.join(index_dir, name)
+        if stale == keep or name.startswith('.') or not name.startswith(f'{dataset}-'):
+            continue
+        try:
+            with open(os.path.join(stale, 'meta.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if meta.get('dataset') == dataset:
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def build_index(csv_path, index_dir=INDEX_DIR, digest=None, force=False):
+    """
+    Fits the TF-IDF vectorizer over the job skills and writes the artifact.
+
+    The artifact is written to a scratch directory first and renamed into place,
+    so a concurrent reader never sees a half-written index.
+
+    An existing artifact for the same contents is kept unless `force` is set, in
+    which case it is moved aside and replaced, e.g. after it was damaged or the
+    cleaning changed without a bump of `INDEX_VERSION`.
+
+    Args:
+        csv_path (str): Path of the job CSV (needs 'Job Title' and 'Skills' columns).
+        index_dir (str): Directory holding the artifacts.
+        digest (str): Digest of `csv_path`, computed if not given.
+        force (bool): Replace an existing artifact instead of keeping it.
+
+    Returns:
+        str: Path of the artifact directory.
+    """
+    digest = digest or source_digest(csv_path)
+    dataset = dataset_name(csv_path)
+    path = index_path(csv_path, index_dir, digest)
+
+    df = pd.read_csv(csv_path)
+    vectorizer = TfidfVectorizer(max_features=MAX_FEATURES)
+    X = vectorizer.fit_transform(clean_texts(df['Skills']).tolist()).tocsr()
+    X.sort_indices()
+    # Term-major copy of the matrix: the posting lists of the JobMatcher
+    postings = X.tocsc()
+    postings.sort_indices()
+
+    # Terms in column order, so the vocabulary round-trips as a plain list
+    terms = [None] * len(vectorizer.vocabulary_)
+    for term, column in vectorizer.vocabulary_.items():
+        terms[column] = term
+
+    os.makedirs(index_dir, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=index_dir, prefix='.build-')
+    old = None
+    try:
+        with open(os.path.join(tmp, 'vocabulary.json'), 'w', encoding='utf-8') as f:
+            json.dump(terms, f)
+        np.save(os.path.join(tmp, 'idf.npy'), vectorizer.idf_)
+        np.save(os.path.join(tmp, 'data.npy'), X.data)
+        np.save(os.path.join(tmp, 'indices.npy'), X.indices)
+        np.save(os.path.join(tmp, 'indptr.npy'), X.indptr)
+        np.save(os.path.join(tmp, 'postings_data.npy'), postings.data)
+        np.save(os.path.join(tmp, 'postings_rows.npy'), postings.indices)
+        np.save(os.path.join(tmp, 'postings_indptr.npy'), postings.indptr)
+        df.to_csv(os.path.join(tmp, 'jobs.csv'), index=False)
+        # meta.json is written last and marks the artifact as complete
+        with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'source': os.path.basename(csv_path),
+                'dataset': dataset,
+                'sha256': digest,
+                'version': INDEX_VERSION,
+                'shape': list(X.shape),
+                'max_features': MAX_FEATURES,
+            }, f)
+        if force and os.path.exists(path):
+            # A directory cannot be renamed over a non-empty one, so the old
+            # artifact is moved into a scratch directory and deleted afterwards
+            old = tempfile.mkdtemp(dir=index_dir, prefix='.old-')
+            os.replace(path, os.path.join(old, os.path.basename(path)))
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            # Another process finished the same build first
+            if force or not os.path.exists(os.path.join(path, 'meta.json')):
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if old is not None:
+            shutil.rmtree(old, ignore_errors=True)
+
+    # Drop artifacts of older versions of the source file
+    _remove_stale(index_dir, dataset, path)
+    return path
+
+
+class JobIndex:
+    """
+    Fitted vectorizer, job matrix and job metadata loaded from an artifact.
+
+    The sparse matrix arrays are memory-mapped, so several app processes share
+    the same pages and opening the index does not depend on the number of jobs.
+    Queries go through an inverted-index `JobMatcher` over the memory-mapped
+    posting lists.
+
+    Jobs can be added, updated and removed one at a time with `add_job`,
+    `update_job` and `remove_job`, which keep `jobs` and the matcher in step
+    without refitting. These changes live in memory only; rebuild the artifact
+    to make them permanent. Jobs are identified by their label in the index of
+    `jobs`, which is also what `kneighbors` returns.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        with open(os.path.join(path, 'vocabulary.json'), encoding='utf-8') as f:
+            terms = json.load(f)
+
+        # Rebuild a fitted vectorizer without refitting it
+        self.vectorizer = TfidfVectorizer(max_features=self.meta['max_features'])
+        self.vectorizer.vocabulary_ = {term: column for column, term in enumerate(terms)}
+        self.vectorizer.idf_ = np.load(os.path.join(path, 'idf.npy'), mmap_mode='r')
+
+        self.matrix = sparse.csr_matrix(
+            (
+                np.load(os.path.join(path, 'data.npy'), mmap_mode='r'),
+                np.load(os.path.join(path, 'indices.npy'), mmap_mode='r'),
+                np.load(os.path.join(path, 'indptr.npy'), mmap_mode='r'),
+            ),
+            shape=tuple(self.meta['shape']),
+            copy=False,
+        )
+        self.postings = sparse.csc_matrix(
+            (
+                np.load(os.path.join(path, 'postings_data.npy'), mmap_mode='r'),
+                np.load(os.path.join(path, 'postings_rows.npy'), mmap_mode='r'),
+                np.load(os.path.join(path, 'postings_indptr.npy'), mmap_mode='r'),
+            ),
+            shape=tuple(self.meta['shape']),
+            copy=False,
+        )
+        self.postings.has_sorted_indices = True  # Sorted by build_index
+        self.jobs = pd.read_csv(os.path.join(path, 'jobs.csv'))
+        self._next_key = len(self.jobs)
+        self._matcher = None
+        self._matcher_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def transform(self, texts):
+        """Vectorizes already cleaned texts into the job feature space."""
+        return self.vectorizer.transform(texts)
+
+    @property
+    def matcher(self):
+        """Inverted-index matcher over the job matrix, built on first use."""
+        with self._matcher_lock:
+            if self._matcher is None:
+                self._matcher = JobMatcher.from_matrix(self.postings, self.vectorizer, clean_text)
+            return self._matcher
+
+    # Writers replace `jobs` with an updated copy rather than changing it in
+    # place, and a job is in `jobs` whenever the matcher can return it: rows are
+    # added before their posting and removed after it.
+
+    def add_job(self, job):
+        """
+        Adds one job posting.
+
+        Args:
+            job (dict): Column values of the new row; needs a 'Skills' value.
+
+        Returns:
+            int: Label of the new row in `jobs`.
+        """
+        with self._write_lock:
+            key = self._next_key
+            self.jobs = pd.concat([self.jobs, pd.DataFrame([job], index=[key])])
+            self.matcher.add(key, job['Skills'])
+            self._next_key += 1
+        return key
+
+    def update_job(self, key, job):
+        """
+        Changes the columns given in `job` for the row labelled `key`, and
+        re-indexes its skills.
+
+        Raises:
+            KeyError: If there is no job with that label.
+        """
+        with self._write_lock:
+            if key not in self.jobs.index:
+                raise KeyError(key)
+            jobs = self.jobs.copy()
+            for column, value in job.items():
+                jobs.at[key, column] = value
+            self.jobs = jobs
+            self.matcher.update(key, jobs.at[key, 'Skills'])
+
+    def remove_job(self, key):
+        """
+        Removes the row labelled `key` from `jobs` and from the matcher.
+
+        Raises:
+            KeyError: If there is no job with that label.
+        """
+        with self._write_lock:
+            self.matcher.remove(key)
+            self.jobs = self.jobs.drop(key)
+
+    def kneighbors(self, vectors, n_neighbors=N_NEIGHBORS):
+        """
+        Finds the closest jobs by cosine distance, like `NearestNeighbors(metric='cosine')`.
+
+        Args:
+            vectors (sparse matrix): Rows returned by `transform`.
+            n_neighbors (int): Number of jobs to return per row.
+
+        Returns:
+            tuple: `(distances, indices)` arrays of shape `(n_rows, n_neighbors)`,
+            where the indices are row labels in `jobs`.
+        """
+        return self.matcher.kneighbors(vectors, n_neighbors)
+
+
+def load_index(csv_path, index_dir=INDEX_DIR, digest=None):
+    """
+    Opens the artifact for the current contents of `csv_path`, building it first
+    if the file has changed since the last build.
+
+    Args:
+        csv_path (str): Path of the job CSV.
+        index_dir (str): Directory holding the artifacts.
+        digest (str): Digest of `csv_path`, computed if not given.
+
+    Returns:
+        JobIndex: The loaded index.
+    """
+    digest = digest or source_digest(csv_path)
+    path = index_path(csv_path, index_dir, digest)
+    if not os.path.exists(os.path.join(path, 'meta.json')):
+        path = build_index(csv_path, index_dir, digest)
+    return JobIndex(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the persisted TF-IDF job index.')
+    parser.add_argument('csv', nargs='?', default='cleaned_file.csv', help='job CSV with Job Title and Skills columns')
+    parser.add_argument('--index-dir', default=INDEX_DIR, help='directory holding the index artifacts')
+    parser.add_argument('--force', action='store_true', help='rebuild even if an up-to-date index exists')
+    args = parser.parse_args()
+
+    if args.force:
+        print(build_index(args.csv, args.index_dir, force=True))
+    else:
+        print(load_index(args.csv, args.index_dir).path)
@@ -0,0 +1,290 @@
+# Inverted-index top-k matcher over the job skill vocabulary
+#
+# Each job posting is stored as its L2-normalised TF-IDF vector, split into
+# per-term posting lists. A query only touches the posting lists of its own
+# terms, so its cost depends on how many postings share a term with the
+# resume, not on the total number of jobs. Single postings can be added,
+# removed or updated in place.
+#
+# The postings of the last full build are term-major sparse arrays (CSC), which
+# can be memory-mapped from the index artifact; later changes are kept in a
+# small dict overlay next to them, with removed rows of the build marked as
+# deleted.
+import heapq  # Selecting the k best accumulators
+import itertools  # Filling short result lists
+import threading  # Streamlit serves sessions from several threads
+
+import numpy as np  # Result arrays in the NearestNeighbors layout
+
+
+class JobMatcher:
+    """
+    Exact cosine top-k over sparse job vectors, using term-at-a-time scoring
+    with score accumulators and MaxScore-style pruning.
+
+    Query terms are processed in decreasing order of their best possible
+    contribution (query weight times the largest weight in the posting list).
+    Once the k-th best partial score is higher than everything the remaining
+    terms could add, documents that have not been seen yet cannot enter the
+    top k, so the remaining lists are only used to finish the accumulators
+    that can still make it. The result is the same as a full scan.
+
+    Documents are numbered internally: the rows of the base postings keep their
+    row number and every posting added later gets the next free number, so the
+    numbers also give the insertion order used to break ties.
+
+    The vectorizer's vocabulary and IDF are the ones of the last full build;
+    postings added later are vectorized with them, like `transform` does.
+
+    Args:
+        vectorizer (TfidfVectorizer): Fitted vectorizer used by `add` and `update`.
+        clean (callable): Text cleaning applied before vectorizing.
+    """
+
+    def __init__(self, vectorizer=None, clean=None):
+        self.vectorizer = vectorizer
+        self.clean = clean
+        # Base postings: CSC matrix with one column per term, rows sorted
+        self._base = None
+        self._base_rows = 0
+        self._base_keys = None  # row -> key, or None when the keys are the rows
+        self._base_ids = None  # key -> row, when the keys are not the rows
+        self._base_max = {}  # term -> largest weight in its base posting list
+        self._deleted = set()  # base rows that were removed or replaced
+        # Overlay of the postings added since the build
+        self._postings = {}  # term -> {doc: weight}
+        self._max_weight = {}  # term -> largest weight in the overlay posting list
+        self._stale = set()  # terms whose maximum may have dropped after a removal
+        self._docs = {}  # doc -> {term: weight}, needed to remove a posting
+        self._keys = {}  # doc -> key, in insertion order
+        self._ids = {}  # key -> doc
+        self._next_doc = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_matrix(cls, matrix, vectorizer=None, clean=None, keys=None):
+        """
+        Builds a matcher from a sparse matrix of normalised job vectors.
+
+        The matrix is used in CSC layout; a `csc_matrix` with sorted indices,
+        such as the one `JobIndex` memory-maps, is used as is, without a copy.
+
+        Args:
+            matrix (sparse matrix): One row per job.
+            keys (sequence): Key of each row, defaulting to the row positions.
+        """
+        matcher = cls(vectorizer, clean)
+        matrix = matrix.tocsc()
+        if not matrix.has_sorted_indices:
+            matrix = matrix.sorted_indices()
+        matcher._base = matrix
+        matcher._base_rows = matcher._next_doc = matrix.shape[0]
+        if keys is not None:
+            matcher._base_keys = list(keys)
+            matcher._base_ids = {key: row for row, key in enumerate(matcher._base_keys)}
+        return matcher
+
+    def __len__(self):
+        with self._lock:
+            return self._base_rows - len(self._deleted) + len(self._docs)
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._doc(key) is not None
+
+    def _doc(self, key):
+        # Internal number of the live posting stored under `key`, or None
+        doc = self._ids.get(key)
+        if doc is not None:
+            return doc
+        if self._base_ids is not None:
+            doc = self._base_ids.get(key)
+        elif isinstance(key, (int, np.integer)) and 0 <= key < self._base_rows:
+            doc = int(key)
+        if doc is None or doc in self._deleted:
+            return None
+        return doc
+
+    def _key(self, doc):
+        if doc >= self._base_rows:
+            return self._keys[doc]
+        return doc if self._base_keys is None else self._base_keys[doc]
+
+    def add_vector(self, key, terms):
+        """
+        Adds (or replaces) one posting given as `(term, weight)` pairs.
+
+        Weights are expected to come from an L2-normalised vector, so scores
+        are cosine similarities.
+        """
+        terms = {term: weight for term, weight in terms if weight}
+        with self._lock:
+            if self._doc(key) is not None:
+                self._remove(key)
+            doc = self._next_doc
+            self._next_doc += 1
+            self._docs[doc] = terms
+            self._keys[doc] = key
+            self._ids[key] = doc
+            for term, weight in terms.items():
+                self._postings.setdefault(term, {})[doc] = weight
+                if weight > self._max_weight.get(term, 0.0):
+                    self._max_weight[term] = weight
+
+    def add(self, key, text):
+        """Cleans, vectorizes and adds one job posting."""
+        if self.vectorizer is None:
+            raise ValueError("JobMatcher.add needs a fitted vectorizer; use add_vector instead.")
+        if self.clean is not None:
+            text = self.clean(text)
+        row = self.vectorizer.transform([text]).tocsr()
+        self.add_vector(key, zip(row.indices.tolist(), row.data.tolist()))
+
+    def update(self, key, text):
+        """Replaces the posting stored under `key`."""
+        self.add(key, text)
+
+    def remove(self, key):
+        """Removes the posting stored under `key`; raises KeyError if there is none."""
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        doc = self._doc(key)
+        if doc is None:
+            raise KeyError(key)
+        if doc < self._base_rows:
+            # The base upper bounds stay valid, if loose, without the row
+            self._deleted.add(doc)
+            return
+        terms = self._docs.pop(doc)
+        del self._keys[doc]
+        del self._ids[key]
+        for term, weight in terms.items():
+            posting = self._postings[term]
+            del posting[doc]
+            if not posting:
+                del self._postings[term]
+                del self._max_weight[term]
+                self._stale.discard(term)
+            elif weight >= self._max_weight[term]:
+                self._stale.add(term)
+
+    def _base_posting(self, term):
+        # (rows, weights) arrays of the base posting list of `term`
+        if self._base is None or not 0 <= term < self._base.shape[1]:
+            return None
+        start, stop = self._base.indptr[term], self._base.indptr[term + 1]
+        if start == stop:
+            return None
+        return self._base.indices[start:stop], self._base.data[start:stop]
+
+    def _upper_bound(self, term, base):
+        bound = 0.0
+        if base is not None:
+            bound = self._base_max.get(term)
+            if bound is None:
+                bound = self._base_max[term] = float(base[1].max())
+        if term in self._postings:
+            if term in self._stale:
+                self._max_weight[term] = max(self._postings[term].values())
+                self._stale.discard(term)
+            bound = max(bound, self._max_weight[term])
+        return bound
+
+    def top_k(self, query, k=5):
+        """
+        Returns the `k` best `(key, score)` pairs for one query.
+
+        Args:
+            query (iterable): `(term, weight)` pairs of a normalised query vector.
+            k (int): Number of results.
+
+        Returns:
+            list: Pairs sorted by decreasing score; only postings that share a
+            term with the query are returned.
+        """
+        if k <= 0:
+            return []
+        with self._lock:
+            terms = []
+            for term, weight in query:
+                base = self._base_posting(term)
+                if weight and (base is not None or term in self._postings):
+                    terms.append((weight * self._upper_bound(term, base), term, weight, base))
+            terms.sort(key=lambda item: item[0], reverse=True)
+
+            # remaining[i] is the most the terms from i onwards can still add
+            remaining = [0.0] * (len(terms) + 1)
+            for i in range(len(terms) - 1, -1, -1):
+                remaining[i] = remaining[i + 1] + terms[i][0]
+
+            deleted = self._deleted
+            scores = {}
+            threshold = None
+            for i, (_, term, weight, base) in enumerate(terms):
+                posting = self._postings.get(term, {})
+                if threshold is None or remaining[i] >= threshold:
+                    # New documents can still reach the top k
+                    if base is not None:
+                        for doc, doc_weight in zip(base[0].tolist(), base[1].tolist()):
+                            if doc not in deleted:
+                                scores[doc] = scores.get(doc, 0.0) + weight * doc_weight
+                    for doc, doc_weight in posting.items():
+                        scores[doc] = scores.get(doc, 0.0) + weight * doc_weight
+                else:
+                    # Only finish the accumulators that can still make it
+                    for doc in [doc for doc, score in scores.items() if score + remaining[i] < threshold]:
+                        del scores[doc]
+                    if base is not None:
+                        candidates = np.fromiter((doc for doc in scores if doc < self._base_rows), dtype=np.int64)
+                        positions = np.searchsorted(base[0], candidates)
+                        found = positions < len(base[0])
+                        found[found] = base[0][positions[found]] == candidates[found]
+                        for doc, doc_weight in zip(candidates[found].tolist(), base[1][positions[found]].tolist()):
+                            scores[doc] += weight * doc_weight
+                    for doc in scores.keys() & posting.keys():
+                        scores[doc] += weight * posting[doc]
+                if len(scores) >= k:
+                    threshold = heapq.nlargest(k, scores.values())[-1]
+
+            # Document numbers follow insertion order, so they break ties
+            best = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+            return [(self._key(doc), score) for doc, score in best]
+
+    def _live_docs(self):
+        # Every live document number, in insertion order
+        for doc in range(self._base_rows):
+            if doc not in self._deleted:
+                yield doc
+        yield from self._keys
+
+    def kneighbors(self, vectors, n_neighbors=5):
+        """
+        `NearestNeighbors(metric='cosine').kneighbors` for sparse query rows.
+
+        Jobs that share no term with a query fill the remaining places with a
+        distance of 1, in insertion order, as a full scan would.
+
+        Returns:
+            tuple: `(distances, keys)` arrays of shape `(n_rows, n_neighbors)`.
+        """
+        vectors = vectors.tocsr()
+        with self._lock:
+            # One consistent view of the postings for every row of the query
+            n_neighbors = min(n_neighbors, len(self))
+            distances = np.ones((vectors.shape[0], n_neighbors))
+            keys = []
+            for row in range(vectors.shape[0]):
+                start, stop = vectors.indptr[row], vectors.indptr[row + 1]
+                best = self.top_k(zip(vectors.indices[start:stop].tolist(), vectors.data[start:stop].tolist()), n_neighbors)
+                row_keys = [key for key, _ in best]
+                if len(row_keys) < n_neighbors:
+                    seen = set(row_keys)
+                    fill = (self._key(doc) for doc in self._live_docs())
+                    fill = (key for key in fill if key not in seen)
+                    row_keys.extend(itertools.islice(fill, n_neighbors - len(row_keys)))
+                for column, (_, score) in enumerate(best):
+                    distances[row, column] = min(max(1.0 - score, 0.0), 2.0)
+                keys.append(row_keys)
+        return distances, np.array(keys).reshape(len(keys), n_neighbors)
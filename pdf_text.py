@@ -0,0 +1,241 @@
+# PDF text extraction without any Streamlit calls, shared by the app and the batch matcher
+#
+# Extracted text is cached by the SHA-256 of the PDF bytes, in memory and on
+# disk, both bounded by size with least-recently-used eviction, so re-uploading
+# the same resume skips PyMuPDF entirely. Documents with many pages are split
+# into page ranges that are extracted in separate processes.
+import hashlib  # SHA-256 of the PDF bytes is the cache key
+import json  # Disk cache entries
+import multiprocessing  # Checking whether we may start child processes
+import os  # File system paths and CPU count
+import sys  # Memory size of the cached text
+import tempfile  # Atomic writes to the disk cache
+import threading  # Streamlit serves sessions from several threads
+from collections import OrderedDict  # In-memory LRU order
+from concurrent.futures import ProcessPoolExecutor  # Page-parallel extraction
+
+import fitz  # PyMuPDF for handling PDF files
+
+
+CACHE_DIR = '.pdf_text_cache'
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+DISK_CACHE_BYTES = 512 * 1024 * 1024
+MAX_PAGES = 3  # Resumes longer than this are rejected by the app and the batch matcher
+# Sending a document to the pool costs about 4 ms (each worker re-opens it),
+# while PyMuPDF extracts a text page in 0.1-0.3 ms, so with four workers the
+# split only pays off from a few dozen pages. Resumes within MAX_PAGES are
+# therefore always extracted in-process; the page-parallel path is for callers
+# that pass a larger `max_pages`, or None, to `read_pdf_text`.
+PARALLEL_MIN_PAGES = 32
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class PageLimitError(ValueError):
+    """Raised when a PDF has more pages than the caller allows."""
+
+    def __init__(self, page_count, max_pages):
+        super().__init__(f"The PDF has more than {max_pages} pages, which is not allowed.")
+        self.page_count = page_count
+        self.max_pages = max_pages
+
+
+class TextCache:
+    """
+    Size-bounded LRU cache of extracted PDF text, keyed by SHA-256 digest.
+
+    Entries are `(page_count, text)` pairs. The memory tier is bounded by the
+    total memory size of the cached strings (`sys.getsizeof`) and the disk tier
+    by the total size of its files; on disk the file modification time records
+    the last use.
+
+    Args:
+        cache_dir (str): Directory for the disk tier, or None to keep it in memory only.
+        memory_bytes (int): Budget of the memory tier.
+        disk_bytes (int): Budget of the disk tier.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, memory_bytes=MEMORY_CACHE_BYTES, disk_bytes=DISK_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._entries = OrderedDict()
+        self._memory_used = 0
+        self._disk_used = None  # Computed on the first disk write
+        self._lock = threading.Lock()
+
+    def get(self, digest):
+        with self._lock:
+            item = self._entries.get(digest)
+            if item is not None:
+                self._entries.move_to_end(digest)
+                return item[0]
+
+        entry = self._read_disk(digest)
+        if entry is not None:
+            self._remember(digest, entry)
+        return entry
+
+    def put(self, digest, page_count, text):
+        entry = (page_count, text)
+        self._remember(digest, entry)
+        self._write_disk(digest, entry)
+
+    def _remember(self, digest, entry):
+        size = sys.getsizeof(entry[1])
+        if size > self.memory_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(digest, None)
+            if old is not None:
+                self._memory_used -= old[1]
+            self._entries[digest] = (entry, size)
+            self._memory_used += size
+            while self._memory_used > self.memory_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._memory_used -= evicted_size
+
+    def _path(self, digest):
+        return os.path.join(self.cache_dir, digest[:2], digest + '.json')
+
+    def _read_disk(self, digest):
+        if self.cache_dir is None:
+            return None
+        path = self._path(digest)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError):
+            return None
+        return data['pages'], data['text']
+
+    def _write_disk(self, digest, entry):
+        if self.cache_dir is None:
+            return
+        path = self._path(digest)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'pages': entry[0], 'text': entry[1]}, f)
+            os.replace(tmp, path)
+            size = os.path.getsize(path)
+        except OSError:
+            return  # The disk tier is best effort
+
+        with self._lock:
+            if self._disk_used is None:
+                self._disk_used = sum(size for _, size, _ in self._disk_files())
+            else:
+                self._disk_used += size
+            if self._disk_used > self.disk_bytes:
+                self._evict_disk()
+
+    def _disk_files(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _evict_disk(self):
+        # Oldest first, until the tier is back under three quarters of its budget
+        files = sorted(self._disk_files(), key=lambda item: item[2])
+        used = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if used <= self.disk_bytes * 3 // 4:
+                break
+            try:
+                os.remove(path)
+                used -= size
+            except OSError:
+                pass
+        self._disk_used = used
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._memory_used = 0
+            if self.cache_dir is not None:
+                for path, _, _ in list(self._disk_files()):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._disk_used = 0
+
+
+_cache = TextCache()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _extract_page_range(data, start, stop):
+    # Worker step: each process opens its own copy of the document
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return [doc[number].get_text("text") for number in range(start, stop)]
+
+
+def _parallel_allowed():
+    # Pool workers (e.g. the batch matcher's) are daemonic and may not have children
+    return not multiprocessing.current_process().daemon
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+        return _executor
+
+
+def _extract_text(doc, data, parallel):
+    page_count = len(doc)
+    if not parallel or MAX_WORKERS < 2 or page_count < PARALLEL_MIN_PAGES or not _parallel_allowed():
+        return ''.join(page.get_text("text") for page in doc)  # Extract text (not images)
+
+    step = -(-page_count // MAX_WORKERS)
+    futures = [
+        _get_executor().submit(_extract_page_range, data, start, min(start + step, page_count))
+        for start in range(0, page_count, step)
+    ]
+    return ''.join(text for future in futures for text in future.result())
+
+
+def read_pdf_text(data, max_pages=MAX_PAGES, cache=_cache, parallel=True):
+    """
+    Extracts the text of every page of a PDF.
+
+    Args:
+        data (bytes): Raw PDF bytes.
+        max_pages (int): Maximum number of pages allowed, or None for no limit.
+        cache (TextCache): Cache to consult and fill, or None to always extract.
+        parallel (bool): Extract the pages of documents with `PARALLEL_MIN_PAGES`
+            or more pages in several processes.
+
+    Returns:
+        str: Extracted text (empty if the PDF has no text layer).
+
+    Raises:
+        PageLimitError: If the PDF has more than `max_pages` pages.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    entry = cache.get(digest) if cache is not None else None
+    if entry is not None:
+        page_count, text = entry
+        if max_pages is not None and page_count > max_pages:
+            raise PageLimitError(page_count, max_pages)
+        return text
+
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        page_count = len(doc)
+        if max_pages is not None and page_count > max_pages:
+            raise PageLimitError(page_count, max_pages)
+        text = _extract_text(doc, data, parallel)
+
+    if cache is not None:
+        cache.put(digest, page_count, text)
+    return text
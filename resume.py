@@ -11,65 +11,27 @@ from email.mime.multipart import MIMEMultipart  # To create multipart email cont
 from nltk.corpus import stopwords  # Predefined stop words list for filtering text
 from nltk.tokenize import word_tokenize  # Tokenizer for breaking text into words
 from nltk.stem import WordNetLemmatizer  # Lemmatizer for reducing words to their base forms
-import fitz  # PyMuPDF for handling PDF files
-from sklearn.feature_extraction.text import TfidfVectorizer  # Converts text to numerical feature vectors
-from sklearn.neighbors import NearestNeighbors  # For finding nearest neighbors, used in recommendation or classification systems
+from pdf_text import MAX_PAGES, PageLimitError, read_pdf_text  # PyMuPDF text extraction for PDF files
+import job_index  # Persisted TF-IDF index over the job skills
+from text_cleaning import clean_text, looks_like_resume  # Shared resume and job text cleaning
 
 
 
 
 
 
-# Load the Dataset
-df = pd.read_csv('cleaned_file.csv')
+# Load the persisted job index (rebuilt only when cleaned_file.csv changes)
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_job_index(digest):
+    return job_index.load_index('cleaned_file.csv', digest=digest)
 
-
-
-stop_words = set([
-    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 'your', 'yours', 
-    'yourself', 'yourselves', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 
-    'herself', 'it', 'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 
-    'what', 'which', 'who', 'whom', 'this', 'that', 'these', 'those', 'am', 'is', 'are', 
-    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having', 'do', 'does', 
-    'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because', 'as', 'until', 
-    'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against', 'between', 'into', 
-    'through', 'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 
-    'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once', 'here', 
-    'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 
-    'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 
-    'than', 'too', 'very', 's', 't', 'can', 'will', 'just', 'don', 'should', 'now', 'd', 
-    'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren', 'couldn', 'didn', 'doesn', 'hadn', 
-    'hasn', 'haven', 'isn', 'ma', 'mightn', 'mustn', 'needn', 'shan', 'shouldn', 'wasn', 
-    'weren', 'won', 'wouldn'
-])
-lemmatizer_dict = {
-    'running': 'run', 'ran': 'run', 'runs': 'run', 
-    'better': 'good', 'best': 'good', 'worse': 'bad', 'worst': 'bad',
-    'happier': 'happy', 'happiest': 'happy', 'sadder': 'sad', 'saddest': 'sad',
-    'more': 'much', 'most': 'much', 'less': 'little', 'least': 'little',
-    'doing': 'do', 'did': 'do', 'does': 'do', 'done': 'do'
-}
+index = load_job_index(job_index.source_digest('cleaned_file.csv'))
+df = index.jobs
 
 
 
-
-# Preprocessing and Cleaning Functions
-def clean_text(txt):
-    
-    clean_text = re.sub(r'http\S+\s|RT|cc|#\S+\s|@\S+|[^\x00-\x7f]', ' ', txt)
-    clean_text = re.sub(r'[%s]' % re.escape("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""), ' ', clean_text)
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip().lower()
-    
-    # Tokenization
-    tokens = re.findall(r'\b\w+\b', clean_text)  
-    tokens = [word for word in tokens if word not in stop_words]
-    
-    # Lemmatize using the manually defined lemmatizer_dict
-    tokens = [lemmatizer_dict.get(word, word) for word in tokens]
-    return ' '.join(tokens)
-
 # Extract text from PDF using PyMuPDF
-def extract_text_from_pdf(uploaded_file, max_pages=3):
+def extract_text_from_pdf(uploaded_file, max_pages=MAX_PAGES):
     """
     Extracts text from a PDF file. Only extracts text from the first `max_pages` pages.
     If the PDF has more than `max_pages` pages, an error is returned.
@@ -81,41 +43,25 @@ def extract_text_from_pdf(uploaded_file, max_pages=3):
     Returns:
         str: Extracted text or error message.
     """
-    text = ""
-    
     try:
-        # Open PDF file from the uploaded file stream
-        with fitz.open(stream=uploaded_file.read(), filetype="pdf") as doc:
-            
-            # Check if the PDF has more than the allowed number of pages
-            if len(doc) > max_pages:
-                st.error(f"The PDF has more than {max_pages} pages, which is not allowed.")
-                return ""
-            
-            # Extract text from each page
-            for page in doc:
-                page_text = page.get_text("text")  # Extract text (not images)
-                text += page_text
-        
+        # Extract from the uploaded bytes (cached by content hash)
+        text = read_pdf_text(uploaded_file.getvalue(), max_pages=max_pages)
+
         # If no text is found, return an appropriate message
         if not text:
             st.warning("No text found in the PDF.")
             return ""
-        
+
+    except PageLimitError as e:
+        st.error(str(e))
+        return ""
+
     except Exception as e:
         st.error(f"Failed to extract text from the PDF: {e}")
         return ""
     
     return text
 
-# Initialize TF-IDF Vectorizer and KNN Model
-vectorizer = TfidfVectorizer(max_features=5000)
-job_descriptions = df['Skills'].apply(clean_text).tolist()
-X = vectorizer.fit_transform(job_descriptions)
-
-knn = NearestNeighbors(n_neighbors=5, metric='cosine')
-knn.fit(X)
-
 st.markdown("""<style>
     body {
         background-color: grey;  /* Light, clean background */
@@ -425,21 +371,21 @@ elif page == "Resume Analyzer":
             cleaned_resume = clean_text(resume_text)
 
             # Check for compulsory resume words
-            compulsory_words = ["skill"]
-            if not any(word.lower() in cleaned_resume for word in compulsory_words):
+            if not looks_like_resume(cleaned_resume):
                 st.error(" Please upload a valid resume PDF.")
             else:
                 # Vectorize resume text
-                resume_vector = vectorizer.transform([cleaned_resume])
+                resume_vector = index.transform([cleaned_resume])
 
                 # Find the Top 5 Matching Jobs
-                distances, indices = knn.kneighbors(resume_vector)
+                distances, indices = index.kneighbors(resume_vector)
+                jobs = index.jobs  # Read after the query, so it has every job the query returned
 
                 # Ensure we're always getting the top 5 jobs, even if fewer are found
                 num_jobs = min(5, len(distances[0]))  # Use min to avoid index error
 
                 # Check if the number of indices is less than expected
-                top_5_jobs = df.iloc[indices[0][:num_jobs]]  # Slice to get only the available jobs
+                top_5_jobs = jobs.loc[indices[0][:num_jobs]]  # Slice to get only the available jobs
                 accuracy_scores = []
 
                 # Display the top jobs and calculate accuracy
@@ -450,7 +396,7 @@ elif page == "Resume Analyzer":
                     job_index = indices[0][i]  # Get the job index
                     score = 1 - distances[0][i]  # Calculate accuracy (1 - distance gives similarity score)
                     accuracy_scores.append(score)
-                    job_row = df.iloc[job_index]  # Get the job details using the index
+                    job_row = jobs.loc[job_index]  # Get the job details using the index
 
                     # Box styling with neutral background
                     st.markdown(f"""
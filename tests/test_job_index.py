@@ -0,0 +1,48 @@
+# Tests for the persisted TF-IDF job index
+import json  # Reading the artifact manifest
+import os  # Artifact paths
+import subprocess  # Running the build step as a script
+import sys  # Interpreter path
+
+import pandas as pd  # Writing a small job CSV
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build(csv_path, index_dir, *options):
+    # Runs `python job_index.py` and returns the artifact path it prints
+    output = subprocess.run(
+        [sys.executable, os.path.join(ROOT, 'job_index.py'), csv_path, '--index-dir', index_dir, *options],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    ).stdout
+    return output.strip().splitlines()[-1]
+
+
+def test_force_replaces_existing_artifact(tmp_path):
+    csv_path = str(tmp_path / 'jobs.csv')
+    pd.DataFrame({
+        'Job Title': ['Data Scientist', 'Web Developer', 'Accountant'],
+        'Skills': ['python machine learning statistics', 'javascript html css', 'excel accounting tax'],
+    }).to_csv(csv_path, index=False)
+    index_dir = str(tmp_path / 'index')
+
+    path = build(csv_path, index_dir)
+    meta_mtime = os.stat(os.path.join(path, 'meta.json')).st_mtime_ns
+
+    # Without --force the up-to-date artifact is kept as it is
+    assert build(csv_path, index_dir) == path
+    assert os.stat(os.path.join(path, 'meta.json')).st_mtime_ns == meta_mtime
+
+    # Damage the artifact, as a crash or a cleaning change without a version bump would
+    with open(os.path.join(path, 'vocabulary.json'), 'w', encoding='utf-8') as f:
+        json.dump(['damaged'], f)
+
+    assert build(csv_path, index_dir, '--force') == path
+    with open(os.path.join(path, 'vocabulary.json'), encoding='utf-8') as f:
+        assert 'python' in json.load(f)
+    assert os.stat(os.path.join(path, 'meta.json')).st_mtime_ns != meta_mtime
+    # Neither the scratch build nor the old artifact is left behind
+    assert os.listdir(index_dir) == [os.path.basename(path)]
@@ -0,0 +1,132 @@
+# Text cleaning shared by the Streamlit app, the job index and the batch matcher
+import re  # Regular expressions for text processing
+import string  # ASCII letters and digits for the translation table
+
+
+stop_words = set([
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 'your', 'yours', 
+    'yourself', 'yourselves', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 
+    'herself', 'it', 'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 
+    'what', 'which', 'who', 'whom', 'this', 'that', 'these', 'those', 'am', 'is', 'are', 
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having', 'do', 'does', 
+    'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because', 'as', 'until', 
+    'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against', 'between', 'into', 
+    'through', 'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 
+    'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once', 'here', 
+    'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 
+    'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 
+    'than', 'too', 'very', 's', 't', 'can', 'will', 'just', 'don', 'should', 'now', 'd', 
+    'll', 'm', 'o', 're', 've', 'y', 'ain', 'aren', 'couldn', 'didn', 'doesn', 'hadn', 
+    'hasn', 'haven', 'isn', 'ma', 'mightn', 'mustn', 'needn', 'shan', 'shouldn', 'wasn', 
+    'weren', 'won', 'wouldn'
+])
+lemmatizer_dict = {
+    'running': 'run', 'ran': 'run', 'runs': 'run', 
+    'better': 'good', 'best': 'good', 'worse': 'bad', 'worst': 'bad',
+    'happier': 'happy', 'happiest': 'happy', 'sadder': 'sad', 'saddest': 'sad',
+    'more': 'much', 'most': 'much', 'less': 'little', 'least': 'little',
+    'doing': 'do', 'did': 'do', 'does': 'do', 'done': 'do'
+}
+
+
+# Preprocessing and Cleaning Functions
+class TextNormalizer:
+    """
+    Single-pass version of the resume/job text cleaning.
+
+    The original cleaning ran three `re.sub` passes, a `re.findall` and two list
+    comprehensions per text. Here one compiled pattern does the URL, hashtag,
+    mention, 'RT'/'cc' and non-ASCII removal, a translation table turns every
+    remaining character into a lowercase letter, a digit or a space, and one
+    token table maps every word to its lemma, or to '' for stop words. The
+    output is identical to the old `clean_text`.
+
+    `normalize_many` joins a whole chunk of texts with a record separator and
+    runs each of those steps once per chunk, so there is no per-row Python work.
+
+    Args:
+        stop_words (set): Words dropped from the output.
+        lemmas (dict): Word -> lemma replacements, applied after stop word removal.
+        chunk_size (int): Rows joined per pass in `normalize_many`.
+    """
+
+    REMOVE = r'http\S+{ws}|RT|cc|#\S+{ws}|@\S+|[^\x00-\x7f]'
+    SEPARATOR = '\x1e'  # Whitespace to the removal pattern, never inside a row
+    ROW_MARK = '|'  # Punctuation, so the translation table never produces it
+
+    def __init__(self, stop_words, lemmas, chunk_size=10000):
+        self.chunk_size = chunk_size
+        self._remove = re.compile(self.REMOVE.format(ws=r'\s'))
+        # In joined chunks \s must not run into the next row
+        self._batch_remove = re.compile(self.REMOVE.format(ws=r'[^\S' + self.SEPARATOR + ']'))
+
+        # Text is pure ASCII once the removal pattern has run
+        translation = {code: ' ' for code in range(128)}
+        for char in string.ascii_letters + string.digits:
+            translation[ord(char)] = char.lower()
+        self._translation = str.maketrans(translation)
+        translation[ord(self.SEPARATOR)] = ' ' + self.ROW_MARK + ' '
+        self._batch_translation = str.maketrans(translation)
+
+        self._table = dict(lemmas)
+        self._table.update(dict.fromkeys(stop_words, ''))
+
+    def _words(self, removed, translation):
+        words = removed.translate(translation).split()
+        return ' '.join(filter(None, map(self._table.get, words, words)))
+
+    def normalize(self, txt):
+        """Cleans one text, exactly like the old `clean_text`."""
+        return self._words(self._remove.sub(' ', txt), self._translation)
+
+    def normalize_many(self, texts):
+        """
+        Cleans many texts.
+
+        Args:
+            texts: A pandas Series of strings, a list, or any iterable (including
+                generators) of strings.
+
+        Returns:
+            A Series with the same index for a Series input, otherwise a list.
+        """
+        if hasattr(texts, 'tolist') and hasattr(texts, 'index'):
+            import pandas as pd  # Only needed for Series input
+            return pd.Series(self.normalize_many(texts.tolist()), index=texts.index, name=texts.name)
+
+        cleaned = []
+        chunk = []
+        for txt in texts:
+            chunk.append(txt)
+            if len(chunk) == self.chunk_size:
+                cleaned.extend(self._normalize_chunk(chunk))
+                chunk = []
+        if chunk:
+            cleaned.extend(self._normalize_chunk(chunk))
+        return cleaned
+
+    def _normalize_chunk(self, chunk):
+        joined = self.SEPARATOR.join(chunk)
+        if joined.count(self.SEPARATOR) != len(chunk) - 1:
+            # A row contains the separator itself
+            return [self.normalize(txt) for txt in chunk]
+        words = self._words(self._batch_remove.sub(' ', joined), self._batch_translation)
+        return list(map(str.strip, words.split(self.ROW_MARK)))
+
+
+normalizer = TextNormalizer(stop_words, lemmatizer_dict)
+
+
+def clean_text(txt):
+    return normalizer.normalize(txt)
+
+
+def clean_texts(texts):
+    return normalizer.normalize_many(texts)
+
+
+# Words a cleaned resume must contain to be matched against jobs
+compulsory_words = ["skill"]
+
+def looks_like_resume(cleaned_text):
+    return any(word.lower() in cleaned_text for word in compulsory_words)